@@ -1,51 +1,63 @@
 import streamlit as st
 import pandas as pd
+from application_status import Status, REQUIRE_ACCESS_CODE, lookup_applications, normalize_email
 
-# Load CSV once at the top
-@st.cache_data
-def load_data():
-    df = pd.read_csv("parsed_data/results.csv")
-    df['name'] = df['name'].str.strip()  # Clean whitespace
-    return df
+# Applicants look up their own applications by email (and access code)
+# through the status index, so the page never loads anyone else's data.
 
 # Define function to display applications
 def application_status():
-    df = load_data()
-
     st.title("Application Status")
 
-    # Get unique names for selection
-    names = df['name'].dropna().unique()
-    if len(names) == 0:
-        st.warning("No applicant names found.")
+    with st.form("status_lookup"):
+        email = st.text_input("Email address used to apply")
+        access_code = st.text_input(
+            "Access code",
+            type="password",
+            help="Shown when you submitted your first application." + (
+                "" if REQUIRE_ACCESS_CODE else " Applications made before access codes existed can be checked without one."
+            )
+        )
+        submitted = st.form_submit_button("🔍 Check Status")
+
+    if submitted:
+        st.session_state.status_query = (email, access_code)
+    if "status_query" not in st.session_state:
         return
 
-    selected_name = st.selectbox("Select your name", sorted(names))
+    email, access_code = st.session_state.status_query
+    if not normalize_email(email):
+        st.warning("Please enter your email address.")
+        return
+    try:
+        applications = lookup_applications(email, access_code or None)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return
 
-    # Filter rows for selected applicant
-    applicant_rows = df[df['name'] == selected_name]
+    if not applications:
+        st.warning("No applications found for this email address.")
+        return
 
-    if not applicant_rows.empty:
-        for idx, row in applicant_rows.iterrows():
-            data = {
-                "Name": row["name"],
-                "Status": row["status"],
-                "Job Title Applied": row["job_title"],
-                "Company Applied To": row["company"]
-            }
+    for row in applications:
+        data = {
+            "Name": row["name"],
+            "Status": row["status"],
+            "Job Title Applied": row["job_title"],
+            "Company Applied To": row["company"],
+            "Applied On": row["application_date"],
+        }
 
-            # Include interview info if applicable
-            if str(row["status"]).strip().lower() == "interview invited":
-                data["Interview Date"] = row.get("interview_date") or "Not Scheduled"
-                data["Interview Time"] = row.get("interview_time") or "Not Scheduled"
+        # Include interview info if applicable
+        if row["status"] == Status.INTERVIEW_INVITED.value:
+            data["Interview Date"] = row.get("interview_date") or "Not Scheduled"
+            data["Interview Time"] = row.get("interview_time") or "Not Scheduled"
 
-            display_df = pd.DataFrame(data.items(), columns=["Field", "Value"])
+        display_df = pd.DataFrame(data.items(), columns=["Field", "Value"])
 
-            # Use expander for clean layout
-            with st.expander(f"{row['job_title']} at {row['company']}"):
-                st.table(display_df)
-    else:
-        st.warning("No applications found for this applicant.")
+        # Use expander for clean layout
+        with st.expander(f"{row['job_title']} at {row['company']}"):
+            st.table(display_df)
 
-# Run the function
-application_status()
+if __name__ == "__main__":
+    application_status()
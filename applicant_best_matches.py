@@ -0,0 +1,47 @@
+import streamlit as st
+import recommender
+import resume_queue
+from apply_flow import apply_form, parsed_upload
+
+MATCH_COUNT = 10
+
+def best_matches():
+    st.title("🎯 Best Matches for You")
+    resume_queue.start_workers()
+
+    resume_file = st.file_uploader("Upload your resume (PDF) to rank open jobs by your skills",
+                                   type=["pdf"], key="best_matches_resume")
+    if not resume_file:
+        st.info("Your resume is parsed once; the ranking is refreshed whenever jobs are posted or removed.")
+        return
+
+    upload = parsed_upload(resume_file)
+    if upload is None:
+        return
+
+    skills = upload["parsed"]["skills"]
+    if not skills:
+        st.warning("No skills were detected in your resume, so jobs cannot be ranked.")
+        return
+
+    st.caption(f"Skills used for matching: {', '.join(skills)}")
+    matches = recommender.recommend_jobs(skills, MATCH_COUNT, resume_hash=upload["resume_hash"])
+    if not matches:
+        st.info("No open jobs match your skills right now.")
+        return
+
+    for job in matches:
+        st.markdown("----")
+        st.subheader(f"{job['title']} ({job['job_type']}) · {job['score']}% match")
+        st.markdown(f"**Company**: {job.get('company', 'N/A')}")
+        st.markdown(f"📍 **Location:** {job['location']} · 💰 **Salary:** {job['salary']} · 🗓️ **Deadline:** {job['deadline']}")
+        st.markdown(f"✅ **You have:** {', '.join(job['matched_skills'])}")
+        if job["missing_skills"]:
+            st.markdown(f"➕ **Also asked for:** {', '.join(job['missing_skills'])}")
+
+        with st.expander("📤 Apply to this Job"):
+            apply_form(job, key=f"match_{job['job_id']}")
+
+
+if __name__ == "__main__":
+    best_matches()
@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import application_store
+import save_results
+
+# --- Constants ---
+EXPORT_DB = "parsed_data/exports.db"
+EXPORT_DIR = "parsed_data/exports"
+EXPORT_PORT = os.environ.get("EXPORT_PORT")                 # serve chunked downloads on this port when set
+EXPORT_HOST = os.environ.get("EXPORT_HOST", "127.0.0.1")
+EXPORT_URL = os.environ.get("EXPORT_URL")                   # public base URL of the server, if not localhost
+EXPORT_TTL = 3600                                           # seconds an export link stays valid
+BATCH_ROWS = 5000                                           # rows converted at a time
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+FORMATS = {
+    # format -> (label, file extension, content type)
+    "csv": ("CSV", "csv", "text/csv; charset=utf-8"),
+    "jsonl": ("JSON lines", "jsonl", "application/x-ndjson"),
+    "parquet": ("Parquet", "parquet", "application/vnd.apache.parquet"),
+}
+
+# An export is a filter over one company's shared application table
+# (application_store.application_table). Rows are filtered and converted
+# BATCH_ROWS at a time and encoded by the save_results generators, so only
+# one batch and one output chunk exist at any moment however many rows
+# match. The recruiter page stores the export's filters under a random
+# token in sqlite; when EXPORT_PORT is set, a small HTTP server streams
+# /exports/<token> with chunked transfer encoding. Tokens live in sqlite so
+# whichever Streamlit process owns the port can serve a link created by
+# any other.
+
+_server = None
+_server_lock = threading.Lock()
+
+# --- Queries ---
+
+def _mask(df, filters):
+    mask = pd.Series(True, index=df.index)
+    if filters.get("statuses"):
+        mask &= df["status"].isin(filters["statuses"])
+    if filters.get("job_id"):
+        mask &= df["job_id"] == filters["job_id"]
+    if filters.get("since"):
+        mask &= df["application_date"] >= pd.Timestamp(filters["since"])
+    if filters.get("until"):
+        mask &= df["application_date"] < pd.Timestamp(filters["until"]) + pd.Timedelta(days=1)
+    if filters.get("search"):
+        search = filters["search"]
+        mask &= (df["name"].str.contains(search, case=False, regex=False) |
+                 df["email"].str.contains(search, case=False, regex=False)).fillna(False).astype(bool)
+    return mask
+
+def _records(df):
+    # Plain Python rows: missing values become None, dates strings.
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.strftime(DATETIME_FORMAT)
+        columns[column] = values.astype(object).where(values.notna(), None).tolist()
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+def count_matches(company, filters):
+    return int(_mask(application_store.application_table(company), filters).sum())
+
+def iter_batches(company, filters, batch_rows=BATCH_ROWS):
+    # Lists of matching rows, at most batch_rows at a time.
+    df = application_store.application_table(company)
+    for start in range(0, len(df), batch_rows):
+        part = df.iloc[start:start + batch_rows]
+        part = part[_mask(part, filters)]
+        if len(part):
+            yield _records(part)
+
+def _parquet_schema(df):
+    import pyarrow as pa
+    fields = []
+    for column in df.columns:
+        dtype = df[column].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            fields.append((column, pa.bool_()))
+        elif pd.api.types.is_float_dtype(dtype):
+            fields.append((column, pa.float32()))
+        else:
+            fields.append((column, pa.string()))   # categories, text and formatted dates
+    return pa.schema(fields)
+
+def export_chunks(company, fmt, filters):
+    # Encoded export as a generator of byte chunks.
+    df = application_store.application_table(company)
+    batches = iter_batches(company, filters)
+    if fmt == "parquet":
+        return save_results.iter_parquet(batches, schema=_parquet_schema(df))
+    rows = (row for batch in batches for row in batch)
+    if fmt == "jsonl":
+        return save_results.iter_jsonl(rows)
+    return save_results.iter_csv(rows, fieldnames=list(df.columns))
+
+def export_filename(company, fmt):
+    return f"{application_store.company_slug(company)}_applications_{time.strftime('%Y%m%d_%H%M%S')}.{FORMATS[fmt][1]}"
+
+# --- Export Links ---
+
+def _connect():
+    os.makedirs(os.path.dirname(EXPORT_DB), exist_ok=True)
+    conn = sqlite3.connect(EXPORT_DB, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS exports (
+            token TEXT PRIMARY KEY,
+            company TEXT NOT NULL,
+            format TEXT NOT NULL,
+            filters TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+    return conn
+
+def create_export(company, fmt, filters):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    token = uuid.uuid4().hex
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM exports WHERE created_at < ?", (time.time() - EXPORT_TTL,))
+        conn.execute(
+            "INSERT INTO exports (token, company, format, filters, created_at) VALUES (?, ?, ?, ?, ?)",
+            (token, company, fmt, json.dumps(filters, default=str), time.time())
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    _prune_files()
+    return token
+
+def _prune_files():
+    # Drops saved exports whose link has expired.
+    if not os.path.isdir(EXPORT_DIR):
+        return
+    cutoff = time.time() - EXPORT_TTL
+    for name in os.listdir(EXPORT_DIR):
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+def get_export(token):
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT * FROM exports WHERE token = ? AND created_at >= ?", (token, time.time() - EXPORT_TTL)
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    return dict(row, filters=json.loads(row["filters"]))
+
+def save_export(token):
+    # Writes an export to EXPORT_DIR and returns the path, or None once the
+    # link has expired; used when no export server is running.
+    export = get_export(token)
+    if export is None:
+        return None
+    path = os.path.join(EXPORT_DIR, f"{token}.{FORMATS[export['format']][1]}")
+    if not os.path.exists(path):
+        save_results.write_chunks(export_chunks(export["company"], export["format"], export["filters"]), path)
+    return path
+
+# --- Server ---
+
+class _ExportHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # needed for chunked transfer encoding
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        export = get_export(parts[1]) if len(parts) == 2 and parts[0] == "exports" else None
+        if export is None:
+            self.send_error(404)
+            return
+        _, _, content_type = FORMATS[export["format"]]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Disposition",
+                         f'attachment; filename="{export_filename(export["company"], export["format"])}"')
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for chunk in export_chunks(export["company"], export["format"], export["filters"]):
+                if chunk:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass    # download cancelled
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+def start_server(port=None, host=EXPORT_HOST):
+    # Idempotent; returns None when no port is configured or another
+    # Streamlit process on this host already owns it.
+    global _server
+    port = EXPORT_PORT if port is None else port
+    if port in (None, ""):
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, int(port)), _ExportHandler)
+            except OSError:
+                _server = False
+            else:
+                threading.Thread(target=_server.serve_forever, name="export-http", daemon=True).start()
+    return _server or None
+
+def export_url(token):
+    base = EXPORT_URL or f"http://localhost:{EXPORT_PORT}"
+    return f"{base.rstrip('/')}/exports/{token}"
@@ -0,0 +1,476 @@
+import os
+import hashlib
+import secrets
+import sqlite3
+import threading
+from enum import Enum
+from datetime import datetime
+from metrics import timed
+
+# --- Constants ---
+STATUS_DB = "parsed_data/status.db"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+REQUIRE_ACCESS_CODE = os.environ.get("STATUS_REQUIRE_ACCESS_CODE", "0") == "1"
+VIEW_COLUMNS = [
+    "name", "email", "phone", "job_id", "job_title",
+    "interview_date", "interview_time", "application_date",
+]
+
+class Status(str, Enum):
+    APPLIED = "Applied"
+    INTERVIEW_INVITED = "Interview Invited"
+    OFFER_SENT = "Offer Sent"
+    REJECTED = "Rejected"
+
+# Allowed moves; re-inviting an invited applicant reschedules the interview.
+TRANSITIONS = {
+    Status.APPLIED: {Status.INTERVIEW_INVITED, Status.REJECTED},
+    Status.INTERVIEW_INVITED: {Status.INTERVIEW_INVITED, Status.OFFER_SENT, Status.REJECTED},
+    Status.OFFER_SENT: set(),
+    Status.REJECTED: set(),
+}
+
+# Spellings found in older data.
+_ALIASES = {
+    "": Status.APPLIED,
+    "nan": Status.APPLIED,
+    "pending": Status.APPLIED,
+    "invited": Status.INTERVIEW_INVITED,
+    "interview": Status.INTERVIEW_INVITED,
+    "offered": Status.OFFER_SENT,
+    "offer": Status.OFFER_SENT,
+}
+
+# Every status change is one transaction that appends a row to the events
+# log (who, when, from, to) and upserts the application's row in the
+# current table, indexed on (company, status). That table is the
+# materialised per-company / per-status view: the status pages read only
+# the rows they show, and an application's audit history is an indexed
+# lookup on the log. The CSV partitions keep a copy of the status column
+# for the pages that show whole partitions.
+#
+# The same transaction also bumps the analytics counters: one row per
+# (company, job_id, status, day) holding how many applications reached that
+# status that day and the hours they took to get there from applying. The
+# funnel and its charts are built from these rows only, so their cost
+# depends on the date range shown, not on how many applications exist.
+
+_lock = threading.Lock()
+_ready = False
+
+# --- Status Values ---
+
+def normalize_status(value, default=None):
+    # Status for any spelling ("applied", " Offer sent", NaN); raises
+    # ValueError for unknown values unless a default is given.
+    if isinstance(value, Status):
+        return value
+    key = " ".join(str(value if value is not None else "").split()).lower()
+    for status in Status:
+        if status.value.lower() == key:
+            return status
+    if key in _ALIASES:
+        return _ALIASES[key]
+    if default is not None:
+        return default
+    raise ValueError(f"Unknown application status: {value!r}")
+
+def normalize_email(email):
+    if not isinstance(email, str):
+        return ""
+    return email.strip().lower()
+
+def check_transition(from_status, to_status):
+    from_status, to_status = normalize_status(from_status), normalize_status(to_status)
+    if to_status not in TRANSITIONS[from_status]:
+        raise ValueError(f"An application that is '{from_status.value}' cannot be moved to '{to_status.value}'.")
+    return to_status
+
+# --- Storage ---
+
+def _connect():
+    os.makedirs(os.path.dirname(STATUS_DB), exist_ok=True)
+    conn = sqlite3.connect(STATUS_DB, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            application_id TEXT NOT NULL,
+            company TEXT NOT NULL,
+            job_id TEXT,
+            from_status TEXT,
+            to_status TEXT NOT NULL,
+            actor TEXT NOT NULL,
+            at TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_application ON events (application_id, event_id)")
+    if "job_id" not in {r["name"] for r in conn.execute("PRAGMA table_info(events)")}:
+        conn.execute("ALTER TABLE events ADD COLUMN job_id TEXT")
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS current (
+            application_id TEXT PRIMARY KEY,
+            company TEXT NOT NULL,
+            status TEXT NOT NULL,
+            {", ".join(f"{c} TEXT" for c in VIEW_COLUMNS)},
+            updated_at TEXT NOT NULL,
+            email_key TEXT,
+            archived INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(current)")}
+    if "email_key" not in columns:
+        conn.execute("ALTER TABLE current ADD COLUMN email_key TEXT")
+        conn.execute("UPDATE current SET email_key = lower(trim(email))")
+    if "archived" not in columns:
+        conn.execute("ALTER TABLE current ADD COLUMN archived INTEGER NOT NULL DEFAULT 0")
+    conn.execute("DROP INDEX IF EXISTS idx_current_status")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_current_active ON current (company, status, archived, updated_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_current_email ON current (email_key)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS access_codes (
+            email_key TEXT PRIMARY KEY,
+            code_hash TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS counters (
+            company TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            day TEXT NOT NULL,
+            job_title TEXT,
+            n INTEGER NOT NULL DEFAULT 0,
+            timed INTEGER NOT NULL DEFAULT 0,
+            hours REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (company, day, job_id, status)
+        )
+    """)
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    return conn
+
+def _now():
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+def _text(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None   # NaN from pandas
+    return str(value)
+
+def _append_event(conn, application_id, company, job_id, from_status, to_status, actor, at):
+    conn.execute(
+        "INSERT INTO events (application_id, company, job_id, from_status, to_status, actor, at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (application_id, company, job_id, from_status.value if from_status else None, to_status.value, actor, at)
+    )
+
+def _stages(from_status, to_status):
+    # Funnel stages an event counts towards. An application first seen in a
+    # later status (backfilled data) also counts for the stages before it.
+    if from_status == to_status:
+        return []   # a rescheduled interview is not a new stage
+    if from_status is not None:
+        return [to_status]
+    stages = [Status.APPLIED]
+    if to_status == Status.OFFER_SENT:
+        stages.append(Status.INTERVIEW_INVITED)
+    if to_status != Status.APPLIED:
+        stages.append(to_status)
+    return stages
+
+def _hours_between(start, end):
+    try:
+        return (datetime.strptime(end, TIMESTAMP_FORMAT) - datetime.strptime(start, TIMESTAMP_FORMAT)).total_seconds() / 3600
+    except (TypeError, ValueError):
+        return None
+
+_COUNT_SQL = """
+    INSERT INTO counters (company, job_id, status, day, job_title, n, timed, hours) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (company, day, job_id, status) DO UPDATE SET
+        n = n + excluded.n, timed = timed + excluded.timed, hours = hours + excluded.hours,
+        job_title = COALESCE(excluded.job_title, job_title)
+"""
+
+def _count(conn, company, job_id, job_title, from_status, to_status, at, applied_at=None):
+    hours = _hours_between(applied_at, at) if from_status is not None else None
+    conn.executemany(_COUNT_SQL, [
+        (company, job_id or "", stage.value, at[:10], job_title, 1, int(hours is not None), hours or 0.0)
+        for stage in _stages(from_status, to_status)
+    ])
+
+def _insert_current(conn, record, status, at):
+    columns = ["application_id", "company", "status"] + VIEW_COLUMNS + ["updated_at", "email_key"]
+    values = [record["application_id"], record.get("company", "N/A"), status.value]
+    values += [_text(record.get(c)) for c in VIEW_COLUMNS] + [at, normalize_email(record.get("email"))]
+    cursor = conn.execute(
+        f"INSERT OR IGNORE INTO current ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+        values
+    )
+    return cursor.rowcount
+
+def _backfill(conn):
+    # One-off load of the existing partitions; status spellings are
+    # normalised in the CSVs as well.
+    import pandas as pd
+    import application_store
+    columns = ["application_id", "company", "status"] + VIEW_COLUMNS + ["updated_at", "email_key"]
+    for company in application_store.list_companies():
+        path = os.path.join(application_store.PARTITION_DIR, company, application_store.PARTITION_FILE)
+        df = pd.read_csv(path, dtype=str)
+        if df.empty or "application_id" not in df.columns:
+            continue
+        raw = df["status"] if "status" in df.columns else pd.Series([None] * len(df), index=df.index)
+        spellings = {s: normalize_status(s, Status.APPLIED).value for s in raw.unique()}
+        df["status"] = raw.map(spellings)
+        view = df.reindex(columns=columns[:-2]).astype(object).where(lambda v: v.notna(), None)
+        view["company"] = view["company"].fillna("N/A")
+        view["updated_at"] = view["application_date"].fillna(_now())
+        view["email_key"] = view["email"].map(normalize_email)
+        rows = list(view.itertuples(index=False, name=None))
+        conn.executemany(
+            f"INSERT OR IGNORE INTO current ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows
+        )
+        job_id = columns.index("job_id")
+        conn.executemany(
+            "INSERT INTO events (application_id, company, job_id, from_status, to_status, actor, at) "
+            "VALUES (?, ?, ?, NULL, ?, 'backfill', ?)",
+            [(r[0], r[1], r[job_id], r[2], r[-2]) for r in rows]
+        )
+        if not raw.equals(df["status"]):
+            tmp_path = path + ".tmp"
+            df.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, path)
+
+def _rebuild_counters(conn):
+    # Replays the event log into the analytics counters.
+    titles = dict(conn.execute("SELECT job_id, job_title FROM current WHERE job_title IS NOT NULL GROUP BY job_id"))
+    applied_at, totals = {}, {}
+    for event in conn.execute("SELECT application_id, company, job_id, from_status, to_status, at FROM events ORDER BY event_id"):
+        application_id, company, job_id, from_status, to_status, at = event
+        applied_at.setdefault(application_id, at)
+        from_status = Status(from_status) if from_status else None
+        hours = _hours_between(applied_at[application_id], at) if from_status is not None else None
+        for stage in _stages(from_status, Status(to_status)):
+            total = totals.setdefault((company, job_id or "", stage.value, at[:10]), [0, 0, 0.0])
+            total[0] += 1
+            if hours is not None:
+                total[1] += 1
+                total[2] += hours
+    conn.execute("DELETE FROM counters")
+    conn.executemany(
+        "INSERT INTO counters (company, job_id, status, day, job_title, n, timed, hours) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(*key, titles.get(key[1]), *total) for key, total in totals.items()]
+    )
+
+def _ensure_ready():
+    global _ready
+    if _ready:
+        return
+    with _lock:
+        if _ready:
+            return
+        conn = _connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                done = {row["key"] for row in conn.execute("SELECT key FROM meta")}
+                if "backfilled" not in done:
+                    _backfill(conn)
+                    conn.execute("INSERT INTO meta (key, value) VALUES ('backfilled', ?)", (_now(),))
+                if "counters" not in done:
+                    _rebuild_counters(conn)
+                    conn.execute("INSERT INTO meta (key, value) VALUES ('counters', ?)", (_now(),))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        _ready = True
+
+# --- Writes ---
+
+def record_application(record, actor="applicant"):
+    # Called for every new application: enters it into the views as Applied.
+    _ensure_ready()
+    status = normalize_status(record.get("status"), Status.APPLIED)
+    at = _text(record.get("application_date")) or _now()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        if _insert_current(conn, record, status, at):
+            company, job_id = record.get("company", "N/A"), _text(record.get("job_id"))
+            _append_event(conn, record["application_id"], company, job_id, None, status, actor, at)
+            _count(conn, company, job_id, _text(record.get("job_title")), None, status, at)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+@timed("status.transition")
+def transition(application_id, to_status, actor, **fields):
+    # Moves one application to to_status, raising ValueError when the move is
+    # not allowed. fields updates view columns (e.g. interview_date) alongside.
+    _ensure_ready()
+    to_status = normalize_status(to_status)
+    fields = {c: _text(v) for c, v in fields.items() if c in VIEW_COLUMNS}
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT company, status, job_id, job_title, application_date FROM current "
+                "WHERE application_id = ? AND archived = 0",
+                (application_id,)
+            ).fetchone()
+            if row is None:
+                raise ValueError("This application is no longer active.")
+            from_status = normalize_status(row["status"])
+            check_transition(from_status, to_status)
+            at = _now()
+            assignments = ", ".join(f"{c} = ?" for c in ["status", *fields, "updated_at"])
+            conn.execute(
+                f"UPDATE current SET {assignments} WHERE application_id = ?",
+                [to_status.value, *fields.values(), at, application_id]
+            )
+            _append_event(conn, application_id, row["company"], row["job_id"], from_status, to_status, actor, at)
+            _count(conn, row["company"], row["job_id"], row["job_title"], from_status, to_status, at, row["application_date"])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+    return {"application_id": application_id, "from_status": from_status.value,
+            "to_status": to_status.value, "actor": actor, "at": at}
+
+def archive(application_ids):
+    # Takes archived applications out of the status pages; applicants can
+    # still look them up and their history is kept.
+    application_ids = list(application_ids)
+    if not application_ids:
+        return
+    _ensure_ready()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("UPDATE current SET archived = 1 WHERE application_id = ?", [(a,) for a in application_ids])
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+# --- Queries ---
+
+@timed("status.list_by_status")
+def list_by_status(company, status):
+    _ensure_ready()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            "SELECT * FROM current WHERE company = ? AND status = ? AND archived = 0 ORDER BY updated_at",
+            (company, normalize_status(status).value)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+def current_status(application_id):
+    _ensure_ready()
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT status FROM current WHERE application_id = ?", (application_id,)).fetchone()
+    finally:
+        conn.close()
+    return None if row is None else Status(row["status"])
+
+def history(application_id):
+    _ensure_ready()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            "SELECT from_status, to_status, actor, at FROM events WHERE application_id = ? ORDER BY event_id",
+            (application_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+# --- Applicant Lookup ---
+
+def _code_hash(email_key, code):
+    return hashlib.sha256(f"{email_key}:{code.strip().upper()}".encode("utf-8")).hexdigest()
+
+def issue_access_code(email):
+    # Creates the access code for an email on its first application and
+    # returns it; returns None when the email already has one. Only a hash
+    # is stored.
+    email_key = normalize_email(email)
+    if not email_key:
+        return None
+    code = secrets.token_hex(4).upper()
+    conn = _connect()
+    try:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO access_codes (email_key, code_hash, created_at) VALUES (?, ?, ?)",
+            (email_key, _code_hash(email_key, code), _now())
+        )
+    finally:
+        conn.close()
+    return code if cursor.rowcount else None
+
+@timed("status.lookup_applications")
+def lookup_applications(email, access_code=None):
+    # An applicant's own applications, newest first, found through the email
+    # index. Raises ValueError when the access code is wrong or missing. Only
+    # emails that applied before access codes existed have none; they can be
+    # looked up by email alone unless STATUS_REQUIRE_ACCESS_CODE=1.
+    _ensure_ready()
+    email_key = normalize_email(email)
+    if not email_key:
+        return []
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT code_hash FROM access_codes WHERE email_key = ?", (email_key,)).fetchone()
+        if row is not None or access_code or REQUIRE_ACCESS_CODE:
+            if row is None or not access_code or not secrets.compare_digest(row["code_hash"], _code_hash(email_key, access_code)):
+                raise ValueError("The email address or access code is incorrect.")
+        rows = conn.execute(
+            "SELECT * FROM current WHERE email_key = ? ORDER BY application_date DESC", (email_key,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+# --- Analytics ---
+
+def rebuild_counters():
+    # One-shot rebuild of the analytics counters from the event log, which
+    # itself starts from a backfill of the partition CSVs.
+    _ensure_ready()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            _rebuild_counters(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+@timed("status.load_counters")
+def load_counters(company, start_day, end_day):
+    # Counter rows of a company for days in [start_day, end_day].
+    _ensure_ready()
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            "SELECT job_id, job_title, status, day, n, timed, hours FROM counters "
+            "WHERE company = ? AND day BETWEEN ? AND ?",
+            (company, start_day, end_day)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
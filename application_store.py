@@ -0,0 +1,240 @@
+import os
+import re
+import csv
+import json
+import uuid
+import shutil
+import threading
+import pandas as pd
+import application_status
+import data_service
+from metrics import timed
+
+# --- Constants ---
+RESULTS_CSV = "parsed_data/results.csv"        # legacy single table, split into partitions on first use
+RESULTS_JSON = "parsed_data/results.json"
+PARTITION_DIR = "parsed_data/companies"
+PARTITION_FILE = "results.csv"
+RESULT_COLUMNS = [
+    "name", "email", "phone", "skills", "education_level", "experience", "filename",
+    "status", "interview_date", "interview_time", "saved", "company", "job_id",
+    "job_title", "application_date", "fraud_score", "suspicion_flag", "resume_hash",
+    "application_id"
+]
+CATEGORY_COLUMNS = ["company", "job_id", "job_title", "status", "education_level"]
+BOOL_COLUMNS = ["saved", "suspicion_flag"]
+DATETIME_COLUMNS = ["application_date"]
+FLOAT_COLUMNS = ["fraud_score"]
+TEXT_DTYPE = "string[pyarrow]"
+
+# Applications are partitioned by company: every recruiter page reads and
+# rewrites only its own company's file, so load cost does not depend on how
+# many applications other tenants have.
+#
+# Pages that only read use application_table(): one compact, typed copy of
+# each partition per process, shared by every session and reloaded only when
+# the file is replaced or grows. Repeated values (company, job, status) are
+# categoricals, flags are bools, dates datetime64 and free text Arrow
+# strings. The shared frame must not be modified in place; writes go through
+# save_applications / update_applications, which replace the file.
+#
+# With several Streamlit processes, appends and updates are data service
+# methods (see data_service.py), so they are applied one at a time by the
+# service, and every process drops its copy of a partition when told it
+# changed.
+
+_tables = {}   # company -> (file identity, DataFrame)
+_tables_lock = threading.Lock()
+_partition_locks = {}   # company slug -> RLock held while a partition is read for rewriting or written
+
+# --- Partitions ---
+
+def company_slug(company):
+    if not isinstance(company, str):
+        company = ""  # NaN/None from rows without a company
+    slug = re.sub(r"[^a-z0-9]+", "_", company.strip().lower()).strip("_")
+    return slug or "unknown"
+
+def partition_path(company):
+    return os.path.join(PARTITION_DIR, company_slug(company), PARTITION_FILE)
+
+def partition_lock(company):
+    # Sessions and the job expiry thread of one process append to and
+    # rewrite the same partition; anything that loads a partition in order
+    # to rewrite it must hold this lock from the read to the write.
+    slug = company_slug(company)
+    with _tables_lock:
+        return _partition_locks.setdefault(slug, threading.RLock())
+
+def migrate_legacy_results():
+    if os.path.isdir(PARTITION_DIR):
+        return
+    staging = f"{PARTITION_DIR}.migrating-{uuid.uuid4().hex[:8]}"
+    os.makedirs(staging, exist_ok=True)
+    if os.path.exists(RESULTS_CSV):
+        df = pd.read_csv(RESULTS_CSV)
+        if "application_id" not in df.columns:
+            df["application_id"] = [str(uuid.uuid4()) for _ in range(len(df))]
+        df["company"] = df["company"].fillna("N/A")
+        for company, part in df.groupby("company"):
+            path = os.path.join(staging, company_slug(company), PARTITION_FILE)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            part.to_csv(path, index=False)
+    try:
+        os.rename(staging, PARTITION_DIR)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)  # another process finished the migration first
+
+def list_companies():
+    migrate_legacy_results()
+    return sorted(
+        name for name in os.listdir(PARTITION_DIR)
+        if os.path.exists(os.path.join(PARTITION_DIR, name, PARTITION_FILE))
+    )
+
+# --- Reads ---
+
+@timed("applications.load_partition")
+def load_applications(company):
+    migrate_legacy_results()
+    path = partition_path(company)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.read_csv(path)
+
+def compact_frame(df):
+    df = df.reindex(columns=list(dict.fromkeys(RESULT_COLUMNS + list(df.columns))))
+    for column in df.columns:
+        values = df[column]
+        if column in CATEGORY_COLUMNS:
+            df[column] = values.astype("string").astype("category")
+        elif column in BOOL_COLUMNS:
+            df[column] = values.astype("string").str.strip().str.lower().eq("true").fillna(False).astype(bool)
+        elif column in DATETIME_COLUMNS:
+            df[column] = pd.to_datetime(values, format="ISO8601", errors="coerce")
+        elif column in FLOAT_COLUMNS:
+            df[column] = pd.to_numeric(values, errors="coerce", downcast="float")
+        else:
+            df[column] = values.astype(TEXT_DTYPE)
+    return df
+
+@timed("applications.table")
+def application_table(company):
+    # Shared read-only table of a company's applications (see above).
+    migrate_legacy_results()
+    path = partition_path(company)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return compact_frame(pd.DataFrame(columns=RESULT_COLUMNS))
+    identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _tables_lock:
+        cached = _tables.get(company)
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        df = compact_frame(pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""]))
+        _tables[company] = (identity, df)
+    return df
+
+@timed("applications.load_all")
+def load_all_applications():
+    frames = [
+        pd.read_csv(os.path.join(PARTITION_DIR, slug, PARTITION_FILE))
+        for slug in list_companies()
+    ]
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+# --- Writes ---
+
+@timed("applications.save_partition")
+def save_applications(company, df):
+    path = partition_path(company)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with partition_lock(company):
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+@data_service.service_method("applications.append", topic="applications",
+                              key=lambda args: args["data"].get("company", "N/A"))
+@timed("applications.append")
+def append_application(data):
+    migrate_legacy_results()
+    record = dict(data)
+    record.setdefault("application_id", str(uuid.uuid4()))
+    company = record.get("company", "N/A")
+    path = partition_path(company)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with partition_lock(company):
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f))
+            if not set(record) <= set(header):
+                # A new column appeared: widen the partition once, then keep appending.
+                df = pd.concat([pd.read_csv(path), pd.DataFrame([record])], ignore_index=True)
+                save_applications(company, df)
+            else:
+                with open(path, "a", newline="", encoding="utf-8") as f:
+                    csv.DictWriter(f, fieldnames=header, lineterminator="\n").writerow(record)
+        else:
+            header = [c for c in RESULT_COLUMNS if c in record] + [c for c in record if c not in RESULT_COLUMNS]
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=header, lineterminator="\n")
+                writer.writeheader()
+                writer.writerow(record)
+    application_status.record_application(record)
+    return record["application_id"]
+
+@data_service.service_method("applications.update", topic="applications", key=lambda args: args["company"])
+@timed("applications.update")
+def update_applications(company, updates):
+    # updates: {application_id: {column: value}}, written in one rewrite of
+    # the partition.
+    if not updates:
+        return
+    with partition_lock(company):
+        df = load_applications(company)
+        for application_id, fields in updates.items():
+            rows = df["application_id"] == application_id
+            for column, value in fields.items():
+                if column not in df.columns:
+                    df[column] = None
+                df[column] = df[column].astype(object)
+                df.loc[rows, column] = value
+        save_applications(company, df)
+
+def update_application(company, application_id, **fields):
+    update_applications(company, {application_id: fields})
+
+@data_service.service_method("applications.save_parsed_info", topic="applications",
+                              key=lambda args: args["data"].get("company", "N/A"))
+@timed("submit.save_parsed_info")
+def save_parsed_info(data):
+    append_application(data)
+
+    if os.path.exists(RESULTS_JSON):
+        with open(RESULTS_JSON, "r") as f:
+            all_data = json.load(f)
+    else:
+        all_data = []
+    all_data.append(data)
+    with open(RESULTS_JSON, "w") as f:
+        json.dump(all_data, f, indent=4)
+
+def _forget_table(company):
+    # Change notification: None means any company may have changed.
+    with _tables_lock:
+        if company is None:
+            _tables.clear()
+        else:
+            _tables.pop(company, None)
+
+data_service.on_change("applications", _forget_table)
+
+@timed("submit.is_duplicate_application")
+def is_duplicate_application(email, job_id, company):
+    df = application_table(company)
+    return ((df['email'] == email) & (df['job_id'] == job_id)).any()
@@ -0,0 +1,142 @@
+import streamlit as st
+from datetime import datetime
+import job_store
+import resume_queue
+import application_status
+from application_store import save_parsed_info, is_duplicate_application
+from resume_parser import EDUCATION_LEVELS, load_skills, save_skills
+from resume_store import store_resume, blob_path
+
+# The apply flow runs as an isolated fragment: interacting with it never
+# reruns the job list around it. Each upload is persisted and enqueued
+# exactly once, its parse result is held in session state keyed by the
+# upload's file_id, and the editable fields live in a form, so editing them
+# does no I/O at all until the application is submitted.
+
+# --- Upload State ---
+
+def _uploads():
+    if "resume_uploads" not in st.session_state:
+        st.session_state.resume_uploads = {}
+    return st.session_state.resume_uploads
+
+def start_upload(resume_file):
+    uploads = _uploads()
+    upload = uploads.get(resume_file.file_id)
+    if upload is None:
+        resume_hash = store_resume(resume_file)
+        upload = {
+            "file_id": resume_file.file_id,
+            "filename": resume_file.name,
+            "resume_hash": resume_hash,
+            "task_id": resume_queue.enqueue(blob_path(resume_hash), resume_hash),
+            "parsed": None,
+        }
+        uploads[resume_file.file_id] = upload
+    return upload
+
+@st.fragment(run_every=1)
+def show_parse_progress(task_id):
+    task = resume_queue.get_task(task_id)
+    if task is None or task["status"] in ("done", "failed"):
+        st.rerun()
+
+    stats = resume_queue.queue_stats()
+    if task["status"] == "queued":
+        st.info(f"⏳ Resume queued for processing (position {task['position']} of {stats['depth']})...")
+    else:
+        st.info("⚙️ Processing your resume...")
+    st.caption(f"Average wait: {stats['avg_wait_seconds']}s · Average processing time: {stats['avg_processing_seconds']}s")
+
+# --- Application Form ---
+
+def submit_application(job, upload, fields):
+    if not job_store.is_open(job):
+        st.error("❌ This job closed on its deadline and no longer accepts applications.")
+        return
+    skills = [s.strip() for s in fields["skills_text"].split(",") if s.strip()]
+    if is_duplicate_application(fields["email"], job.get("job_id", "N/A"), job.get("company", "N/A")):
+        st.warning("⚠️ You have already applied to this job.")
+        return
+
+    if skills:
+        save_skills(list(set(load_skills() + skills)))
+
+    parsed_data = {
+        "name": fields["name"],
+        "email": fields["email"],
+        "phone": fields["phone"],
+        "skills": ", ".join(skills),
+        "education_level": fields["education"],
+        "experience": fields["experience"],
+        "filename": upload["filename"],
+        "resume_hash": upload["resume_hash"],
+        "status": application_status.Status.APPLIED.value,
+        "interview_date": "",
+        "interview_time": "",
+        "saved": False,
+        "company": job.get("company", "N/A"),
+        "job_id": job.get("job_id", "N/A"),
+        "job_title": job["title"],
+        "application_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    save_parsed_info(parsed_data)
+    st.success("🎉 Your application has been submitted!")
+    access_code = application_status.issue_access_code(fields["email"])
+    if access_code:
+        st.info(f"🔑 Your access code is **{access_code}**. Keep it to check your application status with your email.")
+
+def render_application_form(job, upload, key):
+    parsed = upload["parsed"]
+    st.success("✅ Resume processed. You can edit the extracted details below:")
+
+    with st.form(f"apply_form_{key}"):
+        name = st.text_input("Name", parsed["name"], key=f"name_{key}")
+        email = st.text_input("Email", parsed["email"], key=f"email_{key}")
+        phone = st.text_input("Phone", parsed["phone"], key=f"phone_{key}")
+        education = st.selectbox("Education Level", EDUCATION_LEVELS,
+                                 index=EDUCATION_LEVELS.index(parsed["education_level"]), key=f"education_{key}")
+        experience = st.text_area("Experience", parsed["experience"], key=f"experience_{key}")
+        skills_text = st.text_input("Skills (comma-separated)", ", ".join(parsed["skills"]), key=f"skills_{key}")
+        submitted = st.form_submit_button("📨 Submit Application")
+
+    if submitted:
+        submit_application(job, upload, {
+            "name": name,
+            "email": email,
+            "phone": phone,
+            "education": education,
+            "experience": experience,
+            "skills_text": skills_text,
+        })
+
+def parsed_upload(resume_file):
+    # Returns the upload record once its parse result is available, or None
+    # after rendering progress / errors for it.
+    try:
+        upload = start_upload(resume_file)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return None
+
+    if upload["parsed"] is None:
+        task = resume_queue.get_task(upload["task_id"])
+        if task is None or task["status"] == "failed":
+            st.error(f"❌ Failed to process resume: {task['error'] if task else 'task not found'}")
+            return None
+        if task["status"] != "done":
+            show_parse_progress(upload["task_id"])
+            return None
+        upload["parsed"] = task["result"]
+    return upload
+
+@st.fragment
+def apply_form(job, key=None):
+    key = key or job["job_id"]
+    resume_file = st.file_uploader("Upload Your Resume (PDF)", type=["pdf"], key=f"resume_{key}")
+    if not resume_file:
+        return
+
+    upload = parsed_upload(resume_file)
+    if upload is not None:
+        render_application_form(job, upload, key)
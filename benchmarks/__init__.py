@@ -0,0 +1,2 @@
+# Reproducible benchmark suite: synthetic corpus generators, timed scenarios
+# and JSON results for comparing commits. See benchmarks/run.py.
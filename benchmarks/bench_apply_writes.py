@@ -0,0 +1,110 @@
+# Disk writes per keystroke in the apply flow.
+#
+# Renders the application form with an already-parsed upload in session
+# state, types into every field one keystroke at a time and counts the file
+# writes each rerun performs. Editing must cost zero writes; only the final
+# submit may touch disk.
+#
+#   python benchmarks/bench_apply_writes.py
+
+import os
+import sys
+import builtins
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+JOB = {"job_id": "bench-job", "title": "Software Engineer", "company": "IT Tech SDN BHD"}
+UPLOAD = {
+    "file_id": "bench-upload",
+    "filename": "bench.pdf",
+    "resume_hash": "0" * 64,
+    "task_id": "bench-task",
+    "parsed": {
+        "name": "Bench Applicant", "email": "bench@example.com", "phone": "+60 12 345 6789",
+        "skills": ["Python", "SQL"], "education_level": "Bachelor's", "experience": "3 years",
+    },
+}
+TYPED_TEXT = "Kuala Lumpur"
+WRITE_MODES = set("wax+")
+
+_writes = []
+
+
+def _app(repo_root, job, upload):
+    import sys
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    from apply_flow import render_application_form
+    render_application_form(job, upload, job["job_id"])
+
+
+def count_writes():
+    real_open, real_os_open, real_replace = builtins.open, os.open, os.replace
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        if WRITE_MODES & set(mode):
+            _writes.append(str(file))
+        return real_open(file, mode, *args, **kwargs)
+
+    def counting_os_open(path, flags, *args, **kwargs):
+        if flags & (os.O_WRONLY | os.O_RDWR | os.O_CREAT):
+            _writes.append(str(path))
+        return real_os_open(path, flags, *args, **kwargs)
+
+    def counting_replace(src, dst, *args, **kwargs):
+        _writes.append(str(dst))
+        return real_replace(src, dst, *args, **kwargs)
+
+    def restore():
+        builtins.open, os.open, os.replace = real_open, real_os_open, real_replace
+
+    builtins.open, os.open, os.replace = counting_open, counting_os_open, counting_replace
+    return restore
+
+
+def main():
+    from streamlit.testing.v1 import AppTest
+
+    workdir = tempfile.mkdtemp(prefix="bench_apply_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    os.makedirs("parsed_data", exist_ok=True)
+    try:
+        at = AppTest.from_function(_app, args=(REPO_ROOT, JOB, UPLOAD), default_timeout=60)
+        at.run()
+
+        restore = count_writes()
+        try:
+            keystrokes = 0
+            for widget in ("name", "email", "phone", "skills"):
+                field = at.text_input(key=f"{widget}_{JOB['job_id']}")
+                value = field.value
+                for char in TYPED_TEXT:
+                    value += char
+                    field.input(value)
+                    at.run()
+                    keystrokes += 1
+            edit_writes = len(_writes)
+
+            at.button[0].click()
+            at.run()
+            submit_writes = len(_writes) - edit_writes
+        finally:
+            restore()
+    finally:
+        os.chdir(cwd)
+
+    errors = [e.value for e in at.exception]
+    print(f"{'keystrokes':>12} {keystrokes}")
+    print(f"{'edit writes':>12} {edit_writes} ({edit_writes / keystrokes:.2f} per keystroke, target 0)")
+    print(f"{'submit writes':>12} {submit_writes}")
+    if errors:
+        print("exceptions:", errors)
+    if edit_writes or not submit_writes or errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Load test: 8 Streamlit-like worker processes writing to the same stores.
+#
+# Each worker submits applications (save_parsed_info, as the apply form
+# does), updates the status of applications it submitted earlier and posts
+# jobs, all against two shared companies. The run is made twice: with the
+# data service, and with every process writing the files directly as
+# before. Afterwards the stores are checked for lost or corrupted writes.
+# With the service each worker also times how long change notifications
+# take to reach it. Reports throughput and per-operation p50/p99 latency;
+# exits non-zero if the service run lost anything.
+#
+#   python benchmarks/bench_data_service.py [--workers 8] [--ops 200]
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+WORKERS = 8
+OPS = 200                # operations per worker
+UPDATE_EVERY = 4         # every 4th operation updates an earlier application
+JOB_EVERY = 10           # every 10th posts a job
+PROBES = 50              # change notifications timed per worker
+COMPANIES = ["Bench Co", "Other Co"]
+
+WORKER = """
+import os, sys, json, time
+sys.path.insert(0, {repo!r})
+os.chdir({workdir!r})
+import application_store, job_store, data_service
+probe_delays = []
+def on_probe(key):
+    if isinstance(key, str) and key.startswith("probe:"):
+        probe_delays.append(time.time() - float(key[6:]))
+data_service.on_change("applications", on_probe)
+worker, company = {worker}, {company!r}
+open(f"ready-{{worker}}", "w").close()
+while not os.path.exists("start"):
+    time.sleep(0.001)
+latencies = {{"submit": [], "update": [], "post_job": []}}
+submitted, updated, errors = [], [], []
+for i in range({ops}):
+    started = time.perf_counter()
+    try:
+        if i % {job_every} == {job_every} - 1:
+            op = "post_job"
+            job_store.add_job({{"title": f"Job {{worker}}-{{i}}", "company": company, "deadline": "2099-12-31"}})
+        elif i % {update_every} == {update_every} - 1 and submitted:
+            op = "update"
+            application_id = submitted[len(updated) % len(submitted)]
+            application_store.update_applications(company, {{application_id: {{"status": "Interview Invited"}}}})
+            updated.append(application_id)
+        else:
+            op = "submit"
+            application_id = f"{{worker}}-{{i}}"
+            application_store.save_parsed_info({{
+                "name": f"Worker {{worker}}", "email": f"w{{worker}}-{{i}}@example.com", "skills": "Python",
+                "status": "Applied", "saved": False, "company": company, "job_id": "bench",
+                "job_title": "Bench", "application_id": application_id,
+            }})
+            submitted.append(application_id)
+    except Exception as e:
+        errors.append(f"{{type(e).__name__}}: {{e}}")
+        continue
+    latencies[op].append(time.perf_counter() - started)
+deadline = time.time() + 30
+while data_service.remote() and len(probe_delays) < {probes} and time.time() < deadline:
+    time.sleep(0.01)
+print(json.dumps({{"latencies": latencies, "submitted": submitted, "updated": updated,
+                  "errors": errors, "probe_delays": probe_delays}}))
+"""
+
+PROBER = """
+import os, sys, time
+sys.path.insert(0, {repo!r})
+os.chdir({workdir!r})
+import data_service
+for _ in range({probes}):
+    data_service.notify("applications", f"probe:{{time.time()}}")
+    time.sleep(0.01)
+"""
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float("nan")
+
+
+def check_stores(workdir, results):
+    # Counts writes that did not survive.
+    import csv
+    import application_store
+    problems = {}
+    rows = {}
+    for company in COMPANIES:
+        path = os.path.join(workdir, application_store.partition_path(company))
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                rows[row["application_id"]] = row
+    submitted = [a for r in results for a in r["submitted"]]
+    problems["lost applications"] = sum(a not in rows for a in submitted)
+    problems["lost status updates"] = sum(
+        a in rows and rows[a]["status"] != "Interview Invited" for r in results for a in set(r["updated"])
+    )
+    try:
+        with open(os.path.join(workdir, application_store.RESULTS_JSON)) as f:
+            problems["lost results.json entries"] = len(submitted) - len(json.load(f))
+    except ValueError:
+        problems["lost results.json entries"] = "file corrupted"
+    with open(os.path.join(workdir, "jobs_data.csv"), newline="", encoding="utf-8") as f:
+        posted = sum(1 for _ in csv.DictReader(f))
+    problems["lost jobs"] = sum(len(r["latencies"]["post_job"]) for r in results) - posted
+    problems["failed calls"] = sum(len(r["errors"]) for r in results)
+    return problems
+
+
+def run(mode, workers, ops):
+    workdir = tempfile.mkdtemp(prefix=f"bench_data_service_{mode}_")
+    env = dict(os.environ)
+    env.pop("DATA_SERVICE_SOCKET", None)
+    server = None
+    if mode == "service":
+        env["DATA_SERVICE_SOCKET"] = os.path.join(workdir, "data.sock")
+        server = subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "data_service.py")], cwd=workdir, env=env)
+        while not os.path.exists(env["DATA_SERVICE_SOCKET"]):
+            time.sleep(0.05)
+
+    processes = []
+    for worker in range(workers):
+        script = WORKER.format(repo=REPO_ROOT, workdir=workdir, worker=worker, company=COMPANIES[worker % len(COMPANIES)],
+                               ops=ops, job_every=JOB_EVERY, update_every=UPDATE_EVERY,
+                               probes=PROBES if mode == "service" else 0)
+        processes.append(subprocess.Popen([sys.executable, "-c", script], env=env, stdout=subprocess.PIPE, text=True))
+    while not all(os.path.exists(os.path.join(workdir, f"ready-{worker}")) for worker in range(workers)):
+        time.sleep(0.05)
+    time.sleep(1)   # event subscriptions connect in the background after import
+    start_at = time.time()
+    open(os.path.join(workdir, "start"), "w").close()
+    if mode == "service":
+        subprocess.run([sys.executable, "-c", PROBER.format(repo=REPO_ROOT, workdir=workdir, probes=PROBES)],
+                       env=env, check=True)
+    results = [json.loads(p.communicate()[0].strip().splitlines()[-1]) for p in processes]
+    elapsed = time.time() - start_at
+    if server is not None:
+        server.terminate()
+        server.wait()
+
+    total_ops = sum(len(v) for r in results for v in r["latencies"].values())
+    print(f"\n{mode}: {workers} workers, {total_ops:,} operations in {elapsed:.1f}s ({total_ops / elapsed:,.0f} ops/s)")
+    print(f"  {'operation':<12}{'count':>8}{'p50':>10}{'p99':>10}")
+    for op in ("submit", "update", "post_job"):
+        values = [v for r in results for v in r["latencies"][op]]
+        print(f"  {op:<12}{len(values):>8}{percentile(values, 0.5) * 1000:>8.1f}ms{percentile(values, 0.99) * 1000:>8.1f}ms")
+    if mode == "service":
+        delays = [d for r in results for d in r["probe_delays"]]
+        print(f"  notifications: {len(delays)}/{PROBES * workers} delivered, "
+              f"p50 {percentile(delays, 0.5) * 1000:.1f}ms, p99 {percentile(delays, 0.99) * 1000:.1f}ms")
+    problems = check_stores(workdir, results)
+    for name, value in problems.items():
+        print(f"  {name}: {value}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--ops", type=int, default=OPS)
+    args = parser.parse_args()
+
+    problems = run("service", args.workers, args.ops)
+    run("direct", args.workers, args.ops)
+    return 1 if any(problems.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# Peak memory of exporting 500k applications.
+#
+# Generates a seeded 500k-row partition, then runs each step in a fresh
+# interpreter after the shared application table is loaded, and reports how
+# far peak RSS rose above the RSS right before the step, plus the peak of
+# Python allocations (tracemalloc), which also counts memory the allocator
+# already held from loading the table and reused: the streaming
+# export in each format (chunks are counted and dropped, as a socket would
+# send them), a download through the chunked export server, and, for
+# comparison, the pre-change way of building a whole export in memory.
+# Exits non-zero if either peak of a streaming step is over BUDGET_MB.
+#
+#   python benchmarks/bench_export_memory.py [--rows 500000]
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.generators import generate_results_csv
+
+ROWS = 500_000
+TENANT = "Bench Co"
+BUDGET_MB = 64
+
+# step -> (streaming?, code that sets `size` to the bytes produced)
+STEPS = {
+    "csv": (True, """
+size = sum(len(c) for c in application_export.export_chunks(TENANT, "csv", {}))
+"""),
+    "jsonl": (True, """
+size = sum(len(c) for c in application_export.export_chunks(TENANT, "jsonl", {}))
+"""),
+    "parquet": (True, """
+size = sum(len(c) for c in application_export.export_chunks(TENANT, "parquet", {}))
+"""),
+    "http_csv": (True, """
+import urllib.request
+server = application_export.start_server(port=0)
+token = application_export.create_export(TENANT, "csv", {})
+size = 0
+with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/exports/{token}") as response:
+    while chunk := response.read(1 << 16):
+        size += len(chunk)
+"""),
+    "in_memory_csv": (False, """
+size = len(table[table["status"].notna()].to_csv(index=False).encode("utf-8"))
+"""),
+    "in_memory_json": (False, """
+import json
+size = len(json.dumps(table.astype(str).to_dict("records"), indent=4).encode("utf-8"))
+"""),
+}
+
+RUNNER = """
+import os, sys, json
+sys.path.insert(0, {repo!r})
+os.chdir({workdir!r})
+import application_store, application_export
+TENANT = {tenant!r}
+table = application_store.application_table(TENANT)
+def status_mb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+import ctypes
+ctypes.CDLL("libc.so.6").malloc_trim(0)   # hand memory freed while loading back to the OS
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")   # resets the VmHWM high-water mark to the current RSS
+before = status_mb("VmRSS")
+import tracemalloc
+tracemalloc.start()
+{code}
+python_peak = tracemalloc.get_traced_memory()[1] / 2**20
+print(json.dumps({{"before_mb": before, "peak_mb": status_mb("VmHWM"), "python_peak_mb": python_peak, "size_mb": size / 2**20}}))
+"""
+
+
+def run_step(name, workdir):
+    script = RUNNER.format(repo=REPO_ROOT, workdir=workdir, tenant=TENANT, code=STEPS[name][1])
+    # Large buffers go back to the OS on free, so the peak shows what a step holds.
+    env = dict(os.environ, MALLOC_MMAP_THRESHOLD_="131072")
+    output = subprocess.check_output([sys.executable, "-c", script], text=True, stderr=subprocess.DEVNULL, env=env)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=ROWS)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_export_memory_")
+    os.chdir(workdir)
+    import application_store
+    path = application_store.partition_path(TENANT)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    generate_results_csv(path, args.rows, companies=[TENANT])
+    print(f"{args.rows:,} rows")
+    print(f"{'step':<16}{'RSS before':>12}{'peak':>10}{'rise':>10}{'py peak':>10}{'output':>10}")
+    failed = False
+    for name, (streaming, _) in STEPS.items():
+        result = run_step(name, workdir)
+        rise = result["peak_mb"] - result["before_mb"]
+        worst = max(rise, result["python_peak_mb"])
+        verdict = ""
+        if streaming:
+            verdict = "ok" if worst <= BUDGET_MB else f"over budget ({BUDGET_MB} MB)"
+            failed |= worst > BUDGET_MB
+        print(f"{name:<16}{result['before_mb']:>10.1f}MB{result['peak_mb']:>8.1f}MB{rise:>8.1f}MB"
+              f"{result['python_peak_mb']:>8.1f}MB{result['size_mb']:>8.1f}MB  {verdict}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# Render-time benchmark for the recruiter job board.
+#
+# Seeds jobs_data.csv with an increasing number of postings in a scratch
+# directory and times a warm rerun of display_jobs() through Streamlit's
+# AppTest harness. With pagination the per-page cost should stay flat no
+# matter how many jobs exist.
+#
+#   python benchmarks/bench_job_board.py
+
+import os
+import sys
+import csv
+import time
+import uuid
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+JOB_COUNTS = [100, 1000, 10000, 50000]
+RUNS = 5
+
+
+def seed_jobs(path, count):
+    import job_store
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(job_store.JOB_COLUMNS)
+        for i in range(count):
+            writer.writerow([
+                f"Job {i}", "Synthetic description " * 20, "Kuala Lumpur", "$1,000 - $2,000",
+                "Full-time", f"2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
+                f"2025-01-01 00:{(i // 60) % 60:02d}:{i % 60:02d}", "Python; SQL; Git",
+                "IT Tech SDN BHD", str(uuid.uuid4())
+            ])
+
+
+def job_board_page(repo_root):
+    import sys
+    sys.path.insert(0, repo_root)
+    from job_listings import display_jobs
+    display_jobs()
+
+
+def time_render(count):
+    from streamlit.testing.v1 import AppTest
+
+    workdir = tempfile.mkdtemp(prefix="bench_job_board_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        os.makedirs("parsed_data", exist_ok=True)
+        seed_jobs("jobs_data.csv", count)
+        at = AppTest.from_function(job_board_page, args=(REPO_ROOT,), default_timeout=120)
+        at.run()  # cold run loads the index once
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    finally:
+        os.chdir(cwd)
+
+
+def main():
+    print(f"{'jobs':>8} {'warm rerun (ms)':>16}")
+    for count in JOB_COUNTS:
+        print(f"{count:>8} {time_render(count) * 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# Peak memory of the resume I/O path for large PDFs.
+#
+# Builds a 20 MB resume (a text page plus pages of incompressible images),
+# then runs each step in a fresh interpreter and reports how far its peak
+# RSS rose above the RSS right before the step: storing an upload held in a
+# BytesIO (as Streamlit hands it over), extracting the text from the stored
+# file and from the upload buffer, and encoding the inline viewer. The
+# pre-change code paths are measured alongside for comparison. Each step is
+# repeated to show the peak does not grow with the number of uploads one
+# process handles; the script exits non-zero if a step goes over budget.
+#
+#   python benchmarks/bench_pdf_memory.py
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.generators import generate_resume_pdf
+
+TARGET_MB = 20
+REPEATS = 10
+
+# step -> (setup code defining step(), allowed peak rise as a multiple of the
+# PDF size or None for the pre-change code paths kept for comparison)
+STEPS = {
+    "store_upload": (0.5, """
+import io
+from resume_store import store_resume
+upload = io.BytesIO(open(PDF, "rb").read())
+def step():
+    store_resume(upload, max_bytes=1 << 30)
+"""),
+    "extract_text": (2, """
+from resume_parser import extract_text_from_pdf
+def step():
+    extract_text_from_pdf(PDF)
+"""),
+    "extract_text_upload": (2, """
+import io
+from resume_store import open_pdf
+upload = io.BytesIO(open(PDF, "rb").read())
+def step():
+    with open_pdf(upload) as doc:
+        "".join(page.get_text() for page in doc)
+"""),
+    "extract_text_old": (None, """
+import fitz
+def step():
+    text = ""
+    with fitz.open(PDF) as doc:
+        for page in doc:
+            text += page.get_text()
+"""),
+    "viewer_html": (3, """
+from resume_store import pdf_viewer_html
+def step():
+    pdf_viewer_html(PDF)
+"""),
+    "viewer_old": (None, """
+import base64
+def step():
+    with open(PDF, "rb") as f:
+        base64_pdf = base64.b64encode(f.read()).decode("utf-8")
+    f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="700" height="800" type="application/pdf"></iframe>'
+"""),
+}
+
+RUNNER = """
+import os, sys, json
+sys.path.insert(0, {repo!r})
+os.chdir({workdir!r})
+PDF = {small_pdf!r}
+{setup}
+step()   # warm-up on a one-page resume: imports, PyMuPDF's font caches
+PDF = {pdf!r}
+def status_mb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")   # resets the VmHWM high-water mark to the current RSS
+before = status_mb("VmRSS")
+for _ in range({repeats}):
+    step()
+print(json.dumps({{"before_mb": before, "peak_mb": status_mb("VmHWM"), "after_mb": status_mb("VmRSS")}}))
+"""
+
+
+def build_pdf(path, target_mb=TARGET_MB):
+    import fitz
+    import numpy as np
+    generate_resume_pdf(path, pages=1)
+    rng = np.random.default_rng(0)
+    doc = fitz.open(path)
+    try:
+        side = 1024
+        for _ in range(-(-target_mb * 1024 * 1024 // (side * side * 3))):
+            pixels = rng.integers(0, 256, size=side * side * 3, dtype=np.uint8).tobytes()
+            pixmap = fitz.Pixmap(fitz.csRGB, side, side, pixels, False)
+            doc.new_page().insert_image(fitz.Rect(50, 50, 550, 550), pixmap=pixmap)
+        doc.save(path + ".tmp", deflate=False)
+    finally:
+        doc.close()
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def run_step(name, pdf, workdir):
+    script = RUNNER.format(repo=REPO_ROOT, workdir=workdir, pdf=pdf, small_pdf=pdf.replace(".pdf", "_small.pdf"),
+                           setup=STEPS[name][1], repeats=REPEATS)
+    # A fixed mmap threshold makes glibc hand large buffers back on free, so
+    # the numbers show what each step holds rather than allocator retention.
+    env = dict(os.environ, MALLOC_MMAP_THRESHOLD_="131072")
+    output = subprocess.check_output([sys.executable, "-c", script], text=True, stderr=subprocess.DEVNULL, env=env)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="bench_pdf_memory_")
+    pdf = build_pdf(os.path.join(workdir, "large_resume.pdf"))
+    generate_resume_pdf(pdf.replace(".pdf", "_small.pdf"))
+    size_mb = os.path.getsize(pdf) / (1024 * 1024)
+    print(f"PDF: {size_mb:.1f} MB, {REPEATS} runs per step")
+    print(f"{'step':<18}{'RSS before':>12}{'peak':>10}{'rise':>10}{'RSS after':>12}")
+    failed = False
+    for name, (budget, _) in STEPS.items():
+        result = run_step(name, pdf, workdir)
+        rise = result["peak_mb"] - result["before_mb"]
+        verdict = ""
+        if budget is not None:
+            verdict = "ok" if rise <= budget * size_mb else f"over budget ({budget}x PDF size)"
+            failed |= rise > budget * size_mb
+        print(f"{name:<18}{result['before_mb']:>10.1f}MB{result['peak_mb']:>8.1f}MB{rise:>8.1f}MB"
+              f"{result['after_mb']:>10.1f}MB  {verdict}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
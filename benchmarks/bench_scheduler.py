@@ -0,0 +1,66 @@
+# Interview scheduler benchmark.
+#
+# Books a few thousand interviews per week for several recruiters, then
+# times single conflict checks against the interval index and batch
+# auto-assignment. Conflict checks are bisects, so their cost should barely
+# move as the number of bookings grows.
+#
+#   python benchmarks/bench_scheduler.py
+
+import os
+import sys
+import time
+import tempfile
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+COMPANY = "IT Tech SDN BHD"
+RECRUITERS = 10
+WEEKS = [1, 4, 16]
+BATCH = 50
+CHECKS = 10000
+
+
+def applicants(count, offset=0):
+    return [
+        {"name": f"Applicant {offset + i}", "email": f"applicant{offset + i}@example.com", "job_title": "Engineer"}
+        for i in range(count)
+    ]
+
+
+def main():
+    os.chdir(tempfile.mkdtemp(prefix="bench_scheduler_"))
+    import interview_scheduler
+
+    start = datetime(2025, 1, 6, 9)
+    # 30-minute slots, 16 per working day, 80 per week per recruiter.
+    per_week = 80
+    booked_weeks = 0
+    print(f"{'bookings':>10} {'batch of 50 (ms)':>17} {'conflict check (us)':>20}")
+    for weeks in WEEKS:
+        for recruiter in range(RECRUITERS):
+            count = (weeks - booked_weeks) * per_week
+            interview_scheduler.schedule_batch(
+                COMPANY, f"recruiter{recruiter}@example.com", applicants(count), start_after=start, minutes=30
+            )
+        booked_weeks = weeks
+
+        t0 = time.perf_counter()
+        interview_scheduler.schedule_batch(COMPANY, "recruiter0@example.com", applicants(BATCH), start_after=start, minutes=30)
+        batch_ms = (time.perf_counter() - t0) * 1000
+
+        index = interview_scheduler._indexes[(COMPANY, "recruiter0@example.com")]
+        probes = [start + timedelta(minutes=7 * i) for i in range(CHECKS)]
+        t0 = time.perf_counter()
+        for probe in probes:
+            interview_scheduler.find_conflict(index, probe, probe + timedelta(minutes=30))
+        check_us = (time.perf_counter() - t0) / CHECKS * 1e6
+
+        total = sum(len(i["starts"]) for i in interview_scheduler._indexes.values())
+        print(f"{total:>10} {batch_ms:>17.2f} {check_us:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
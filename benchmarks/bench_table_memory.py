@@ -0,0 +1,68 @@
+# Memory of one company's application table at 1M rows.
+#
+# Generates a seeded 1M-row partition and compares the frame
+# load_applications() returns (object columns) with the compact shared table
+# from application_table(): deep memory per column and in total, plus load
+# times. Exits non-zero if the compact table is not at least MIN_REDUCTION
+# times smaller.
+#
+#   python benchmarks/bench_table_memory.py [--rows 1000000]
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.generators import generate_results_csv
+
+ROWS = 1_000_000
+MIN_REDUCTION = 2.0
+TENANT = "Bench Co"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=ROWS)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_table_memory_")
+    os.chdir(workdir)
+    import application_store
+
+    path = application_store.partition_path(TENANT)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    generate_results_csv(path, args.rows, companies=[TENANT])
+    print(f"{args.rows:,} rows, {os.path.getsize(path) / 2**20:.0f} MB CSV")
+
+    started = time.perf_counter()
+    plain = application_store.load_applications(TENANT)
+    plain_s = time.perf_counter() - started
+    started = time.perf_counter()
+    compact = application_store.application_table(TENANT)
+    compact_s = time.perf_counter() - started
+    started = time.perf_counter()
+    shared = application_store.application_table(TENANT)
+    cached_s = time.perf_counter() - started
+    assert shared is compact
+
+    plain_mem = plain.memory_usage(deep=True, index=False)
+    compact_mem = compact.memory_usage(deep=True, index=False)
+    print(f"{'column':<18}{'plain dtype':>14}{'MB':>9}{'compact dtype':>18}{'MB':>9}")
+    for column in compact.columns:
+        plain_dtype = str(plain[column].dtype) if column in plain else "-"
+        plain_mb = plain_mem.get(column, 0) / 2**20
+        print(f"{column:<18}{plain_dtype:>14}{plain_mb:>9.1f}{str(compact[column].dtype):>18}"
+              f"{compact_mem[column] / 2**20:>9.1f}")
+    reduction = plain_mem.sum() / compact_mem.sum()
+    print(f"{'total':<18}{'':>14}{plain_mem.sum() / 2**20:>9.1f}{'':>18}{compact_mem.sum() / 2**20:>9.1f}"
+          f"  ({reduction:.1f}x smaller)")
+    print(f"load: plain {plain_s:.2f}s, compact {compact_s:.2f}s, shared (cached) {cached_s * 1000:.2f}ms")
+    return 0 if reduction >= MIN_REDUCTION else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
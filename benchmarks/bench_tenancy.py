@@ -0,0 +1,68 @@
+# Tenant isolation benchmark for application_store.
+#
+# Times load_applications() for one small company while the other tenants
+# grow from nothing to hundreds of thousands of applications. Because each
+# company lives in its own partition the load time should not move.
+#
+#   python benchmarks/bench_tenancy.py
+
+import os
+import sys
+import time
+import tempfile
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+TENANT = "IT Tech SDN BHD"
+TENANT_ROWS = 1000
+OTHER_TENANTS = 10
+OTHER_ROWS = [0, 10000, 100000, 500000]
+RUNS = 5
+
+
+def make_rows(company, count):
+    return pd.DataFrame({
+        "name": [f"Applicant {i}" for i in range(count)],
+        "email": [f"applicant{i}@example.com" for i in range(count)],
+        "skills": "Python, SQL",
+        "status": "Applied",
+        "company": company,
+        "job_id": "00000000-0000-0000-0000-000000000000",
+        "application_id": [f"{company}-{i}" for i in range(count)],
+    })
+
+
+def time_tenant_load(other_rows):
+    workdir = tempfile.mkdtemp(prefix="bench_tenancy_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import application_store
+        os.makedirs(application_store.PARTITION_DIR, exist_ok=True)
+        application_store.save_applications(TENANT, make_rows(TENANT, TENANT_ROWS))
+        per_tenant = other_rows // OTHER_TENANTS
+        for n in range(OTHER_TENANTS if per_tenant else 0):
+            company = f"Other Company {n}"
+            application_store.save_applications(company, make_rows(company, per_tenant))
+
+        timings = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            df = application_store.load_applications(TENANT)
+            timings.append(time.perf_counter() - start)
+        assert len(df) == TENANT_ROWS
+        return min(timings)
+    finally:
+        os.chdir(cwd)
+
+
+def main():
+    print(f"{'other tenants rows':>20} {'tenant load (ms)':>17}")
+    for other_rows in OTHER_ROWS:
+        print(f"{other_rows:>20} {time_tenant_load(other_rows) * 1000:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Import-time budget check for the two entry points.
+#
+# Imports each entry point in a fresh interpreter (after streamlit itself
+# and its secrets, which every page needs anyway) and runs its main() once
+# with page rendering stubbed out, since a page may load whatever it needs.
+# Fails if that takes longer than the budget or drags in a heavy dependency
+# that should only load with a page.
+#
+#   python benchmarks/check_import_budget.py [--budget-ms 150]
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ["recruiter_interface", "applicant_interface"]
+HEAVY_MODULES = [
+    "pandas", "numpy", "pyarrow", "fitz", "pymupdf", "fuzzywuzzy", "smtplib", "email.mime.multipart"
+]
+DEFAULT_BUDGET_MS = 150
+
+PROBE = """
+import sys, time, json
+import streamlit
+try:
+    streamlit.secrets.load_if_toml_exists()
+except Exception:
+    pass
+start = time.perf_counter()
+import {module}
+import page_router
+page_router.render_page = lambda module, function: None
+{module}.main()
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, runs=3):
+    best = None
+    for _ in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        )
+        result = json.loads(out.strip().splitlines()[-1])
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check entry point import and startup time.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module in ENTRY_POINTS:
+        result = measure_import(module)
+        ms = result["seconds"] * 1000
+        problems = []
+        if ms > args.budget_ms:
+            problems.append(f"over budget ({args.budget_ms:.0f} ms)")
+        if result["heavy"]:
+            problems.append(f"eagerly imports {', '.join(result['heavy'])}")
+        status = "FAIL: " + "; ".join(problems) if problems else "ok"
+        failures += bool(problems)
+        print(f"{module:<22} {ms:>8.1f} ms  {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# Compare two benchmark result files and flag regressions.
+#
+#   python -m benchmarks.compare OLD.json NEW.json [--threshold 1.2]
+#
+# Exits with status 1 when any median got slower than the threshold ratio.
+
+import sys
+import json
+import argparse
+
+
+def flatten(report):
+    rows = {}
+    for size, scenarios in report["sizes"].items():
+        for scenario, measurements in scenarios.items():
+            for name, stats in measurements.items():
+                rows[(size, scenario, name)] = stats["median"]
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    with open(args.old, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    old_rows, new_rows = flatten(old), flatten(new)
+
+    print(f"{old['commit']} -> {new['commit']}")
+    print(f"{'size':>6}  {'scenario':<28} {'measurement':<22} {'old (ms)':>10} {'new (ms)':>10} {'ratio':>7}")
+    regressions = 0
+    for key in sorted(set(old_rows) & set(new_rows)):
+        before, after = old_rows[key], new_rows[key]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        size, scenario, name = key
+        print(f"{size:>6}  {scenario:<28} {name:<22} {before * 1000:>10.2f} {after * 1000:>10.2f} {ratio:>7.2f}{flag}")
+    for key in sorted(set(new_rows) - set(old_rows)):
+        print(f"{key[0]:>6}  {key[1]:<28} {key[2]:<22} {'-':>10} {new_rows[key] * 1000:>10.2f}     new")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+# Synthetic corpus generators for the benchmark suite.
+#
+# Everything is seeded so two runs (or two commits) benchmark byte-identical
+# inputs. Large CSVs are streamed out in chunks so generating 1M rows never
+# holds the whole table in memory.
+
+import os
+import csv
+import json
+import uuid
+import random
+from datetime import datetime, timedelta
+
+FIRST_NAMES = ["Alice", "Tan", "Siti", "Raj", "Mei", "John", "Aisyah", "Wei", "Kumar", "Nurul", "David", "Hui"]
+LAST_NAMES = ["Johnson", "Lim", "Abdullah", "Kumar", "Wong", "Smith", "Rahman", "Chen", "Singh", "Ismail", "Lee", "Ng"]
+COMPANIES = ["IT Tech SDN BHD", "Acme Corp", "Globex Bhd", "Initech", "Umbrella Tech", "Hooli Asia", "Stark Digital", "Wayne Systems"]
+JOB_TITLES = ["Software Engineer", "Data Engineer", "AI Engineer", "DevOps Engineer", "QA Analyst", "Product Designer", "Backend Developer"]
+LOCATIONS = ["Petaling Jaya", "Bangsar South", "Puchong", "Cyberjaya", "Penang", "Johor Bahru"]
+EDUCATION = ["PhD", "Master's", "Bachelor's", "Diploma", "High School", "Not found"]
+STATUSES = ["Applied", "Interview Invited", "Offer Sent", "Rejected"]
+BASE_SKILLS = [
+    "Python", "Java", "JavaScript", "SQL", "PHP", "React", "Django", "HTML", "CSS", "Excel",
+    "Docker", "Kubernetes", "AWS", "Git", "Go", "R", "C++", "TypeScript", "Node.js", "PostgreSQL"
+]
+NOISE_WORDS = (
+    "team delivered project stakeholders improved performance designed implemented platform "
+    "customers agile scalable reliable analysis reporting pipeline ownership mentoring"
+).split()
+
+SIZES = {"1k": 1000, "10k": 10000, "100k": 100000, "1m": 1000000}
+
+
+def parse_size(label):
+    return SIZES[label.lower()] if label.lower() in SIZES else int(label)
+
+
+def skill_vocabulary(count, seed=0):
+    rng = random.Random(seed)
+    skills = list(BASE_SKILLS)
+    syllables = ["data", "cloud", "net", "flow", "script", "base", "graph", "stack", "ops", "ml", "api", "kit"]
+    while len(skills) < count:
+        word = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 3)))
+        skills.append(f"{word.title()} {rng.randint(1, 9999)}")
+    return skills[:count]
+
+
+def generate_skills_json(path, count=10000, seed=0):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sorted(set(skill_vocabulary(count, seed))), f, indent=4)
+
+
+def _random_name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def generate_jobs_csv(path, rows, seed=0, companies=COMPANIES):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    job_ids = []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow([
+            "title", "description", "location", "salary", "job_type",
+            "deadline", "posted_on", "requirements", "company", "job_id"
+        ])
+        for i in range(rows):
+            posted = start + timedelta(minutes=i)
+            job_id = str(uuid.UUID(int=rng.getrandbits(128)))
+            job_ids.append(job_id)
+            low = rng.randrange(1000, 8000, 100)
+            writer.writerow([
+                rng.choice(JOB_TITLES),
+                " ".join(rng.choice(NOISE_WORDS) for _ in range(30)),
+                rng.choice(LOCATIONS),
+                f"${low:,} - ${low + 2000:,}",
+                rng.choice(["Full-time", "Part-time", "Contract", "Internship"]),
+                (posted + timedelta(days=rng.randint(7, 60))).strftime("%Y-%m-%d"),
+                posted.strftime("%Y-%m-%d %H:%M:%S"),
+                "; ".join(rng.sample(BASE_SKILLS, 3)),
+                companies[i % len(companies)],
+                job_id,
+            ])
+    return job_ids
+
+
+def generate_results_csv(path, rows, job_ids=None, seed=0, companies=COMPANIES, chunk_size=50000):
+    rng = random.Random(seed)
+    job_ids = job_ids or [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(200)]
+    columns = [
+        "name", "email", "phone", "skills", "education_level", "experience", "filename",
+        "status", "interview_date", "interview_time", "saved", "company", "job_id",
+        "job_title", "application_date", "fraud_score", "suspicion_flag"
+    ]
+    start = datetime(2025, 1, 1)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(columns)
+        buffer = []
+        for i in range(rows):
+            name = _random_name(rng)
+            status = rng.choice(STATUSES)
+            invited = status != "Applied"
+            buffer.append([
+                name,
+                f"{name.lower().replace(' ', '.')}{i}@example.com",
+                f"+60 1{rng.randint(0, 9)} {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+                ", ".join(rng.sample(BASE_SKILLS, rng.randint(2, 6))),
+                rng.choice(EDUCATION),
+                f"{rng.randint(1, 10)} years as {rng.choice(JOB_TITLES)} at {rng.choice(COMPANIES)}",
+                f"resume_{i}.pdf",
+                status,
+                (start + timedelta(days=rng.randint(0, 200))).strftime("%Y-%m-%d") if invited else "",
+                f"{rng.randint(9, 17):02d}:00:00" if invited else "",
+                rng.random() < 0.1,
+                companies[i % len(companies)],
+                rng.choice(job_ids),
+                rng.choice(JOB_TITLES),
+                (start + timedelta(seconds=i * 30)).strftime("%Y-%m-%d %H:%M:%S"),
+                round(rng.random(), 2),
+                rng.random() < 0.05,
+            ])
+            if len(buffer) >= chunk_size:
+                writer.writerows(buffer)
+                buffer = []
+        writer.writerows(buffer)
+
+
+def generate_resume_pdf(path, pages=1, skills=None, noise=0.5, seed=0):
+    # noise is the fraction of each page filled with filler sentences.
+    import fitz
+
+    rng = random.Random(seed)
+    skills = skills if skills is not None else rng.sample(BASE_SKILLS, 6)
+    name = _random_name(rng)
+    header = [
+        name,
+        f"Email: {name.lower().replace(' ', '.')}@example.com",
+        f"Phone: +60 12 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        "",
+        "Education",
+        "Bachelor of Computer Science, Universiti Malaya",
+        "",
+        "Experience",
+        f"Software Engineer at Acme Corp from Jan 2020 to Present",
+        f"Intern at Globex Bhd from Jun 2019 to Dec 2019",
+        "",
+        "Skills",
+        ", ".join(skills),
+    ]
+    doc = fitz.open()
+    try:
+        for page_number in range(pages):
+            page = doc.new_page()
+            lines = header if page_number == 0 else [f"Projects (page {page_number + 1})"]
+            filler = int(45 * noise)
+            lines = lines + [
+                " ".join(rng.choice(NOISE_WORDS) for _ in range(12)) for _ in range(filler)
+            ]
+            page.insert_textbox(fitz.Rect(50, 50, 550, 800), "\n".join(lines), fontsize=10)
+        doc.save(path)
+    finally:
+        doc.close()
+    return path
+
+
+def build_corpus(directory, rows, job_rows=None, skills=10000, seed=0):
+    # Lays out a tree that looks like the app's working directory.
+    os.makedirs(os.path.join(directory, "parsed_data"), exist_ok=True)
+    os.makedirs(os.path.join(directory, "resumes"), exist_ok=True)
+    job_rows = job_rows or max(100, rows // 100)
+    job_ids = generate_jobs_csv(os.path.join(directory, "jobs_data.csv"), job_rows, seed)
+    generate_results_csv(os.path.join(directory, "parsed_data", "results.csv"), rows, job_ids, seed)
+    generate_skills_json(os.path.join(directory, "skills.json"), skills, seed)
+    for pages in (1, 5, 20):
+        generate_resume_pdf(os.path.join(directory, "resumes", f"synthetic_{pages}p.pdf"), pages=pages, seed=seed)
+    return directory
@@ -0,0 +1,103 @@
+# Run the benchmark suite and save the results as JSON.
+#
+#   python -m benchmarks.run --size 1k --size 100k
+#   python -m benchmarks.run --size 1m --only recruiter_page_load
+#   python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+#
+# Generated corpora are cached under benchmarks/.corpus/<size>-<seed>/ and
+# copied into a scratch workspace for every run, so scenarios that write
+# (save_parsed_info, the partition migration) never touch the cache.
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks import generators, scenarios
+
+CORPUS_DIR = os.path.join(REPO_ROOT, "benchmarks", ".corpus")
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def corpus_for(size_label, seed, skills):
+    path = os.path.join(CORPUS_DIR, f"{size_label}-{seed}-{skills}")
+    if not os.path.exists(os.path.join(path, ".complete")):
+        shutil.rmtree(path, ignore_errors=True)
+        rows = generators.parse_size(size_label)
+        print(f"Generating {size_label} corpus ({rows} rows)...", flush=True)
+        generators.build_corpus(path, rows, job_rows=rows, skills=skills, seed=seed)
+        open(os.path.join(path, ".complete"), "w").close()
+    return path
+
+
+def run_size(size_label, seed, skills, only):
+    workspace = tempfile.mkdtemp(prefix=f"bench_{size_label}_")
+    shutil.copytree(corpus_for(size_label, seed, skills), workspace, dirs_exist_ok=True)
+    cwd = os.getcwd()
+    os.chdir(workspace)
+    results = {}
+    try:
+        for name, func, runs in scenarios.SCENARIOS:
+            if only and name not in only and name != "migrate_legacy_results":
+                continue
+            print(f"  [{size_label}] {name}...", flush=True)
+            results[name] = func(runs)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--size", action="append", help="corpus size: 1k, 10k, 100k, 1m or a row count (repeatable)")
+    parser.add_argument("--skills", type=int, default=10000, help="skills.json vocabulary size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", action="append", help="run only the named scenario (repeatable)")
+    parser.add_argument("--out", help="output JSON path (default: benchmarks/results/<timestamp>_<commit>.json)")
+    args = parser.parse_args(argv)
+
+    sizes = args.size or ["1k"]
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "skills": args.skills,
+        "sizes": {},
+    }
+    for size_label in sizes:
+        report["sizes"][size_label] = run_size(size_label, args.seed, args.skills, args.only)
+
+    out = args.out or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{commit}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved results to {out}")
+    return out
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+# Timed benchmark scenarios.
+#
+# Each scenario runs inside a workspace directory laid out like the app's
+# working directory (see generators.build_corpus) and returns a dict of
+# named measurements. Scenarios run in registration order, so later ones
+# can rely on state set up by earlier ones (e.g. the partition migration).
+
+import os
+import time
+import json
+import statistics
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = []
+
+# Recruiter pages as (label, module, function)
+RECRUITER_PAGES = [
+    ("resume_review", "recruiter_dashboard", "show_parsed_resumes"),
+    ("invited_applicants", "view_interview_applicant", "show_invited_applicants"),
+    ("offered_applicants", "view_sent_offer_applicant", "show_offered_applicants"),
+    ("suspicious_resumes", "view_suspicious_resume", "view_suspicious_resume"),
+    ("candidate_comparison", "candidate_comparison", "candidate_comparison"),
+    ("saved_applicants", "view_saved_applicant", "show_saved_applicants"),
+    ("job_board", "job_listings", "job_board"),
+    ("analytics", "view_analytics", "show_analytics"),
+    ("export", "view_export", "show_export"),
+]
+
+
+def scenario(name, runs=5):
+    def decorator(func):
+        SCENARIOS.append((name, func, runs))
+        return func
+    return decorator
+
+
+def measure(func, runs=5, warmup=1):
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "runs": runs,
+        "min": round(min(timings), 6),
+        "median": round(statistics.median(timings), 6),
+        "max": round(max(timings), 6),
+    }
+
+
+def _tenant():
+    from benchmarks.generators import COMPANIES
+    return COMPANIES[0]
+
+
+def _resume(pages):
+    return os.path.join("resumes", f"synthetic_{pages}p.pdf")
+
+
+# --- Resume pipeline ---
+
+@scenario("extract_text_from_pdf")
+def bench_extract_text(runs):
+    from resume_parser import extract_text_from_pdf
+    return {f"{pages}p": measure(lambda: extract_text_from_pdf(_resume(pages)), runs) for pages in (1, 5, 20)}
+
+
+@scenario("parse_resume")
+def bench_parse_resume(runs):
+    # Full parse: layout lines, section split and the per-section extractors.
+    from resume_parser import parse_resume
+    return {f"{pages}p": measure(lambda: parse_resume(_resume(pages), f"bench-{pages}p"), runs) for pages in (1, 5, 20)}
+
+
+@scenario("ocr_cache")
+def bench_ocr_cache(runs):
+    # Image-only resume whose pages are already in the OCR cache: the cost a
+    # re-uploaded scan pays (page hashes plus one cache lookup).
+    import fitz
+    import resume_ocr
+    from resume_parser import extract_text_from_pdf
+    with fitz.open(_resume(1)) as src:
+        pixmap = src[0].get_pixmap(dpi=150)
+    path = os.path.join("resumes", "synthetic_scan_5p.pdf")
+    with fitz.open() as doc:
+        for _ in range(5):
+            page = doc.new_page()
+            page.insert_image(page.rect, pixmap=pixmap)
+        doc.save(path)
+    with fitz.open(path) as doc:
+        resume_ocr._store([(resume_ocr.page_hash(doc, page), "cached text", 0.0) for page in doc])
+    return {"5p_cached": measure(lambda: extract_text_from_pdf(path), runs)}
+
+
+@scenario("extract_skills", runs=3)
+def bench_extract_skills(runs):
+    import skill_matcher
+    from resume_parser import extract_text_from_pdf, extract_skills
+    with open("skills.json", encoding="utf-8") as f:
+        skills = json.load(f)
+    results = {}
+    for count in (100, 1000, len(skills)):
+        vocabulary = skills[:count]
+        results[f"{count}_skills_index_build"] = measure(lambda: skill_matcher.build_index(vocabulary), 1, warmup=0)
+        skill_matcher.get_index(vocabulary)
+        for pages in (1, 5, 20):
+            text = extract_text_from_pdf(_resume(pages))
+            results[f"{count}_skills_{pages}p"] = measure(lambda: extract_skills(text, vocabulary), runs)
+        results[f"{count}_skills_cached"] = measure(lambda: extract_skills(text, vocabulary, "bench-resume"), runs)
+    return results
+
+
+# --- Application storage ---
+
+@scenario("migrate_legacy_results", runs=1)
+def bench_migration(runs):
+    import application_store
+    start = time.perf_counter()
+    application_store.migrate_legacy_results()
+    elapsed = round(time.perf_counter() - start, 6)
+    return {"split": {"runs": 1, "min": elapsed, "median": elapsed, "max": elapsed}}
+
+
+@scenario("save_parsed_info")
+def bench_save_parsed_info(runs):
+    from application_store import save_parsed_info
+    counter = iter(range(10 ** 9))
+
+    def save():
+        save_parsed_info({
+            "name": "Bench Applicant", "email": f"bench{next(counter)}@example.com", "phone": "",
+            "skills": "Python, SQL", "education_level": "Bachelor's", "experience": "",
+            "filename": "bench.pdf", "status": "Applied", "interview_date": "", "interview_time": "",
+            "saved": False, "company": _tenant(), "job_id": "bench-job", "job_title": "Bench",
+            "application_date": "2025-01-01 00:00:00"
+        })
+    return {"append": measure(save, runs)}
+
+
+@scenario("is_duplicate_application")
+def bench_is_duplicate(runs):
+    from application_store import is_duplicate_application
+    return {"lookup": measure(lambda: is_duplicate_application("nobody@example.com", "none", _tenant()), runs)}
+
+
+@scenario("saved_jobs")
+def bench_saved_jobs(runs):
+    import job_store
+    import saved_jobs
+    job_ids = [job["job_id"] for job in job_store.list_jobs()[:20]]
+    for applicant in range(1000):
+        for job_id in job_ids[:5]:
+            saved_jobs.save_job(f"bench-{applicant}", job_id)
+    counter = iter(range(10 ** 9))
+    return {
+        "save": measure(lambda: saved_jobs.save_job("bench-applicant", job_ids[next(counter) % len(job_ids)]), runs),
+        "load_5_saved": measure(lambda: saved_jobs.load_saved_jobs("bench-1"), runs),
+    }
+
+
+@scenario("status_views")
+def bench_status_views(runs):
+    import application_status
+    from application_status import Status
+    results = {"backfill": measure(application_status._ensure_ready, 1, warmup=0)}
+    for status in (Status.INTERVIEW_INVITED, Status.OFFER_SENT):
+        results[status.name.lower()] = measure(lambda: application_status.list_by_status(_tenant(), status), runs)
+    application_id = application_status.list_by_status(_tenant(), Status.APPLIED)[0]["application_id"]
+    results["history"] = measure(lambda: application_status.history(application_id), runs)
+    return results
+
+
+@scenario("status_lookup")
+def bench_status_lookup(runs):
+    import application_status
+    from application_status import Status
+    email = application_status.list_by_status(_tenant(), Status.APPLIED)[0]["email"]
+    return {
+        "by_email": measure(lambda: application_status.lookup_applications(f"  {email.upper()} "), runs),
+        "unknown_email": measure(lambda: application_status.lookup_applications("nobody@example.com"), runs),
+    }
+
+
+@scenario("analytics_rollup")
+def bench_analytics_rollup(runs):
+    from datetime import date
+    import application_status
+    from view_analytics import rollup
+    results = {
+        "backfill": measure(application_status._ensure_ready, 1, warmup=0),
+        "rebuild_counters": measure(application_status.rebuild_counters, 1, warmup=0),
+    }
+    end = date.today()
+    rows = application_status.load_counters(_tenant(), "", end.isoformat())
+    start = min(date.fromisoformat(r["day"]) for r in rows)
+
+    def load_and_rollup():
+        rollup(application_status.load_counters(_tenant(), "", end.isoformat()), start, (end - start).days + 1)
+    results[f"all_time_{len(rows)}_counter_rows"] = measure(load_and_rollup, runs)
+    return results
+
+
+@scenario("candidate_scoring")
+def bench_candidate_scoring(runs):
+    import application_store
+    from candidate_comparison import compute_score
+    df = application_store.load_applications(_tenant())
+    reference_skills = {"python", "sql", "java"}
+    return {
+        f"{len(df)}_candidates": measure(lambda: df.apply(compute_score, axis=1, args=(reference_skills,)), runs)
+    }
+
+
+@scenario("suggest_candidates")
+def bench_suggest_candidates(runs):
+    import job_store
+    import recommender
+    job_id = job_store.list_jobs(_tenant())[0]["job_id"]
+    results = {"cold_build": measure(lambda: recommender.suggest_candidates(_tenant(), job_id), 1, warmup=0)}
+    results["top_10"] = measure(lambda: recommender.suggest_candidates(_tenant(), job_id), runs)
+    return results
+
+
+@scenario("recommend_jobs")
+def bench_recommend_jobs(runs):
+    import recommender
+    skills = ["Python", "SQL", "Docker", "React", "Git"]
+    results = {"cold_build": measure(lambda: recommender.recommend_jobs(skills, today="2025-01-15"), 1, warmup=0)}
+    results["uncached"] = measure(lambda: recommender.recommend_jobs(skills, today="2025-01-15"), runs)
+    results["cached"] = measure(lambda: recommender.recommend_jobs(skills, resume_hash="bench", today="2025-01-15"), runs)
+    return results
+
+
+# --- Recruiter pages ---
+
+def _page_script(repo_root, module, function):
+    import sys
+    import importlib
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    getattr(importlib.import_module(module), function)()
+
+
+@scenario("recruiter_page_load", runs=3)
+def bench_recruiter_pages(runs):
+    from streamlit.testing.v1 import AppTest
+    results = {}
+    for label, module, function in RECRUITER_PAGES:
+        at = AppTest.from_function(_page_script, args=(REPO_ROOT, module, function), default_timeout=600)
+        at.secrets["SENDER_EMAIL_ADDRESS"] = ""
+        at.secrets["SENDER_EMAIL_PASSWORD"] = ""
+        at.secrets["COMPANY_NAME"] = _tenant()
+        results[label] = measure(at.run, runs)
+    return results
+
+
+# --- Startup ---
+
+@scenario("entry_point_import", runs=3)
+def bench_entry_point_import(runs):
+    from benchmarks.check_import_budget import ENTRY_POINTS, measure_import
+    results = {}
+    for module in ENTRY_POINTS:
+        seconds = round(measure_import(module, runs)["seconds"], 6)
+        results[module] = {"runs": runs, "min": seconds, "median": seconds, "max": seconds}
+    return results
@@ -1,16 +1,48 @@
 import streamlit as st
 import pandas as pd
 import re
-
+import application_store
+import job_store
+from metrics import timed
+from tenancy import current_company
+
+# --- Education level scoring map ---
+EDUCATION_SCORE_MAP = {
+    "PhD": 3,
+    "Master's Degree": 2,
+    "Bachelor's Degree": 1,
+    "Diploma": 0.5,
+    "High School": 0.2
+}
+
+# --- Scoring function ---
+def compute_score(row, reference_skills):
+    education = str(row['education_level']).strip().title()
+    education_score = EDUCATION_SCORE_MAP.get(education, 0)
+
+    experience_years = 0
+    if isinstance(row['experience'], str):
+        match = re.search(r'(\d+)', row['experience'])
+        if match:
+            experience_years = int(match.group(1))
+    experience_score = min(experience_years / 3, 1)  # max 1 for 3+ years
+
+    candidate_skills = set()
+    if pd.notna(row['skills']):
+        candidate_skills = set(map(str.strip, str(row['skills']).lower().split(',')))
+    matched_skills = candidate_skills & reference_skills
+    skill_score = len(matched_skills) / len(reference_skills) if reference_skills else 0
+
+    total_score = (0.2 * education_score) + (0.2 * experience_score) + (0.6 * skill_score)
+    return round(total_score * 100, 2)
+
+@timed("page.candidate_comparison")
 def candidate_comparison():
-    # --- Load candidate data ---
-    df = pd.read_csv("parsed_data/results.csv")
-
     st.title("📊 Candidate Comparison")
 
-    # --- Filter only jobs from company "IT Tech SDN BHD" ---
-    company_name = "IT Tech SDN BHD"
-    company_jobs_df = df[df['company'] == company_name]
+    # --- Load candidate data for the recruiter's company only ---
+    company_name = current_company()
+    company_jobs_df = application_store.application_table(company_name)
 
     if company_jobs_df.empty:
         st.error(f"No job listings found for company '{company_name}'.")
@@ -24,57 +56,16 @@ def candidate_comparison():
     selected_job_id = title_to_id[selected_job_title]
 
     # --- Load job metadata ---
-    try:
-        job_data = pd.read_csv("jobs_data.csv")  # Path may vary depending on deployment
-    except Exception as e:
-        st.error(f"Failed to load job data: {e}")
-        st.stop()
-
-    # --- Get required skills for selected job ---
-    if 'requirements' not in job_data.columns:
-        st.error("`required_skills` column is missing in jobs_data.csv.")
-        st.stop()
-
-    job_row = job_data[job_data['job_id'] == selected_job_id]
-    if job_row.empty:
+    job_row = job_store.get_job(selected_job_id)
+    if job_row is None:
         st.warning("No matching job found in jobs_data.csv.")
         st.stop()
 
-    raw_skills = job_row.iloc[0]['requirements']
+    raw_skills = job_row['requirements']
     reference_skills = set(map(str.strip, str(raw_skills).lower().split(',')))
 
     st.markdown(f"**🧩 Job-Specific Reference Skills:** `{', '.join(reference_skills)}`")
 
-    # --- Education level scoring map ---
-    education_score_map = {
-        "PhD": 3,
-        "Master's Degree": 2,
-        "Bachelor's Degree": 1,
-        "Diploma": 0.5,
-        "High School": 0.2
-    }
-
-    # --- Scoring function ---
-    def compute_score(row):
-        education = str(row['education_level']).strip().title()
-        education_score = education_score_map.get(education, 0)
-
-        experience_years = 0
-        if isinstance(row['experience'], str):
-            match = re.search(r'(\d+)', row['experience'])
-            if match:
-                experience_years = int(match.group(1))
-        experience_score = min(experience_years / 3, 1)  # max 1 for 3+ years
-
-        candidate_skills = set()
-        if pd.notna(row['skills']):
-            candidate_skills = set(map(str.strip, str(row['skills']).lower().split(',')))
-        matched_skills = candidate_skills & reference_skills
-        skill_score = len(matched_skills) / len(reference_skills) if reference_skills else 0
-
-        total_score = (0.2 * education_score) + (0.2 * experience_score) + (0.6 * skill_score)
-        return round(total_score * 100, 2)
-
     # --- Filter candidates for selected job ID ---
     candidates = company_jobs_df[company_jobs_df['job_id'] == selected_job_id].copy()
 
@@ -101,7 +92,7 @@ def candidate_comparison():
 
     # --- Filter and score selected candidates ---
     selected_df = candidates[candidates['name'].isin(selected_candidates)].copy()
-    selected_df['score'] = selected_df.apply(compute_score, axis=1)
+    selected_df['score'] = selected_df.apply(compute_score, axis=1, args=(reference_skills,))
     selected_df = selected_df.sort_values(by="score", ascending=False)
 
     # --- Display the two candidates side by side ---
@@ -0,0 +1,263 @@
+import os
+import json
+import time
+import queue
+import socket
+import inspect
+import threading
+from functools import wraps
+
+# --- Constants ---
+SERVICE_SOCKET = os.environ.get("DATA_SERVICE_SOCKET")     # unix socket of the data service; unset = in-process
+POOL_SIZE = int(os.environ.get("DATA_SERVICE_POOL", "4"))  # connections per Streamlit process
+CALL_TIMEOUT = 60            # seconds to wait for a reply or a free pooled connection
+RECONNECT_DELAY = 1.0        # seconds between attempts to reach the service
+
+# With several Streamlit processes on one host, every write to the shared
+# stores (application partitions, the job log, the lifecycle archiver) goes
+# through one local service so they are applied one at a time instead of
+# racing on the same files. Store functions opt in with @service_method: in
+# a Streamlit process with DATA_SERVICE_SOCKET set the call is sent to the
+# service over a pooled unix-socket connection (one JSON object per line);
+# in the service, or when no socket is configured, it runs in-process.
+# Reads stay local: every process reads the files directly.
+#
+# After a write the service broadcasts a change event (topic and key, e.g.
+# "applications" / company) to every subscribed process, and each process
+# runs the callbacks registered with on_change() to drop its caches. A
+# process that loses the subscription invalidates everything on reconnect,
+# since it may have missed events. Run the service with:
+#
+#   DATA_SERVICE_SOCKET=parsed_data/data.sock python data_service.py
+
+_methods = {}        # name -> (function, topic, key)
+_callbacks = {}      # topic -> [callback(key)]
+_serving = False
+_pool = queue.LifoQueue()
+_pool_lock = threading.Lock()
+_open_connections = 0
+_listener = None
+
+# --- Registration ---
+
+def remote():
+    # True when calls go to the service rather than running here.
+    return bool(SERVICE_SOCKET) and not _serving
+
+def service_method(name, topic=None, key=None):
+    # key: function of the call's bound arguments giving the event key.
+    def decorator(func):
+        signature = inspect.signature(func)
+        _methods[name] = (func, topic, key)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if remote():
+                return call(name, *args, **kwargs)
+            result = func(*args, **kwargs)
+            if topic and not _serving:
+                # In-process deployment: only this process has caches to drop.
+                _run_callbacks(topic, key(signature.bind(*args, **kwargs).arguments) if key else None)
+            return result
+        return wrapper
+    return decorator
+
+def on_change(topic, callback):
+    _callbacks.setdefault(topic, []).append(callback)
+    if remote():
+        _start_listener()
+
+def notify(topic, key=None):
+    # Announces a change made outside a service method.
+    if remote():
+        call("notify", topic, key)
+    elif _serving:
+        _server_publish(topic, key)
+    else:
+        _run_callbacks(topic, key)
+
+def _run_callbacks(topic, key):
+    for callback in _callbacks.get(topic, []):
+        try:
+            callback(key)
+        except Exception:
+            pass
+
+# --- Client ---
+
+class _Connection:
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(CALL_TIMEOUT)
+        self.sock.connect(SERVICE_SOCKET)
+        self.file = self.sock.makefile("rwb")
+
+    def request(self, message):
+        self.file.write(json.dumps(message, default=str).encode("utf-8") + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Data service closed the connection.")
+        return json.loads(line)
+
+    def close(self):
+        try:
+            self.file.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+def _checkout():
+    global _open_connections
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+    with _pool_lock:
+        create = _open_connections < POOL_SIZE
+        if create:
+            _open_connections += 1
+    if not create:
+        try:
+            return _pool.get(timeout=CALL_TIMEOUT)
+        except queue.Empty:
+            raise TimeoutError("No data service connection became free.") from None
+    try:
+        return _Connection()
+    except OSError:
+        _discard(None)
+        raise
+
+def _discard(connection):
+    global _open_connections
+    if connection is not None:
+        connection.close()
+    with _pool_lock:
+        _open_connections -= 1
+
+def call(method, *args, **kwargs):
+    connection = _checkout()
+    try:
+        reply = connection.request({"method": method, "args": args, "kwargs": kwargs})
+    except (OSError, ValueError):
+        _discard(connection)
+        raise
+    _pool.put(connection)
+    if "error" in reply:
+        error = reply["error"]
+        raise (ValueError if error["type"] == "ValueError" else RuntimeError)(error["message"])
+    return reply.get("result")
+
+def _listen():
+    while True:
+        try:
+            connection = _Connection()
+            connection.sock.settimeout(None)
+            connection.file.write(b'{"method": "subscribe"}\n')
+            connection.file.flush()
+            for topic in list(_callbacks):
+                _run_callbacks(topic, None)   # events may have been missed while disconnected
+            for line in connection.file:
+                event = json.loads(line)
+                _run_callbacks(event["topic"], event.get("key"))
+        except (OSError, ValueError):
+            pass
+        time.sleep(RECONNECT_DELAY)
+
+def _start_listener():
+    global _listener
+    with _pool_lock:
+        if _listener is None:
+            _listener = threading.Thread(target=_listen, name="data-service-events", daemon=True)
+            _listener.start()
+
+# --- Service ---
+
+_subscribers = set()
+_loop = None
+
+def _server_publish(topic, key):
+    # Store code calling notify() runs on the worker thread; the subscriber
+    # streams belong to the event loop.
+    if threading.current_thread() is not threading.main_thread():
+        _loop.call_soon_threadsafe(_server_publish, topic, key)
+        return
+    _run_callbacks(topic, key)
+    line = json.dumps({"topic": topic, "key": key, "at": time.time()}, default=str).encode("utf-8") + b"\n"
+    for writer in list(_subscribers):
+        try:
+            writer.write(line)
+        except Exception:
+            _subscribers.discard(writer)
+
+async def _handle(reader, writer, executor):
+    import asyncio
+    try:
+        while line := await reader.readline():
+            message = json.loads(line)
+            method = message.get("method")
+            if method == "subscribe":
+                _subscribers.add(writer)
+                await reader.read()    # held open until the client goes away
+                break
+            if method == "notify":
+                _server_publish(*message["args"])
+                reply = {"result": None}
+            elif method not in _methods:
+                reply = {"error": {"type": "ValueError", "message": f"Unknown method: {method}"}}
+            else:
+                func, topic, key = _methods[method]
+                args, kwargs = message.get("args", []), message.get("kwargs", {})
+                try:
+                    result = await asyncio.get_running_loop().run_in_executor(executor, lambda: func(*args, **kwargs))
+                    reply = {"result": result}
+                    if topic:
+                        bound = inspect.signature(func).bind(*args, **kwargs).arguments
+                        _server_publish(topic, key(bound) if key else None)
+                except Exception as e:
+                    reply = {"error": {"type": type(e).__name__, "message": str(e)}}
+            writer.write(json.dumps(reply, default=str).encode("utf-8") + b"\n")
+            await writer.drain()
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        _subscribers.discard(writer)
+        writer.close()
+
+def serve(path=None):
+    # Runs the service until interrupted. Every store call runs on one worker
+    # thread, so writes are applied strictly one after another. Job expiry
+    # runs here too, on its own thread; it holds the partition lock of each
+    # company it rewrites (application_store.partition_lock).
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    global _serving
+    _serving = True
+    path = path or SERVICE_SOCKET or "parsed_data/data.sock"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    import application_store, job_store, job_lifecycle   # registers their service methods
+    import lifecycle_scheduler
+
+    async def main():
+        global _loop
+        _loop = asyncio.get_running_loop()
+        lifecycle_scheduler.start_scheduler()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-service")
+        server = await asyncio.start_unix_server(lambda r, w: _handle(r, w, executor), path=path)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+if __name__ == "__main__":
+    import data_service   # the stores register with the importable module, not __main__
+    try:
+        data_service.serve()
+    except KeyboardInterrupt:
+        pass
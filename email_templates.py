@@ -0,0 +1,72 @@
+import os
+import threading
+import data_service
+from application_store import company_slug
+
+# --- Constants ---
+TEMPLATE_DIR = "templates/email"
+COMPANY_TEMPLATE_DIR = os.path.join(TEMPLATE_DIR, "companies")
+
+# Email bodies are Jinja2 templates; the first line of each is
+# "Subject: ...". A company can override any template by dropping a file of
+# the same name into templates/email/companies/<company slug>/. Each
+# company gets one Environment whose loader searches its override folder
+# first, and Jinja2 compiles every template once and keeps it in the
+# environment's cache for the life of the process.
+
+_lock = threading.Lock()
+_environments = {}   # company slug -> jinja2.Environment
+
+def _environment(company):
+    slug = company_slug(company) if company else None
+    with _lock:
+        env = _environments.get(slug)
+        if env is None:
+            import jinja2
+            search_path = [TEMPLATE_DIR]
+            if slug:
+                search_path.insert(0, os.path.join(COMPANY_TEMPLATE_DIR, slug))
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(search_path),
+                undefined=jinja2.StrictUndefined,
+                auto_reload=False,
+                keep_trailing_newline=True,
+            )
+            _environments[slug] = env
+    return env
+
+def _split(text):
+    first_line, _, body = text.partition("\n")
+    if not first_line.startswith("Subject:"):
+        raise ValueError("Email templates must start with a 'Subject:' line.")
+    return first_line[len("Subject:"):].strip(), body
+
+def applicant_context(row, **extra):
+    # Template variables for an application row (dict or pandas Series).
+    context = {}
+    for field in ("name", "email", "job_title"):
+        value = row.get(field)
+        context[field] = value if isinstance(value, str) else ""
+    context.update(extra)
+    return context
+
+def render(template_name, company=None, /, **context):
+    # Returns (subject, body) for templates/email/<template_name>.txt.
+    template = _environment(company).get_template(f"{template_name}.txt")
+    return _split(template.render(company=company, **context))
+
+def render_batch(template_name, company, contexts):
+    # Renders one template for many recipients; the template is looked up once.
+    template = _environment(company).get_template(f"{template_name}.txt")
+    return [_split(template.render(company=company, **context)) for context in contexts]
+
+def clear_cache():
+    # Drops compiled templates in every process, e.g. after a company uploads
+    # a new override.
+    data_service.notify("templates")
+
+def _drop_environments(key=None):
+    with _lock:
+        _environments.clear()
+
+data_service.on_change("templates", _drop_environments)
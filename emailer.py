@@ -0,0 +1,90 @@
+import os
+from metrics import timed
+
+# --- Constants ---
+SMTP_SERVER = "smtp.gmail.com"
+SMTP_PORT = 465
+BATCH_SIZE = 50                      # messages sent per SMTP login
+MAILDIR = "parsed_data/maildir"
+DRY_RUN = os.environ.get("EMAIL_DRY_RUN", "0") == "1"
+
+# smtplib and email.mime are only imported when a message is actually sent,
+# so pages that never send mail don't pay for them at startup. With
+# EMAIL_DRY_RUN=1 nothing goes over SMTP: every message is delivered to the
+# local maildir instead, where it can be opened with any mail client.
+
+def sender_account():
+    import streamlit as st
+    return st.secrets["SENDER_EMAIL_ADDRESS"], st.secrets["SENDER_EMAIL_PASSWORD"]
+
+def _ics_method(content):
+    # The Content-Type method must match the calendar's own METHOD line
+    # (REQUEST for an invite, CANCEL for a cancellation).
+    for line in content.splitlines():
+        if line.upper().startswith("METHOD:"):
+            return line.split(":", 1)[1].strip().upper()
+    return "PUBLISH"   # RFC 5545 default for a calendar without METHOD
+
+def build_message(to_email, subject, body, sender_email, attachments=None):
+    # attachments: optional list of (filename, text content, mime type), e.g. an .ics invite.
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
+    msg = MIMEMultipart()
+    msg["From"] = sender_email
+    msg["To"] = to_email
+    msg["Subject"] = subject
+    msg.attach(MIMEText(body, "plain"))
+    for filename, content, mime_type in attachments or []:
+        maintype, subtype = mime_type.split("/", 1)
+        part = MIMEText(content, subtype, "utf-8")
+        if subtype == "calendar":
+            part.set_param("method", _ics_method(content))
+        part.add_header("Content-Disposition", "attachment", filename=filename)
+        msg.attach(part)
+    return msg
+
+def _deliver_to_maildir(messages):
+    import mailbox
+    os.makedirs(os.path.dirname(MAILDIR), exist_ok=True)
+    box = mailbox.Maildir(MAILDIR, create=True)
+    for msg in messages:
+        box.add(msg)
+
+@timed("recruiter.send_messages")
+def send_messages(messages, smtp_server=SMTP_SERVER, smtp_port=SMTP_PORT,
+                  sender_email=None, sender_password=None, batch_size=BATCH_SIZE, dry_run=None):
+    # messages: list of (to_email, subject, body, attachments). Sends them in
+    # batches over one SMTP login each and returns [(to_email, error)] for the
+    # ones that failed; a failed batch login fails every message in it.
+    import smtplib
+
+    if sender_email is None:
+        sender_email, sender_password = sender_account()
+    built = [(m[0], build_message(m[0], m[1], m[2], sender_email, m[3] if len(m) > 3 else None)) for m in messages]
+    if DRY_RUN if dry_run is None else dry_run:
+        _deliver_to_maildir([msg for _, msg in built])
+        return []
+
+    failures = []
+    for start in range(0, len(built), batch_size):
+        batch = built[start:start + batch_size]
+        try:
+            with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
+                server.login(sender_email, sender_password)
+                for to_email, msg in batch:
+                    try:
+                        server.send_message(msg)
+                    except smtplib.SMTPException as e:
+                        failures.append((to_email, str(e)))
+        except Exception as e:
+            failures.extend((to_email, str(e)) for to_email, _ in batch)
+    return failures
+
+@timed("recruiter.send_email")
+def send_email(to_email, subject, body, smtp_server=SMTP_SERVER, smtp_port=SMTP_PORT,
+               sender_email=None, sender_password=None, attachments=None):
+    failures = send_messages([(to_email, subject, body, attachments)], smtp_server, smtp_port,
+                             sender_email, sender_password)
+    if failures:
+        raise RuntimeError(failures[0][1])
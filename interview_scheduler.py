@@ -0,0 +1,355 @@
+import os
+import time
+import uuid
+import bisect
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from metrics import timed
+
+# --- Constants ---
+SCHEDULE_DB = "parsed_data/interviews.db"
+INTERVIEW_MINUTES = 60
+WORKDAY_START = 9        # first interview may start at 09:00
+WORKDAY_END = 17         # last interview must end by 17:00
+WORKDAYS = {0, 1, 2, 3, 4}
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Bookings live in sqlite; every process also keeps an interval index per
+# (company, recruiter): parallel sorted lists of start / end times of the
+# booked, non-overlapping slots. A conflict check is one bisect on the
+# starts plus a look at the two neighbours, so it stays O(log n) however
+# many interviews are booked. Every insert or cancel stamps the row with the
+# next value of a global seq counter, so an index catches up with other
+# processes by reading only the rows whose seq is newer than its own.
+# Booking an application that already has an upcoming interview reschedules
+# it: the old booking is cancelled in the same transaction and returned
+# under "replaced", so the invite can carry a cancellation for the old slot.
+
+_lock = threading.Lock()
+_indexes = {}    # (company, recruiter) -> {"starts", "ends", "ids", "seq"}
+
+# --- Storage ---
+
+def _connect():
+    os.makedirs(os.path.dirname(SCHEDULE_DB), exist_ok=True)
+    conn = sqlite3.connect(SCHEDULE_DB, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS bookings (
+            booking_id TEXT PRIMARY KEY,
+            company TEXT NOT NULL,
+            recruiter TEXT NOT NULL,
+            application_id TEXT,
+            name TEXT,
+            email TEXT,
+            job_title TEXT,
+            start TEXT NOT NULL,
+            end TEXT NOT NULL,
+            cancelled INTEGER NOT NULL DEFAULT 0,
+            seq INTEGER NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_seq ON bookings (company, recruiter, seq)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_start ON bookings (company, recruiter, start)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_global_seq ON bookings (seq)")
+    return conn
+
+def _next_seq(conn):
+    return conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM bookings").fetchone()[0]
+
+# --- Interval Index ---
+
+def _parse(value):
+    return datetime.strptime(value, DATETIME_FORMAT)
+
+def _index_for(company, recruiter):
+    key = (company, recruiter)
+    if key not in _indexes:
+        _indexes[key] = {"starts": [], "ends": [], "ids": [], "seq": 0}
+    return _indexes[key]
+
+def _index_insert(index, start, end, booking_id):
+    i = bisect.bisect_left(index["starts"], start)
+    index["starts"].insert(i, start)
+    index["ends"].insert(i, end)
+    index["ids"].insert(i, booking_id)
+
+def _index_remove(index, start, booking_id):
+    i = bisect.bisect_left(index["starts"], start)
+    while i < len(index["ids"]) and index["starts"][i] == start:
+        if index["ids"][i] == booking_id:
+            del index["starts"][i], index["ends"][i], index["ids"][i]
+            return
+        i += 1
+
+def _refresh(conn, company, recruiter):
+    index = _index_for(company, recruiter)
+    rows = conn.execute(
+        "SELECT booking_id, start, end, cancelled, seq FROM bookings "
+        "WHERE company = ? AND recruiter = ? AND seq > ? ORDER BY seq",
+        (company, recruiter, index["seq"])
+    ).fetchall()
+    for row in rows:
+        start = _parse(row["start"])
+        _index_remove(index, start, row["booking_id"])
+        if not row["cancelled"]:
+            _index_insert(index, start, _parse(row["end"]), row["booking_id"])
+        index["seq"] = row["seq"]
+    return index
+
+def _conflict_position(index, start, end):
+    i = bisect.bisect_left(index["starts"], start)
+    if i > 0 and index["ends"][i - 1] > start:
+        return i - 1
+    if i < len(index["starts"]) and index["starts"][i] < end:
+        return i
+    return None
+
+def find_conflict(index, start, end):
+    # Returns the booking_id overlapping [start, end), or None.
+    i = _conflict_position(index, start, end)
+    return None if i is None else index["ids"][i]
+
+def _next_free(index, after, duration):
+    # Earliest slot of the given length inside working hours, starting on a
+    # duration-aligned boundary at or after `after`.
+    minutes = int(duration.total_seconds() // 60)
+    start = after.replace(second=0, microsecond=0)
+    offset = (start.hour * 60 + start.minute) % minutes
+    if offset:
+        start += timedelta(minutes=minutes - offset)
+    while True:
+        day_start = start.replace(hour=WORKDAY_START, minute=0)
+        day_end = start.replace(hour=WORKDAY_END, minute=0)
+        if start.weekday() not in WORKDAYS or start + duration > day_end:
+            start = (start + timedelta(days=1)).replace(hour=WORKDAY_START, minute=0)
+            continue
+        if start < day_start:
+            start = day_start
+            continue
+        i = _conflict_position(index, start, start + duration)
+        if i is None:
+            return start
+        # Jump straight past the booking in the way (rounded up to the grid).
+        start = index["ends"][i]
+        offset = (start.hour * 60 + start.minute) % minutes
+        if offset:
+            start += timedelta(minutes=minutes - offset)
+
+# --- Booking ---
+
+def _insert(conn, index, company, recruiter, application, start, end):
+    booking = {
+        "booking_id": str(uuid.uuid4()),
+        "company": company,
+        "recruiter": recruiter,
+        "application_id": application.get("application_id"),
+        "name": application.get("name"),
+        "email": application.get("email"),
+        "job_title": application.get("job_title"),
+        "start": start.strftime(DATETIME_FORMAT),
+        "end": end.strftime(DATETIME_FORMAT),
+        "cancelled": 0,
+        "seq": _next_seq(conn),
+        "created_at": time.time(),
+    }
+    conn.execute(
+        f"INSERT INTO bookings ({', '.join(booking)}) VALUES ({', '.join('?' * len(booking))})",
+        list(booking.values())
+    )
+    _index_insert(index, start, end, booking["booking_id"])
+    index["seq"] = booking["seq"]
+    return booking
+
+def _cancel_upcoming(conn, application_id):
+    # Cancels the application's bookings that have not started yet and
+    # returns them.
+    if not application_id:
+        return []
+    replaced = [dict(row) for row in conn.execute(
+        "SELECT * FROM bookings WHERE application_id = ? AND cancelled = 0 AND start >= ? ORDER BY start",
+        (application_id, datetime.now().strftime(DATETIME_FORMAT))
+    )]
+    for booking in replaced:
+        conn.execute("UPDATE bookings SET cancelled = 1, seq = ? WHERE booking_id = ?",
+                     (_next_seq(conn), booking["booking_id"]))
+    return replaced
+
+def _undo(index, bookings, synced_seq, replaced=()):
+    # Drops rolled-back bookings from the index, puts back the ones whose
+    # cancellation was rolled back, and rewinds its seq so the numbers they
+    # used are read again if another process commits them.
+    for booking in bookings:
+        _index_remove(index, _parse(booking["start"]), booking["booking_id"])
+    for booking in replaced:
+        if _indexes.get((booking["company"], booking["recruiter"])) is index:
+            _index_remove(index, _parse(booking["start"]), booking["booking_id"])
+            _index_insert(index, _parse(booking["start"]), _parse(booking["end"]), booking["booking_id"])
+    index["seq"] = synced_seq
+
+@timed("scheduler.book")
+def book(company, recruiter, application, start, minutes=INTERVIEW_MINUTES):
+    # Books one interview at a recruiter-chosen time; raises ValueError when
+    # it overlaps an existing booking of the same recruiter. An upcoming
+    # booking of the same application is cancelled (see above).
+    end = start + timedelta(minutes=minutes)
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            index = _refresh(conn, company, recruiter)
+            synced_seq, booking, replaced = index["seq"], None, []
+            try:
+                replaced = _cancel_upcoming(conn, application.get("application_id"))
+                if replaced:
+                    _refresh(conn, company, recruiter)   # frees the old slot in this recruiter's index
+                conflict = find_conflict(index, start, end)
+                if conflict is not None:
+                    row = conn.execute("SELECT name, start, end FROM bookings WHERE booking_id = ?", (conflict,)).fetchone()
+                    raise ValueError(
+                        f"{start:%d %b %H:%M} overlaps the interview with {row['name']} "
+                        f"({row['start'][11:16]}-{row['end'][11:16]}). "
+                        f"Next free slot: {_next_free(index, start, end - start):%A %d %b %H:%M}."
+                    )
+                booking = _insert(conn, index, company, recruiter, application, start, end)
+                booking["replaced"] = replaced
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                _undo(index, [booking] if booking else [], synced_seq, replaced)
+                raise
+        finally:
+            conn.close()
+    return booking
+
+@timed("scheduler.schedule_batch")
+def schedule_batch(company, recruiter, applications, start_after=None, minutes=INTERVIEW_MINUTES):
+    # Assigns each application the next free slot, in order, in one transaction.
+    duration = timedelta(minutes=minutes)
+    after = start_after or datetime.now()
+    bookings = []
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            index = _refresh(conn, company, recruiter)
+            synced_seq = index["seq"]
+            try:
+                for application in applications:
+                    start = _next_free(index, after, duration)
+                    bookings.append(_insert(conn, index, company, recruiter, application, start, start + duration))
+                    after = start + duration
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                _undo(index, bookings, synced_seq)
+                raise
+        finally:
+            conn.close()
+    return bookings
+
+def cancel(booking_id):
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE bookings SET cancelled = 1, seq = (SELECT COALESCE(MAX(seq), 0) + 1 FROM bookings) "
+                "WHERE booking_id = ?",
+                (booking_id,)
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+def revert(booking):
+    # Undoes book(): cancels the new booking and reinstates the ones it
+    # replaced, e.g. when the invite could not be sent. A replaced slot that
+    # has been booked by another interview meanwhile stays cancelled; those
+    # bookings are returned so the caller can report them.
+    conflicts, touched = [], set()
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("UPDATE bookings SET cancelled = 1, seq = ? WHERE booking_id = ?",
+                             (_next_seq(conn), booking["booking_id"]))
+                for old in booking.get("replaced", []):
+                    key = (old["company"], old["recruiter"])
+                    touched.add(key)
+                    index = _refresh(conn, *key)   # also frees the slot of the booking cancelled above
+                    if find_conflict(index, _parse(old["start"]), _parse(old["end"])) is not None:
+                        conflicts.append(old)
+                        continue
+                    conn.execute("UPDATE bookings SET cancelled = 0, seq = ? WHERE booking_id = ?",
+                                 (_next_seq(conn), old["booking_id"]))
+                    _refresh(conn, *key)   # the next replaced slot is checked against this one
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                for key in touched:
+                    _indexes.pop(key, None)   # rebuilt from the database on next use
+                raise
+        finally:
+            conn.close()
+    return conflicts
+
+def list_bookings(company, recruiter=None, start=None, end=None):
+    query = "SELECT * FROM bookings WHERE company = ? AND cancelled = 0"
+    params = [company]
+    if recruiter is not None:
+        query += " AND recruiter = ?"
+        params.append(recruiter)
+    if start is not None:
+        query += " AND start >= ?"
+        params.append(start.strftime(DATETIME_FORMAT))
+    if end is not None:
+        query += " AND start < ?"
+        params.append(end.strftime(DATETIME_FORMAT))
+    conn = _connect()
+    try:
+        return [dict(row) for row in conn.execute(query + " ORDER BY start", params)]
+    finally:
+        conn.close()
+
+# --- Calendar Export ---
+
+def _ics_escape(value):
+    return str(value or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def _ics_event(booking, summary, description, cancelled=False):
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{booking['booking_id']}",
+        f"SEQUENCE:{1 if cancelled else 0}",
+        f"DTSTAMP:{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}",
+        f"DTSTART:{_parse(booking['start']):%Y%m%dT%H%M%S}",
+        f"DTEND:{_parse(booking['end']):%Y%m%dT%H%M%S}",
+        f"SUMMARY:{_ics_escape(summary)}",
+        f"DESCRIPTION:{_ics_escape(description)}",
+        f"ORGANIZER:mailto:{booking['recruiter']}",
+        f"ATTENDEE;CN={_ics_escape(booking['name'])}:mailto:{booking['email']}",
+    ]
+    if cancelled:
+        lines.append("STATUS:CANCELLED")
+    return lines + ["END:VEVENT"]
+
+def ics_calendar(bookings, summary=None, description="", method="REQUEST"):
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//HackAttack Recruitment//Interviews//EN", f"METHOD:{method}"]
+    for booking in bookings:
+        title = summary or f"Interview: {booking.get('job_title') or 'position'} - {booking['name']}"
+        lines += _ics_event(booking, title, description, cancelled=method == "CANCEL")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+def ics_attachment(booking, summary=None, description=""):
+    return ("interview.ics", ics_calendar([booking], summary, description), "text/calendar")
+
+def ics_cancellation(booking, summary=None, description=""):
+    # Removes a replaced booking from the attendee's calendar (same UID).
+    return ("cancelled-interview.ics", ics_calendar([booking], summary, description, method="CANCEL"),
+            "text/calendar")
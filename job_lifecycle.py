@@ -0,0 +1,126 @@
+import os
+import pandas as pd
+import job_store
+import application_store
+import application_status
+import data_service
+from metrics import timed
+
+# --- Constants ---
+ARCHIVE_DIR = "parsed_data/archive"
+ARCHIVE_JOBS_FILE = "jobs.csv"
+
+# Jobs whose deadline has passed are moved, together with their
+# applications, out of the hot files (jobs_data.csv and the per-company
+# partitions) into archive partitions keyed by deadline month:
+#   parsed_data/archive/2025-05/jobs.csv
+#   parsed_data/archive/2025-05/companies/<company>/results.csv
+# Archives are written before anything is removed from the hot files and
+# de-duplicated on job_id / application_id, so an interrupted run is simply
+# finished by the next one. Archived applications still count as past
+# candidates: the recommender and the Saved Applicants page read them too.
+# With a data service running the whole run is
+# made by the service. lifecycle_scheduler.py runs expire_jobs in the
+# background.
+
+# --- Archive Partitions ---
+
+def archive_month(job):
+    deadline = str(job.get("deadline") or "")
+    return deadline[:7] if len(deadline) >= 7 else "undated"
+
+def archive_path(month, company=None):
+    if company is None:
+        return os.path.join(ARCHIVE_DIR, month, ARCHIVE_JOBS_FILE)
+    return os.path.join(
+        ARCHIVE_DIR, month, "companies", application_store.company_slug(company), application_store.PARTITION_FILE
+    )
+
+def _append_archive(path, df, id_column):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        df = pd.concat([pd.read_csv(path), df], ignore_index=True)
+        df = df.drop_duplicates(subset=id_column, keep="first")
+    tmp_path = path + ".tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+# --- Expiry ---
+
+def expired_jobs(today=None):
+    return [job for job in job_store.list_jobs() if not job_store.is_open(job, today)]
+
+@data_service.service_method("lifecycle.expire_jobs")
+@timed("lifecycle.expire_jobs")
+def expire_jobs(today=None):
+    expired = expired_jobs(today)
+    if not expired:
+        return 0
+
+    month_of = {job["job_id"]: archive_month(job) for job in expired}
+    jobs_df = pd.DataFrame(expired)
+    for month, part in jobs_df.groupby(jobs_df["job_id"].map(month_of)):
+        _append_archive(archive_path(month), part, "job_id")
+
+    for company in {job.get("company", "N/A") for job in expired}:
+        # Held from the read to the rewrite so an application submitted
+        # meanwhile is not overwritten by this snapshot.
+        with application_store.partition_lock(company):
+            df = application_store.load_applications(company)
+            if df.empty:
+                continue
+            moved = df["job_id"].isin(month_of)
+            if not moved.any():
+                continue
+            archived = df[moved]
+            for month, part in archived.groupby(archived["job_id"].map(month_of)):
+                _append_archive(archive_path(month, company), part, "application_id")
+            application_store.save_applications(company, df[~moved])
+        application_status.archive(archived["application_id"])
+        data_service.notify("applications", company)
+
+    for job in expired:
+        job_store.delete_job(job["job_id"])
+    job_store.compact()   # drop the tombstoned rows so the hot file only holds open jobs
+    data_service.notify("jobs")
+    return len(expired)
+
+# --- Archive Queries ---
+
+def list_archive_months():
+    if not os.path.isdir(ARCHIVE_DIR):
+        return []
+    return sorted(
+        (name for name in os.listdir(ARCHIVE_DIR) if os.path.exists(archive_path(name))),
+        reverse=True
+    )
+
+def load_archived_jobs(month, company=None):
+    path = archive_path(month)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=job_store.JOB_COLUMNS)
+    df = pd.read_csv(path)
+    if company is not None:
+        df = df[df["company"] == company]
+    return df
+
+def archived_application_paths(company):
+    # Every archive partition holding applications of company, newest month first.
+    paths = [archive_path(month, company) for month in list_archive_months()]
+    return [path for path in paths if os.path.exists(path)]
+
+def archived_application_table(company):
+    # All of company's archived applications, typed like application_table().
+    frames = [
+        pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+        for path in archived_application_paths(company)
+    ]
+    if not frames:
+        return application_store.compact_frame(pd.DataFrame(columns=application_store.RESULT_COLUMNS))
+    return application_store.compact_frame(pd.concat(frames, ignore_index=True))
+
+def load_archived_applications(month, company):
+    path = archive_path(month, company)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=application_store.RESULT_COLUMNS)
+    return pd.read_csv(path)
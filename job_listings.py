@@ -1,39 +1,31 @@
 import streamlit as st
-import pandas as pd
-import os
-import uuid
 from datetime import datetime
+import job_store
+import job_lifecycle
+import recommender
+from metrics import timed
+from tenancy import current_company
 
-CSV_FILE = "jobs_data.csv"
+PAGE_SIZES = [10, 25, 50]
+SORT_OPTIONS = {"Posted On": "posted_on", "Deadline": "deadline"}
 
 # ----------- Load and Save Functions ------------
 
-def load_jobs_csv():
-    if os.path.exists(CSV_FILE):
-        return pd.read_csv(CSV_FILE)
-    return pd.DataFrame(columns=[
-        "job_id", "title", "description", "location", "salary",
-        "job_type", "deadline", "posted_on", "requirements"
-    ])
-
-def save_jobs_csv(df):
-    df.to_csv(CSV_FILE, index=False)
-
+@timed("recruiter.post_job")
 def save_job(job_data):
-    df = load_jobs_csv()
     flat_data = job_data.copy()
     flat_data["requirements"] = "; ".join(job_data["requirements"])
-    flat_data["job_id"] = str(uuid.uuid4())  # always generate new job_id
-    df = pd.concat([df, pd.DataFrame([flat_data])], ignore_index=True)
-    save_jobs_csv(df)
+    job_id = job_store.add_job(flat_data)  # always generates a new job_id
+    recommender.sync_jobs()
+    return job_id
 
-def delete_job(index):
-    df = load_jobs_csv()
-    df = df.drop(index).reset_index(drop=True)
-    save_jobs_csv(df)
+@timed("recruiter.delete_job")
+def delete_job(job_id):
+    job_store.delete_job(job_id)
 
 # ----------- Post Job Form ------------
 
+@st.fragment
 def post_new_job():
     st.subheader("📌 Post a New Job")
 
@@ -76,7 +68,7 @@ def post_new_job():
 
     if st.button("➕ Add Requirement"):
         st.session_state.requirements.append("")
-        st.rerun()
+        st.rerun(scope="fragment")
 
     if submitted:
         valid_requirements = [r.strip() for r in st.session_state.requirements if r.strip()]
@@ -88,7 +80,7 @@ def post_new_job():
             job_data = {
                 "title": title,
                 "description": description,
-                "company": "IT Tech SDN BHD",
+                "company": current_company(),
                 "location": location,
                 "salary": f"${min_salary:,} - ${max_salary:,}",
                 "job_type": job_type,
@@ -107,52 +99,127 @@ def post_new_job():
                 if key in st.session_state:
                     del st.session_state[key]
             st.session_state.requirements = [""]
+            # Full rerun so the posted jobs list picks up the new posting.
             st.rerun()
 
 # ----------- Display Jobs ------------
 
+def paginate_jobs(sort_by="posted_on", descending=True, page=1, page_size=10):
+    jobs = job_store.sorted_jobs(sort_by, descending, company=current_company())
+    page_count = max(1, -(-len(jobs) // page_size))
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+    return jobs[start:start + page_size], page, page_count, len(jobs)
+
+def render_job(row):
+    job_id = row["job_id"]
+    with st.container():
+        st.markdown("----")
+        st.markdown(f"### {row['title']} ({row['job_type']})")
+        st.markdown(f"**📍 Location:** {row['location']}")
+        st.markdown(f"**💰 Salary:** {row['salary']}")
+        st.markdown(f"**🗓️ Deadline:** {row['deadline']}")
+        st.markdown(f"**🕒 Posted On:** {row['posted_on']}")
+
+        # Description and requirements are only expanded on demand
+        with st.expander("📝 Description & Requirements"):
+            st.markdown(row["description"])
+            if row.get("requirements"):
+                st.markdown("**📌 Requirements:**")
+                for req in str(row["requirements"]).split("; "):
+                    st.write(f"- {req}")
+
+        col1, col2 = st.columns(2)
+        if col1.button("🎯 Suggested Candidates", key=f"suggest_{job_id}"):
+            st.session_state.suggest_job_id = None if st.session_state.suggest_job_id == job_id else job_id
+        if col2.button("🗑️ Delete", key=f"delete_{job_id}"):
+            st.session_state.confirm_delete_job_id = job_id
+
+        if st.session_state.confirm_delete_job_id == job_id:
+            st.warning(f"Are you sure you want to delete **{row['title']}**?")
+            c1, c2 = st.columns([1, 1])
+            if c1.button("✅ Yes, Delete", key=f"confirm_{job_id}"):
+                delete_job(job_id)
+                st.session_state.confirm_delete_job_id = None
+                st.success("Job deleted.")
+                st.rerun(scope="fragment")
+            if c2.button("❌ Cancel", key=f"cancel_{job_id}"):
+                st.session_state.confirm_delete_job_id = None
+                st.rerun(scope="fragment")
+
+        if st.session_state.suggest_job_id == job_id:
+            show_suggested_candidates(job_id)
+
+def show_suggested_candidates(job_id):
+    suggestions = recommender.suggest_candidates(current_company(), job_id)
+    if not suggestions:
+        st.info("No past applicants match this job's requirements yet.")
+        return
+    st.markdown("**🎯 Suggested Candidates** (past applicants who have not applied to this job)")
+    for candidate in suggestions:
+        saved = "⭐ " if candidate["saved"] else ""
+        st.write(f"{saved}**{candidate['name']}** ({candidate['email']}) · match {candidate['score']}% · "
+                 f"{', '.join(candidate['matched_skills'])}")
+
+@st.fragment
 def display_jobs():
     st.subheader("📄 Posted Jobs")
-    df = load_jobs_csv()
 
-    if df.empty:
+    if "confirm_delete_job_id" not in st.session_state:
+        st.session_state.confirm_delete_job_id = None
+    if "suggest_job_id" not in st.session_state:
+        st.session_state.suggest_job_id = None
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+    sort_label = col1.selectbox("Sort by", list(SORT_OPTIONS), key="jobs_sort_by")
+    order = col2.radio("Order", ["Latest first", "Earliest first"], horizontal=True, key="jobs_order")
+    page_size = col3.selectbox("Per page", PAGE_SIZES, key="jobs_page_size")
+    page = st.session_state.get("jobs_page", 1)
+
+    jobs, page, page_count, total = paginate_jobs(
+        SORT_OPTIONS[sort_label], order == "Latest first", page, page_size
+    )
+    if total == 0:
         st.info("No jobs have been posted yet.")
         return
 
-    if "confirm_delete_index" not in st.session_state:
-        st.session_state.confirm_delete_index = None
-
-    for index, row in df[::-1].iterrows():
-        real_index = row.name
-        with st.container():
-            st.markdown("----")
-            st.markdown(f"### {row['title']} ({row['job_type']})")
-            st.markdown(f"**📍 Location:** {row['location']}")
-            st.markdown(f"**💰 Salary:** {row['salary']}")
-            st.markdown(f"**🗓️ Deadline:** {row['deadline']}")
-            st.markdown(f"**🕒 Posted On:** {row['posted_on']}")
-            st.markdown(f"**📝 Description:**\n{row['description']}")
-            if row.get("requirements"):
-                st.markdown("**📌 Requirements:**")
-                for req in str(row["requirements"]).split("; "):
-                    st.write(f"- {req}")
-
-            col1, col2 = st.columns(2)
-            if col2.button("🗑️ Delete", key=f"delete_{real_index}"):
-                st.session_state.confirm_delete_index = real_index
+    for row in jobs:
+        render_job(row)
+
+    st.markdown("----")
+    prev_col, info_col, next_col = st.columns([1, 2, 1])
+    if prev_col.button("⬅️ Previous", disabled=page <= 1, key="jobs_prev"):
+        st.session_state.jobs_page = page - 1
+        st.rerun(scope="fragment")
+    info_col.markdown(f"Page **{page}** of **{page_count}** · {total} jobs")
+    if next_col.button("Next ➡️", disabled=page >= page_count, key="jobs_next"):
+        st.session_state.jobs_page = page + 1
+        st.rerun(scope="fragment")
+
+# ----------- Archived Jobs ------------
+
+@st.fragment
+def archived_jobs():
+    st.subheader("🗄️ Archived Jobs")
+    months = job_lifecycle.list_archive_months()
+    if not months:
+        st.caption("Jobs are archived with their applications once their deadline has passed.")
+        return
 
-            if st.session_state.confirm_delete_index == real_index:
-                st.warning(f"Are you sure you want to delete **{row['title']}**?")
-                c1, c2 = st.columns([1, 1])
-                if c1.button("✅ Yes, Delete", key=f"confirm_{real_index}"):
-                    delete_job(real_index)
-                    st.session_state.confirm_delete_index = None
-                    st.success("Job deleted.")
-                    st.rerun()
-                if c2.button("❌ Cancel", key=f"cancel_{real_index}"):
-                    st.session_state.confirm_delete_index = None
+    month = st.selectbox("Deadline month", ["Select a month"] + months, key="archive_month")
+    if month == "Select a month":
+        return
 
-            st.markdown("----")
+    company = current_company()
+    jobs = job_lifecycle.load_archived_jobs(month, company)
+    if jobs.empty:
+        st.info("No archived jobs for this month.")
+        return
+    st.dataframe(jobs[["title", "job_type", "location", "deadline", "posted_on", "job_id"]], hide_index=True)
+    applications = job_lifecycle.load_archived_applications(month, company)
+    st.markdown(f"**{len(applications)}** archived applications")
+    if not applications.empty:
+        st.dataframe(applications[["name", "email", "status", "job_title", "application_date"]], hide_index=True)
 
 # ----------- Main App ------------
 
@@ -160,6 +227,7 @@ def job_board():
     st.title("💼 Job Management Board")
     post_new_job()
     display_jobs()
+    archived_jobs()
 
 if __name__ == "__main__":
     job_board()
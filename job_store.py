@@ -0,0 +1,254 @@
+import os
+import io
+import csv
+import time
+import uuid
+import threading
+try:
+    import fcntl
+except ImportError:   # Windows
+    fcntl = None
+    import msvcrt
+from contextlib import contextmanager
+from datetime import datetime
+import data_service
+
+# --- Constants ---
+JOB_CSV = "jobs_data.csv"
+TOMBSTONE_CSV = "parsed_data/jobs_tombstones.csv"
+LOCK_FILE = "parsed_data/jobs_data.lock"
+JOB_COLUMNS = [
+    "title", "description", "location", "salary", "job_type",
+    "deadline", "posted_on", "requirements", "company", "job_id"
+]
+TOMBSTONE_COLUMNS = ["job_id", "deleted_on"]
+COMPACT_THRESHOLD = 50   # tombstones allowed to pile up before jobs_data.csv is rewritten
+LOCK_TIMEOUT = 10        # seconds to wait for another process holding the lock before giving up
+
+# jobs_data.csv is an append-only log of postings and jobs_tombstones.csv an
+# append-only log of deleted job_ids. Each process keeps an in-memory index of
+# live jobs and only reads the bytes appended to either file since its last
+# refresh; a full reload happens only after a compaction replaces the files.
+# With a data service running, postings and deletions are made by the
+# service (see data_service.py); the index stays per process.
+_lock = threading.RLock()
+_index = {
+    "jobs": {},          # job_id -> job dict, in posting order
+    "by_company": {},    # company -> {job_id: job dict}, in posting order
+    "columns": None,
+    "deleted": set(),
+    "files": {},         # path -> (file identity, bytes consumed)
+    "version": 0,
+    "sorted": {},        # (sort_by, descending, company) -> cached ordering for this version
+}
+
+# --- File Helpers ---
+
+def _try_lock(fd):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+def _unlock(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def _file_lock():
+    # Cross-process lock on an open descriptor of LOCK_FILE. The OS releases
+    # it when the holder exits or dies, so there is never a stale lock to
+    # break, and the file itself is never removed.
+    os.makedirs(os.path.dirname(LOCK_FILE), exist_ok=True)
+    fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR)
+    try:
+        deadline = time.time() + LOCK_TIMEOUT
+        while not _try_lock(fd):
+            if time.time() > deadline:
+                raise TimeoutError(f"Another process has held {LOCK_FILE} for over {LOCK_TIMEOUT} seconds.")
+            time.sleep(0.01)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+def _ensure_file(path, columns):
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerow(columns)
+
+def _read_header(path):
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return next(csv.reader(f))
+
+def _append_row(path, columns, record):
+    line = io.StringIO()
+    csv.writer(line, lineterminator="\n").writerow([record.get(c, "") for c in columns])
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(line.getvalue().encode("utf-8"))
+
+def _read_new_rows(path):
+    # Returns (rows, reloaded) where rows are the records appended since the
+    # last call and reloaded is True when the file was replaced or truncated.
+    if not os.path.exists(path):
+        return [], False
+    stat = os.stat(path)
+    identity = (stat.st_dev, stat.st_ino)
+    known_identity, offset = _index["files"].get(path, (None, 0))
+    reloaded = identity != known_identity or stat.st_size < offset
+    if reloaded:
+        offset = 0
+    if stat.st_size == offset:
+        return [], reloaded
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    # Only consume complete lines so a concurrent half-written append is
+    # picked up on the next refresh instead of being parsed early.
+    end = data.rfind(b"\n") + 1
+    _index["files"][path] = (identity, offset + end)
+    rows = list(csv.reader(io.StringIO(data[:end].decode("utf-8"))))
+    if offset == 0 and rows:
+        rows = rows[1:]
+    return rows, reloaded
+
+# --- Index ---
+
+def refresh():
+    with _lock:
+        _ensure_file(JOB_CSV, JOB_COLUMNS)
+        _ensure_file(TOMBSTONE_CSV, TOMBSTONE_COLUMNS)
+
+        job_rows, jobs_reloaded = _read_new_rows(JOB_CSV)
+        tomb_rows, tombs_reloaded = _read_new_rows(TOMBSTONE_CSV)
+        if jobs_reloaded:
+            _index["jobs"] = {}
+            _index["by_company"] = {}
+            _index["columns"] = _read_header(JOB_CSV)
+        if tombs_reloaded:
+            _index["deleted"] = set()
+        if not (job_rows or tomb_rows or jobs_reloaded or tombs_reloaded):
+            return
+
+        columns = _index["columns"]
+        for values in job_rows:
+            if not any(values):
+                continue
+            job = dict(zip(columns, values))
+            if job.get("job_id") and job["job_id"] not in _index["deleted"]:
+                _index["jobs"][job["job_id"]] = job
+                _index["by_company"].setdefault(job.get("company", ""), {})[job["job_id"]] = job
+        for values in tomb_rows:
+            if values:
+                _index["deleted"].add(values[0])
+                job = _index["jobs"].pop(values[0], None)
+                if job is not None:
+                    _index["by_company"].get(job.get("company", ""), {}).pop(values[0], None)
+        _index["version"] += 1
+        _index["sorted"] = {}
+
+def version():
+    refresh()
+    return _index["version"]
+
+def _jobs_for(company):
+    if company is None:
+        return _index["jobs"]
+    return _index["by_company"].get(company, {})
+
+def list_jobs(company=None):
+    # Newest postings first, matching the order the boards have always used.
+    refresh()
+    with _lock:
+        jobs = list(_jobs_for(company).values())
+    return jobs[::-1]
+
+def sorted_jobs(sort_by="posted_on", descending=True, company=None):
+    # Cached per index version so paging through the board only slices a
+    # ready-made list instead of re-sorting every job on every rerun.
+    refresh()
+    key = (sort_by, descending, company)
+    with _lock:
+        cached = _index["sorted"].get(key)
+        if cached is None:
+            cached = sorted(_jobs_for(company).values(), key=lambda job: job.get(sort_by) or "", reverse=descending)
+            _index["sorted"][key] = cached
+    return cached
+
+def is_open(job, today=None):
+    # Jobs accept applications up to and including their deadline day.
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    deadline = job.get("deadline")
+    if not isinstance(deadline, str) or not deadline.strip():
+        return True
+    return deadline.strip()[:10] >= today
+
+def open_jobs(company=None, today=None):
+    return [job for job in list_jobs(company) if is_open(job, today)]
+
+def get_job(job_id):
+    refresh()
+    with _lock:
+        return _index["jobs"].get(job_id)
+
+# --- Writes ---
+
+@data_service.service_method("jobs.add", topic="jobs")
+def add_job(job_data):
+    job = dict(job_data)
+    job["job_id"] = str(uuid.uuid4())
+    with _lock, _file_lock():
+        _ensure_file(JOB_CSV, JOB_COLUMNS)
+        columns = _read_header(JOB_CSV)
+        _append_row(JOB_CSV, columns, job)
+    refresh()
+    return job["job_id"]
+
+@data_service.service_method("jobs.delete", topic="jobs")
+def delete_job(job_id):
+    with _lock, _file_lock():
+        _ensure_file(TOMBSTONE_CSV, TOMBSTONE_COLUMNS)
+        _append_row(TOMBSTONE_CSV, TOMBSTONE_COLUMNS, {
+            "job_id": job_id,
+            "deleted_on": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+    refresh()
+    if len(_index["deleted"]) >= COMPACT_THRESHOLD:
+        compact()
+
+def compact():
+    # Rewrite jobs_data.csv without tombstoned postings and start a fresh
+    # tombstone log. Both files are swapped in atomically.
+    with _lock, _file_lock():
+        refresh()
+        columns = _index["columns"]
+        tmp_jobs = JOB_CSV + ".tmp"
+        with open(tmp_jobs, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns)
+            for job in _index["jobs"].values():
+                writer.writerow([job.get(c, "") for c in columns])
+        tmp_tombs = TOMBSTONE_CSV + ".tmp"
+        with open(tmp_tombs, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerow(TOMBSTONE_COLUMNS)
+        os.replace(tmp_jobs, JOB_CSV)
+        os.replace(tmp_tombs, TOMBSTONE_CSV)
+        refresh()
@@ -0,0 +1,78 @@
+import os
+import time
+import logging
+import threading
+try:
+    import fcntl
+except ImportError:   # Windows
+    fcntl = None
+    import msvcrt
+import data_service
+
+# --- Constants ---
+LAST_RUN_FILE = "parsed_data/archive/last_run"
+RUN_LOCK_FILE = "parsed_data/archive/last_run.lock"
+ARCHIVE_INTERVAL = int(os.environ.get("ARCHIVE_INTERVAL_SECONDS", "3600"))
+STARTUP_DELAY = 30       # seconds before the first check, so it does not compete with the first page
+
+# Runs job_lifecycle.expire_jobs in the background. Both entry points start
+# it, so this module only imports the standard library: job_lifecycle,
+# pandas and the stores are imported on the scheduler thread, and only
+# STARTUP_DELAY seconds after it starts. With a data service the service
+# runs the scheduler itself and Streamlit processes do not start one.
+
+_scheduler = None
+
+def _due(interval):
+    try:
+        return time.time() - os.path.getmtime(LAST_RUN_FILE) >= interval
+    except OSError:
+        return True
+
+def _try_lock(fd):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+def run_if_due(interval=ARCHIVE_INTERVAL):
+    # The last_run file is shared by every Streamlit process on the host, so
+    # expiry runs about once per interval no matter how many are up. It is
+    # only stamped after a successful run, so a failed run is retried on the
+    # next check; meanwhile RUN_LOCK_FILE keeps a second process from
+    # starting the same run. The OS drops the lock when its holder exits.
+    if not _due(interval):
+        return 0
+    os.makedirs(os.path.dirname(RUN_LOCK_FILE), exist_ok=True)
+    fd = os.open(RUN_LOCK_FILE, os.O_CREAT | os.O_RDWR)
+    try:
+        if not _try_lock(fd) or not _due(interval):
+            return 0   # another process is running it, or has just finished
+        import job_lifecycle
+        expired = job_lifecycle.expire_jobs()
+        with open(LAST_RUN_FILE, "w") as f:
+            f.write(str(time.time()))
+        return expired
+    finally:
+        os.close(fd)   # also releases the lock
+
+def _scheduler_loop(interval):
+    time.sleep(STARTUP_DELAY)
+    while True:
+        try:
+            run_if_due(interval)
+        except Exception:
+            logging.getLogger(__name__).exception("Job expiry failed")
+        time.sleep(min(interval, 60))
+
+def start_scheduler(interval=ARCHIVE_INTERVAL):
+    global _scheduler
+    if data_service.remote():
+        return   # the data service runs expiry for every process
+    if _scheduler is None or not _scheduler.is_alive():
+        _scheduler = threading.Thread(target=_scheduler_loop, args=(interval,), name="job-lifecycle", daemon=True)
+        _scheduler.start()
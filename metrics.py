@@ -0,0 +1,156 @@
+import os
+import json
+import atexit
+import time
+import bisect
+import threading
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- Constants ---
+METRICS_FILE = "parsed_data/metrics.jsonl"
+METRICS_PORT = os.environ.get("METRICS_PORT")          # serve Prometheus text on this port when set
+FLUSH_EVERY = 100                                      # buffered observations before appending to METRICS_FILE
+BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+# Timers are no-ops unless METRICS_ENABLED=1: timer() hands back a shared
+# null context manager and timed() wrappers fall straight through, so
+# instrumentation can stay in the hot path permanently.
+_enabled = os.environ.get("METRICS_ENABLED", "0") == "1"
+_lock = threading.Lock()
+_histograms = {}    # stage -> {"counts": [...], "sum": float, "count": int}
+_pending = []
+_server = None
+
+# --- Recording ---
+
+def enabled():
+    return _enabled
+
+def enable(flag=True):
+    global _enabled
+    _enabled = flag
+
+def observe(stage, seconds):
+    with _lock:
+        hist = _histograms.get(stage)
+        if hist is None:
+            hist = _histograms[stage] = {"counts": [0] * (len(BUCKETS) + 1), "sum": 0.0, "count": 0}
+        hist["counts"][bisect.bisect_left(BUCKETS, seconds)] += 1
+        hist["sum"] += seconds
+        hist["count"] += 1
+        _pending.append({"ts": round(time.time(), 3), "stage": stage, "seconds": round(seconds, 6)})
+        should_flush = len(_pending) >= FLUSH_EVERY
+    if should_flush:
+        flush()
+    if METRICS_PORT and _server is None:
+        start_http_server(int(METRICS_PORT))
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class _Timer:
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+def timer(stage):
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(stage)
+
+def timed(stage):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+# --- Export ---
+
+def flush():
+    with _lock:
+        events, _pending[:] = list(_pending), []
+    if not events:
+        return
+    os.makedirs(os.path.dirname(METRICS_FILE), exist_ok=True)
+    with open(METRICS_FILE, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(e) + "\n" for e in events))
+
+atexit.register(flush)
+
+def snapshot():
+    with _lock:
+        return {
+            stage: {
+                "count": hist["count"],
+                "sum": round(hist["sum"], 6),
+                "avg": round(hist["sum"] / hist["count"], 6) if hist["count"] else 0.0,
+                "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], hist["counts"])),
+            }
+            for stage, hist in _histograms.items()
+        }
+
+def render_prometheus():
+    lines = [
+        "# HELP app_stage_seconds Time spent in each resume pipeline / recruiter stage.",
+        "# TYPE app_stage_seconds histogram",
+    ]
+    with _lock:
+        for stage, hist in sorted(_histograms.items()):
+            cumulative = 0
+            for bound, count in zip([str(b) for b in BUCKETS] + ["+Inf"], hist["counts"]):
+                cumulative += count
+                lines.append(f'app_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'app_stage_seconds_sum{{stage="{stage}"}} {hist["sum"]:.6f}')
+            lines.append(f'app_stage_seconds_count{{stage="{stage}"}} {hist["count"]}')
+    return "\n".join(lines) + "\n"
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def start_http_server(port, host="127.0.0.1"):
+    global _server
+    with _lock:
+        if _server is not None:
+            return _server
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError:
+            # Another Streamlit process on this host already owns the port.
+            _server = False
+            return None
+    threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+    return _server
@@ -0,0 +1,27 @@
+import importlib
+import streamlit as st
+
+# Shared page routing for both entry points. Pages are registered as
+# (sidebar label, module, function) and the module is only imported when
+# the page is opened, so starting either interface doesn't load pandas,
+# PyMuPDF or the email stack up front.
+
+def render_page(module, function):
+    getattr(importlib.import_module(module), function)()
+
+def run_app(pages, caption=None):
+    labels = [label for label, _, _ in pages]
+    if st.session_state.get("page") not in labels:
+        st.session_state.page = labels[0]
+
+    st.sidebar.title("Menu")
+    if caption:
+        st.sidebar.caption(caption)
+    # Using buttons to select pages
+    for label in labels:
+        if st.sidebar.button(label):
+            st.session_state.page = label
+
+    # Show the selected page
+    _, module, function = pages[labels.index(st.session_state.page)]
+    render_page(module, function)
@@ -0,0 +1,274 @@
+import io
+import os
+import csv
+import threading
+import job_store
+from application_store import migrate_legacy_results, partition_path
+from metrics import timed
+from skill_matcher import canonical_skills
+
+# --- Constants ---
+DEFAULT_TOP_K = 10
+
+# Candidates and jobs are kept as two sparse binary skill matrices stored
+# column-wise: for every skill id, the list of candidate rows (per company)
+# or job rows that have it. Scoring a job against all candidates is then the
+# sparse product candidates x job-skills: concatenate the posting lists of
+# the job's skills and bincount them, weighted by each skill's IDF. Nothing
+# is ever rebuilt from scratch while the underlying files only grow: new
+# applications are tailed from the partition CSV by byte offset and new jobs
+# are picked up from the job_store index when its version changes. A
+# rebuild also reads the company's archived applications, so candidates of
+# expired jobs stay suggestible; job expiry rewrites the partition, which
+# is what triggers that rebuild.
+
+_lock = threading.RLock()
+_skill_ids = {}        # normalised skill -> column id, shared by both matrices
+_skill_names = []      # column id -> display label (first spelling seen)
+_item_columns = {}     # raw skill string -> column ids, so each spelling is normalised once
+_candidates = {}       # company -> candidate matrix state
+_jobs = {
+    "version": None,
+    "rows": [],        # row -> job dict
+    "row_of": {},      # job_id -> row
+    "skills": [],      # row -> set of skill ids
+    "postings": {},    # skill id -> [job rows]
+    "live": set(),     # rows still present in job_store
+    "arrays": None,    # per-version NumPy views: skill counts, deadlines, live mask
+}
+_job_matches = {}      # (resume_hash, jobs version, today) -> ranked job matches
+
+# --- Skill Columns ---
+
+def _split(value, sep):
+    if not isinstance(value, str):
+        return []
+    return [item.strip() for item in value.split(sep) if item.strip()]
+
+def _skill_columns(items):
+    ids = set()
+    for item in items:
+        columns = _item_columns.get(item)
+        if columns is None:
+            columns = set()
+            for key, label in canonical_skills([item]).items():
+                if key not in _skill_ids:
+                    _skill_ids[key] = len(_skill_names)
+                    _skill_names.append(label)
+                columns.add(_skill_ids[key])
+            _item_columns[item] = columns
+        ids |= columns
+    return ids
+
+def job_skill_ids(job):
+    return _skill_columns(_split(job.get("requirements"), ";"))
+
+def _idf(postings, skill_ids, total):
+    import numpy as np
+    df = np.array([len(postings.get(s, ())) for s in skill_ids], dtype=np.float64)
+    return np.log((1 + total) / (1 + df)) + 1
+
+def _score(postings, skill_ids, total):
+    # Sparse product of the (total x skills) matrix with the weighted skill vector.
+    import numpy as np
+    skill_ids = sorted(skill_ids)
+    if not skill_ids or not total:
+        return np.zeros(total), []
+    weights = _idf(postings, skill_ids, total)
+    rows = [np.asarray(postings.get(s, ()), dtype=np.int64) for s in skill_ids]
+    lengths = [len(r) for r in rows]
+    scores = np.bincount(
+        np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64),
+        weights=np.repeat(weights, lengths),
+        minlength=total,
+    )
+    return scores / weights.sum(), skill_ids
+
+def _top_k(scores, k, exclude=()):
+    import numpy as np
+    scores = scores.copy()
+    scores[list(exclude)] = 0
+    k = min(k, int((scores > 0).sum()))
+    if k <= 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    return sorted(top.tolist(), key=lambda row: -scores[row])
+
+# --- Candidate Matrix (per company) ---
+
+def _new_candidates():
+    return {
+        "file": (None, 0),   # (file identity, bytes consumed)
+        "header": None,
+        "rows": [],          # row -> candidate dict
+        "row_of": {},        # normalised email -> row
+        "skills": [],        # row -> set of skill ids
+        "postings": {},      # skill id -> [candidate rows]
+        "applied": {},       # job_id -> set of candidate rows
+        "saved": set(),      # rows a recruiter has starred
+    }
+
+def _add_application(state, record):
+    email = str(record.get("email", "")).strip().lower()
+    if not email or email == "not found":
+        return
+    row = state["row_of"].get(email)
+    if row is None:
+        row = state["row_of"][email] = len(state["rows"])
+        state["rows"].append({"name": "", "email": email, "phone": "", "saved": False, "skills": []})
+        state["skills"].append(set())
+    candidate = state["rows"][row]
+    candidate["name"] = record.get("name") or candidate["name"]
+    candidate["phone"] = record.get("phone") or candidate["phone"]
+    candidate["saved"] = candidate["saved"] or str(record.get("saved", "")).lower() == "true"
+    if candidate["saved"]:
+        state["saved"].add(row)
+    skills = _split(record.get("skills"), ",")
+    candidate["skills"] = sorted(set(candidate["skills"]) | set(skills))
+    # A candidate's skills are the union over all their applications, so new
+    # applications only ever add postings.
+    for skill_id in _skill_columns(skills) - state["skills"][row]:
+        state["skills"][row].add(skill_id)
+        state["postings"].setdefault(skill_id, []).append(row)
+    if record.get("job_id"):
+        state["applied"].setdefault(record["job_id"], set()).add(row)
+
+def _fresh_candidates(company):
+    # A new matrix seeded with the company's archived applications.
+    import job_lifecycle
+    state = _candidates[company] = _new_candidates()
+    for path in job_lifecycle.archived_application_paths(company):
+        with open(path, newline="", encoding="utf-8") as f:
+            for record in csv.DictReader(f):
+                _add_application(state, record)
+    return state
+
+def _sync_candidates(company):
+    migrate_legacy_results()
+    path = partition_path(company)
+    state = _candidates.get(company)
+    if state is None:
+        state = _fresh_candidates(company)
+    if not os.path.exists(path):
+        return state
+
+    stat = os.stat(path)
+    identity = (stat.st_dev, stat.st_ino)
+    known_identity, offset = state["file"]
+    if identity != known_identity or stat.st_size < offset:
+        # The partition was rewritten (status edits, new columns, expiry): start over.
+        state = _fresh_candidates(company)
+        offset = 0
+    if stat.st_size == offset:
+        return state
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    state["file"] = (identity, offset + end)
+    rows = list(csv.reader(io.StringIO(data[:end].decode("utf-8"))))
+    if offset == 0 and rows:
+        state["header"], rows = rows[0], rows[1:]
+    for values in rows:
+        if any(values):
+            _add_application(state, dict(zip(state["header"], values)))
+    return state
+
+@timed("recommender.suggest_candidates")
+def suggest_candidates(company, job_id, k=DEFAULT_TOP_K):
+    # Top-k past applicants of company for job_id, best first. Candidates who
+    # already applied to the job are left out: the recruiter already sees them.
+    jobs = sync_jobs()
+    with _lock:
+        row = jobs["row_of"].get(job_id)
+        if row is None or row not in jobs["live"]:
+            return []
+        skill_ids = jobs["skills"][row]
+        state = _sync_candidates(company)
+        scores, skill_ids = _score(state["postings"], skill_ids, len(state["rows"]))
+        if len(scores):
+            scores[list(state["saved"])] *= 1 + 1e-9   # saved candidates win ties
+        top = _top_k(scores, k, state["applied"].get(job_id, ()))
+        suggestions = []
+        for row in top:
+            candidate = dict(state["rows"][row])
+            candidate["score"] = round(float(scores[row]) * 100, 1)
+            matched = state["skills"][row] & set(skill_ids)
+            candidate["matched_skills"] = sorted(_skill_names[s] for s in matched)
+            suggestions.append(candidate)
+    return suggestions
+
+# --- Job Matrix (all companies) ---
+
+def sync_jobs():
+    # Adds jobs posted since the last sync and drops deleted ones; called on
+    # every query and right after a recruiter posts a job.
+    current = job_store.version()
+    with _lock:
+        if _jobs["version"] == current:
+            return _jobs
+        live = set()
+        for job in job_store.list_jobs():
+            row = _jobs["row_of"].get(job["job_id"])
+            if row is None:
+                row = _jobs["row_of"][job["job_id"]] = len(_jobs["rows"])
+                _jobs["rows"].append(job)
+                ids = job_skill_ids(job)
+                _jobs["skills"].append(ids)
+                for skill_id in ids:
+                    _jobs["postings"].setdefault(skill_id, []).append(row)
+            live.add(row)
+        _jobs["live"] = live
+        _jobs["version"] = current
+        _jobs["arrays"] = None
+        _job_matches.clear()
+        return _jobs
+
+def _job_arrays(jobs):
+    import numpy as np
+    if jobs["arrays"] is None:
+        live = np.zeros(len(jobs["rows"]), dtype=bool)
+        live[list(jobs["live"])] = True
+        jobs["arrays"] = {
+            "skill_counts": np.array([len(ids) for ids in jobs["skills"]], dtype=np.float64),
+            "deadlines": np.array([str(job.get("deadline") or "9999-12-31")[:10] for job in jobs["rows"]]),
+            "live": live,
+        }
+    return jobs["arrays"]
+
+@timed("recommender.recommend_jobs")
+def recommend_jobs(skills, k=DEFAULT_TOP_K, resume_hash=None, today=None):
+    # Open jobs ranked by the share of their requirements covered by skills.
+    # Jobs whose deadline has passed are skipped. Rankings are cached per
+    # resume hash until the job index changes.
+    import numpy as np
+    from datetime import date
+    today = today or date.today().isoformat()
+    jobs = sync_jobs()
+    with _lock:
+        cache_key = (resume_hash, jobs["version"], today, k)
+        if resume_hash and cache_key in _job_matches:
+            return _job_matches[cache_key]
+
+        arrays = _job_arrays(jobs)
+        resume_ids = _skill_columns(skills)
+        rows = [np.asarray(jobs["postings"].get(s, ()), dtype=np.int64) for s in resume_ids]
+        matched = np.bincount(
+            np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64),
+            minlength=len(jobs["rows"]),
+        ).astype(np.float64)
+        scores = np.divide(matched, arrays["skill_counts"], out=np.zeros_like(matched),
+                           where=arrays["skill_counts"] > 0)
+        scores[~arrays["live"] | (arrays["deadlines"] < today)] = 0
+
+        ranked = []
+        for row in _top_k(scores, k):
+            job = dict(jobs["rows"][row])
+            job["score"] = round(float(scores[row]) * 100, 1)
+            job["matched_skills"] = sorted(_skill_names[s] for s in jobs["skills"][row] & resume_ids)
+            job["missing_skills"] = sorted(_skill_names[s] for s in jobs["skills"][row] - resume_ids)
+            ranked.append(job)
+        if resume_hash:
+            _job_matches[cache_key] = ranked
+    return ranked
@@ -1,53 +1,110 @@
 import streamlit as st
-import pandas as pd
 import os
-import base64
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-
-def send_email(to_email, subject, body, smtp_server, smtp_port, sender_email, sender_password):
-    msg = MIMEMultipart()
-    msg["From"] = sender_email
-    msg["To"] = to_email
-    msg["Subject"] = subject
-    msg.attach(MIMEText(body, "plain"))
-
-    with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
-        server.login(sender_email, sender_password)
-        server.send_message(msg)
-
-def save_applicant(applicant_email, csv_path="parsed_data/results.csv"):
-    df = pd.read_csv(csv_path)
-    if "saved" not in df.columns:
-        df["saved"] = False
-    df.loc[df["email"] == applicant_email, "saved"] = True
-    df.to_csv(csv_path, index=False)
-
+import application_store
+import application_status
+import interview_scheduler
+import resume_queue
+import email_templates
+from application_status import Status
+from emailer import send_email, send_messages
+from metrics import timed
+from resume_store import is_resume_hash, pdf_viewer_html, resolve_resume
+from tenancy import current_company, current_recruiter
+
+
+@timed("recruiter.save_applicant")
+def save_applicant(applicant_email, company):
+    df = application_store.application_table(company)
+    ids = df.loc[df["email"] == applicant_email, "application_id"]
+    application_store.update_applications(company, {application_id: {"saved": True} for application_id in ids})
+
+# --- Interview Invites ---
+
+def _booking_start(booking):
+    return datetime.strptime(booking["start"], interview_scheduler.DATETIME_FORMAT)
+
+def send_invite(row, booking, company_name):
+    subject, body = email_templates.render(
+        "interview_invite", company_name, **email_templates.applicant_context(row, start=_booking_start(booking))
+    )
+    # A reschedule also cancels the replaced slot in the applicant's calendar.
+    attachments = [interview_scheduler.ics_attachment(booking)]
+    attachments += [interview_scheduler.ics_cancellation(old) for old in booking.get("replaced", [])]
+    send_email(row["email"], subject, body, attachments=attachments)
+
+def mark_invited(application_id, booking):
+    # Returns the fields to write back to the application row.
+    interview = {"interview_date": booking["start"][:10], "interview_time": booking["start"][11:]}
+    application_status.transition(application_id, Status.INTERVIEW_INVITED, current_recruiter(), **interview)
+    return {"status": Status.INTERVIEW_INVITED.value, **interview}
+
+def auto_schedule_interviews(all_df, company_name):
+    # Books the next free slots for a batch of applicants and mails each an .ics invite.
+    with st.expander("🗓️ Auto-schedule Interviews"):
+        pending = all_df[all_df["status"].map(lambda s: application_status.normalize_status(s, Status.APPLIED)) == Status.APPLIED]
+        if pending.empty:
+            st.info("No applicants are waiting for an interview.")
+            return
+        options = {f"{r['name']} ({r['email']}) - {r.get('job_title', '')}": idx for idx, r in pending.iterrows()}
+        selected = st.multiselect("Applicants to schedule", list(options), key="batch_applicants")
+        col1, col2 = st.columns(2)
+        first_day = col1.date_input("Earliest interview date", key="batch_first_day")
+        minutes = col2.selectbox("Interview length (minutes)", [30, 45, 60, 90], index=2, key="batch_minutes")
+
+        if st.button("📨 Schedule and Send Invites", disabled=not selected, key="batch_schedule"):
+            start_after = max(datetime.now(), datetime.combine(first_day, datetime.min.time()))
+            indices = [options[label] for label in selected]
+            bookings = interview_scheduler.schedule_batch(
+                company_name, current_recruiter(), [all_df.loc[i].dropna().to_dict() for i in indices],
+                start_after=start_after, minutes=minutes
+            )
+            rendered = email_templates.render_batch("interview_invite", company_name, [
+                email_templates.applicant_context(all_df.loc[idx], start=_booking_start(booking))
+                for idx, booking in zip(indices, bookings)
+            ])
+            messages = [
+                (all_df.at[idx, "email"], subject, body, [interview_scheduler.ics_attachment(booking)])
+                for idx, booking, (subject, body) in zip(indices, bookings, rendered)
+            ]
+            try:
+                errors = dict(send_messages(messages))
+            except Exception as e:
+                errors = {message[0]: str(e) for message in messages}
+            failed, updates = [], {}
+            for idx, booking in zip(indices, bookings):
+                email = all_df.at[idx, "email"]
+                if email in errors:
+                    interview_scheduler.cancel(booking["booking_id"])
+                    failed.append(f"{email}: {errors[email]}")
+                    continue
+                application_id = all_df.at[idx, "application_id"]
+                try:
+                    updates[application_id] = mark_invited(application_id, booking)
+                except ValueError as e:
+                    failed.append(f"{email}: {e}")
+            application_store.update_applications(company_name, updates)
+            if len(failed) < len(bookings):
+                st.success(f"✅ Scheduled {len(bookings) - len(failed)} interviews "
+                           f"from {bookings[0]['start'][:16]} to {bookings[-1]['start'][:16]}")
+            for failure in failed:
+                st.error(f"❌ Failed to send invite to {failure}")
+
+@timed("page.resume_review")
 def show_parsed_resumes():
     st.title("📄 Resume Review Dashboard")
 
-    csv_path = "parsed_data/results.csv"
-    resume_dir = "resumes"
-
-    if not os.path.exists(csv_path):
-        st.warning("No parsed resume data found.")
-        return
-
-    df = pd.read_csv(csv_path)
-    company_name = "IT Tech SDN BHD"
-    df = df[df["company"] == company_name]
+    company_name = current_company()
+    # Shared read-only table: changes go through application_store.update_applications.
+    all_df = application_store.application_table(company_name)
 
-    if df.empty:
+    if all_df.empty:
         st.info(f"No applicants found for {company_name}.")
         return
 
+    auto_schedule_interviews(all_df, company_name)
 
-    if "saved" not in df.columns:
-        df["saved"] = False
-        df.to_csv(csv_path, index=False)
-
+    df = all_df
     search_term = st.text_input("🔍 Search by name or email")
     if search_term:
         df = df[df["name"].str.contains(search_term, case=False, na=False) |
@@ -58,23 +115,31 @@ def show_parsed_resumes():
         return
 
     for idx, row in df.iterrows():
-        saved_icon = "✅ Saved" if row.get("saved", False) else ""
+        saved_icon = "✅ Saved" if row["saved"] else ""
         with st.expander(f"{row['name']} ({row['email']}) {saved_icon}"):
             st.write(f"📧 Email: {row['email']}")
             st.write(f"📌 Current Status: {row.get('status', 'Not Set')}")
 
-            action = st.radio("Choose an action", ["View Resume", "Send Interview Invite", "Reject", "Save Applicant"], key=f"action_{idx}")
+            action = st.radio("Choose an action", ["View Resume", "View Sections", "Send Interview Invite", "Reject", "Save Applicant"], key=f"action_{idx}")
 
             # Resume viewer
             if action == "View Resume":
-                resume_path = os.path.join(resume_dir, str(row.get("filename", "")).strip())
-                if os.path.exists(resume_path):
-                    with open(resume_path, "rb") as f:
-                        base64_pdf = base64.b64encode(f.read()).decode("utf-8")
-                    pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="700" height="800" type="application/pdf"></iframe>'
-                    st.markdown(pdf_display, unsafe_allow_html=True)
-                else:
+                resume_path = resolve_resume(row)
+                if not os.path.exists(resume_path):
                     st.error(f"❌ Resume file not found: {resume_path}")
+                elif st.toggle("📄 Show resume", key=f"show_resume_{idx}"):
+                    # Encoded only when opened: every expander starts on this action.
+                    st.markdown(pdf_viewer_html(resume_path), unsafe_allow_html=True)
+
+            # Resume sections, as split when the resume was parsed
+            elif action == "View Sections":
+                result = resume_queue.cached_result(row["resume_hash"]) if is_resume_hash(row["resume_hash"]) else None
+                sections = (result or {}).get("sections") or {}
+                if not sections:
+                    st.info("No parsed sections are available for this resume.")
+                for section, text in sections.items():
+                    st.markdown(f"**{section.title()}**")
+                    st.text(text)
 
             # Interview invite
             elif action == "Send Interview Invite":
@@ -82,73 +147,58 @@ def show_parsed_resumes():
                 interview_time = st.time_input("⏰ Interview Time", key=f"time_{idx}")
 
                 if st.button("📨 Send Interview Email", key=f"send_invite_{idx}"):
-                    subject = "Interview Invitation"
-                    body = f"""Dear {row['name']},
-
-We are pleased to invite you to an interview for the position you applied for.
-
-📅 Date: {interview_date.strftime('%A, %d %B %Y')}
-⏰ Time: {interview_time.strftime('%I:%M %p')}
-
-Please reply to confirm your availability.
-
-Best regards,
-HR Team
-"""
+                    start = datetime.combine(interview_date, interview_time)
                     try:
-                        send_email(
-                            to_email=row["email"],
-                            subject=subject,
-                            body=body,
-                            smtp_server="smtp.gmail.com",
-                            smtp_port=465,
-                            sender_email=st.secrets["SENDER_EMAIL_ADDRESS"],
-                            sender_password=st.secrets["SENDER_EMAIL_PASSWORD"]
-                        )
-                        df.at[idx, "status"] = "Interview Invited"
-                        df.at[idx, "interview_date"] = interview_date.strftime("%Y-%m-%d")
-                        df.at[idx, "interview_time"] = interview_time.strftime("%H:%M:%S")
-                        df.to_csv(csv_path, index=False)
-                        st.success(f"✅ Interview invite sent to {row['email']}")
-                    except Exception as e:
-                        st.error(f"❌ Failed to send email: {e}")
+                        application_status.check_transition(row.get("status"), Status.INTERVIEW_INVITED)
+                        booking = interview_scheduler.book(company_name, current_recruiter(), row.dropna().to_dict(), start)
+                    except ValueError as e:
+                        st.error(f"❌ {e}")
+                    else:
+                        try:
+                            send_invite(row, booking, company_name)
+                            application_store.update_application(
+                                company_name, row["application_id"], **mark_invited(row["application_id"], booking)
+                            )
+                            st.success(f"✅ Interview invite sent to {row['email']}")
+                        except Exception as e:
+                            lost = interview_scheduler.revert(booking)
+                            st.error(f"❌ Failed to send email: {e}")
+                            for old in lost:
+                                st.warning(
+                                    f"The previous interview on {old['start'][:16]} could not be restored: "
+                                    "that slot has been booked since."
+                                )
 
             # Rejection
             elif action == "Reject":
                 if st.button("❌ Send Rejection Email", key=f"reject_{idx}"):
-                    subject = "Job Application is Rejected"
-                    body = f"""Dear {row['name']},
-
-Thank you very much for your interest in our company and for taking the time to submit your application.
-
-After careful consideration, we regret to inform you that we will not be moving forward with your application at this time. While your qualifications are impressive, we have decided to proceed with candidates whose experience more closely matches our current needs.
-
-We appreciate your interest in our company and encourage you to apply for future openings that align with your skills and experience.
-
-Wishing you all the best in your job search and future endeavors.
-
-Best regards,
-HR Team
-"""
                     try:
-                        send_email(
-                            to_email=row["email"],
-                            subject=subject,
-                            body=body,
-                            smtp_server="smtp.gmail.com",
-                            smtp_port=465,
-                            sender_email=st.secrets["SENDER_EMAIL_ADDRESS"],
-                            sender_password=st.secrets["SENDER_EMAIL_PASSWORD"]
+                        application_status.check_transition(row.get("status"), Status.REJECTED)
+                    except ValueError as e:
+                        st.error(f"❌ {e}")
+                    else:
+                        # The status only changes once the applicant has been told.
+                        subject, body = email_templates.render(
+                            "application_rejection", company_name, **email_templates.applicant_context(row)
                         )
-                        df.at[idx, "status"] = "Rejected"
-                        df.to_csv(csv_path, index=False)
-                        st.success(f"✅ Rejection email sent to {row['email']}")
-                    except Exception as e:
-                        st.error(f"❌ Failed to send email: {e}")
+                        try:
+                            send_email(row["email"], subject, body)
+                        except Exception as e:
+                            st.error(f"❌ Failed to send email: {e}")
+                        else:
+                            try:
+                                application_status.transition(row["application_id"], Status.REJECTED, current_recruiter())
+                            except ValueError as e:
+                                st.error(f"❌ {e}")
+                            else:
+                                application_store.update_application(
+                                    company_name, row["application_id"], status=Status.REJECTED.value
+                                )
+                                st.success(f"✅ Rejection email sent to {row['email']}")
 
             # Save applicant
             elif action == "Save Applicant":
-                save_applicant(row["email"])
+                save_applicant(row["email"], company_name)
                 st.success("💾 Applicant has been saved for future reference")
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+import os
+import time
+import shutil
+import hashlib
+import sqlite3
+import threading
+import subprocess
+from metrics import timed
+
+# --- Constants ---
+OCR_CACHE_DB = "parsed_data/ocr_cache.db"
+TESSERACT = os.environ.get("OCR_TESSERACT", "tesseract")
+OCR_LANG = os.environ.get("OCR_LANG", "eng")
+OCR_WORKERS = int(os.environ.get("OCR_WORKERS", "2"))
+OCR_BUDGET_SECONDS = float(os.environ.get("OCR_BUDGET_SECONDS", "60"))   # per document
+OCR_DPI = 300
+MAX_OCR_PAGES = 10         # pages OCR'd per document; the rest are left empty
+MIN_TEXT_CHARS = 20        # pages with less text than this and an image are treated as scans
+
+# Scanned or image-only pages have no text layer, so extract_text_from_pdf
+# hands them to ocr_pages(). Each page is copied into a one-page PDF and
+# sent to a process pool of OCR_WORKERS workers, which render it with
+# PyMuPDF and run tesseract on the image, so the Streamlit process never
+# does the CPU-heavy work. A document gets OCR_BUDGET_SECONDS in total:
+# pages still queued at the deadline are cancelled and a running tesseract
+# is killed. Results are cached in sqlite by a hash of the page content
+# (its content stream plus the raw image streams it draws), so a page seen
+# before, in any resume, is never OCR'd again. Without a tesseract binary
+# on PATH, OCR is skipped and the pages stay empty.
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# --- Cache ---
+
+def _connect():
+    os.makedirs(os.path.dirname(OCR_CACHE_DB), exist_ok=True)
+    conn = sqlite3.connect(OCR_CACHE_DB, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ocr_pages (
+            page_hash TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            created_at REAL NOT NULL
+        ) WITHOUT ROWID
+    """)
+    return conn
+
+def _cached(hashes):
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            f"SELECT page_hash, text FROM ocr_pages WHERE page_hash IN ({', '.join('?' * len(hashes))})",
+            list(hashes)
+        ).fetchall()
+    finally:
+        conn.close()
+    return dict(rows)
+
+def _store(results):
+    # results: [(page_hash, text, seconds)]
+    if not results:
+        return
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT OR REPLACE INTO ocr_pages (page_hash, text, seconds, created_at) VALUES (?, ?, ?, ?)",
+            [(page_hash, text, seconds, time.time()) for page_hash, text, seconds in results]
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+# --- Pages ---
+
+def available():
+    return shutil.which(TESSERACT) is not None
+
+def needs_ocr(page, text):
+    # True for a page that shows an image but has (almost) no text layer.
+    return len(text.strip()) < MIN_TEXT_CHARS and bool(page.get_image_info())
+
+def page_hash(doc, page):
+    digest = hashlib.sha256(f"{OCR_DPI}:{OCR_LANG}:{tuple(page.rect)}:{page.rotation}".encode())
+    digest.update(page.read_contents())
+    for image in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(image[0]) or b"")
+    return digest.hexdigest()
+
+def _single_page_pdf(doc, page_number):
+    import fitz
+    single = fitz.open()
+    try:
+        single.insert_pdf(doc, from_page=page_number, to_page=page_number)
+        return single.tobytes(garbage=1)
+    finally:
+        single.close()
+
+# --- Worker Pool ---
+
+def _ocr_worker(page_pdf, deadline, dpi=OCR_DPI, lang=OCR_LANG):
+    # Runs in a pool process. Returns (text, seconds), or None when the
+    # document's deadline passed or tesseract failed.
+    import fitz
+    started = time.time()
+    if deadline - started <= 0:
+        return None
+    with fitz.open(stream=page_pdf, filetype="pdf") as doc:
+        png = doc[0].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY).tobytes("png")
+    try:
+        result = subprocess.run(
+            [TESSERACT, "stdin", "stdout", "-l", lang],
+            input=png, capture_output=True, check=True, timeout=max(deadline - time.time(), 0.1)
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.decode("utf-8", "replace"), time.time() - started
+
+def _get_pool():
+    # Spawned workers start clean instead of forking a threaded server.
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            _pool = ProcessPoolExecutor(max_workers=OCR_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+def _reset_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def shutdown():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+# --- OCR ---
+
+@timed("resume.ocr")
+def ocr_pages(doc, page_numbers, budget=OCR_BUDGET_SECONDS):
+    # Returns {page number: text} for the pages that were OCR'd or cached.
+    page_numbers = list(page_numbers)[:MAX_OCR_PAGES]
+    if not page_numbers:
+        return {}
+    hashes = {n: page_hash(doc, doc[n]) for n in page_numbers}
+    cached = _cached(set(hashes.values()))
+    texts = {n: cached[h] for n, h in hashes.items() if h in cached}
+    todo = {}
+    for n in page_numbers:
+        if n not in texts:
+            todo.setdefault(hashes[n], []).append(n)   # identical pages are OCR'd once
+    if not todo or not available():
+        return texts
+
+    from concurrent.futures import wait
+    from concurrent.futures.process import BrokenProcessPool
+    deadline = time.time() + budget
+    pool = _get_pool()
+    try:
+        futures = {
+            pool.submit(_ocr_worker, _single_page_pdf(doc, numbers[0]), deadline): h
+            for h, numbers in todo.items()
+        }
+        done, pending = wait(futures, timeout=max(deadline - time.time(), 0))
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        return texts
+    for future in pending:
+        future.cancel()   # queued pages never start; running ones stop at the deadline
+
+    results = []
+    for future in done:
+        try:
+            result = future.result()
+        except BrokenProcessPool:
+            _reset_pool(pool)
+            continue
+        if result is not None:
+            results.append((futures[future], *result))
+    _store(results)
+    for h, text, _ in results:
+        for n in todo[h]:
+            texts[n] = text
+    return texts
@@ -0,0 +1,130 @@
+import os
+import re
+import json
+import resume_ocr
+import resume_sections
+from metrics import timed
+from resume_store import open_pdf
+from skill_matcher import match_skills
+
+# --- Constants ---
+SKILLS_FILE = "skills.json"
+EDUCATION_LEVELS = ["PhD", "Master's", "Bachelor's", "Diploma", "High School", "Not found"]
+
+# --- Extraction Functions ---
+
+@timed("resume.load_skills")
+def load_skills():
+    if os.path.exists(SKILLS_FILE):
+        with open(SKILLS_FILE, "r") as f:
+            return json.load(f)
+    return []
+
+@timed("resume.save_skills")
+def save_skills(skills):
+    with open(SKILLS_FILE, "w") as f:
+        json.dump(sorted(list(set(skills))), f, indent=4)
+
+@timed("resume.extract_text")
+def extract_text_from_pdf(pdf_path, ocr=True):
+    # Pages without a text layer (scans) are filled in by resume_ocr.
+    with open_pdf(pdf_path) as doc:
+        texts = [page.get_text() for page in doc]
+        if ocr:
+            scanned = [i for i, text in enumerate(texts) if resume_ocr.needs_ocr(doc[i], text)]
+            if scanned:
+                for i, text in resume_ocr.ocr_pages(doc, scanned).items():
+                    texts[i] = text
+    return "".join(texts)
+
+@timed("resume.extract_lines")
+def extract_lines(pdf_path, ocr=True):
+    # Lines of the whole resume as (text, font size, bold); lines of OCR'd
+    # pages have no font information.
+    with open_pdf(pdf_path) as doc:
+        pages = [resume_sections.page_lines(page) for page in doc]
+        if ocr:
+            scanned = [
+                i for i, lines in enumerate(pages)
+                if resume_ocr.needs_ocr(doc[i], "".join(line[0] for line in lines))
+            ]
+            if scanned:
+                for i, text in resume_ocr.ocr_pages(doc, scanned).items():
+                    pages[i] = resume_sections.text_lines(text)
+    return [line for lines in pages for line in lines]
+
+@timed("resume.extract_name")
+def extract_name(text):
+    match = re.search(r"(?i)(?:Name\s*[:\-]?\s*)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)", text)
+    if match:
+        return match.group(1).strip()
+    for line in text.splitlines():
+        if line.strip() and re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$', line.strip()):
+            return line.strip()
+    return "Unknown"
+
+@timed("resume.extract_email")
+def extract_email(text):
+    match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    return match.group(0) if match else "Not found"
+
+@timed("resume.extract_phone")
+def extract_phone(text):
+    match = re.search(r'(\+?\d[\d\-\s]{8,}\d)', text)
+    return match.group(0) if match else "Not found"
+
+def extract_skills(text, known_skills, resume_hash=None):
+    return match_skills(text, known_skills, resume_hash)
+
+@timed("resume.extract_education")
+def extract_education(text):
+    education_levels = {
+        "PhD": r"\b(Ph\.?D\.?|Doctor of Philosophy)\b",
+        "Master's": r"\b(M\.?Sc\.?|M\.?A\.?|Master(?:'s)? of [A-Za-z ]+)\b",
+        "Bachelor's": r"\b(B\.?Sc\.?|B\.?A\.?|Bachelor(?:'s)? of [A-Za-z ]+)\b",
+        "Diploma": r"\b(Diploma(?: in)? [A-Za-z &]+|Diploma)\b",
+        "High School": r"\b(High School|Secondary School|H\.?S\.?)\b"
+    }
+    for level, pattern in education_levels.items():
+        if re.search(pattern, text, re.IGNORECASE):
+            return level
+    return "Not found"
+
+@timed("resume.extract_experience")
+def extract_experience(text):
+    experience_entries = re.findall(
+        r'(?i)(?:Position|Title|Role)?\s*[:\-]?\s*(?P<role>[A-Z][\w\s/&]+?)\s+at\s+(?P<company>[A-Z][\w\s&]+)(?:,?\s+)?(?:from)?\s*(?P<from>\w+\s+\d{4})?\s*(?:to|-)?\s*(?P<to>\w+\s+\d{4}|Present)?',
+        text
+    )
+    if not experience_entries:
+        return "Not found"
+    experiences = []
+    for role, company, from_date, to_date in experience_entries:
+        period = f"{from_date or '?'} - {to_date or '?'}"
+        experiences.append(f"{role.strip()} at {company.strip()} ({period})")
+    return "; ".join(experiences)
+
+def _from_section(extract, section, text):
+    # Runs an extractor on its own section; only a resume without that
+    # section falls back to the whole text, so a degree named in a project
+    # description does not fill in an Education section that lists none.
+    return extract(section) if section else extract(text)
+
+@timed("resume.parse_total")
+def parse_resume(pdf_path, resume_hash=None):
+    # The resume is split into sections once; each extractor reads only its
+    # own. The sections are returned with the result, so they are kept in the
+    # parse cache for recruiters to view.
+    lines = extract_lines(pdf_path)
+    text = "\n".join(line[0] for line in lines)
+    sections = resume_sections.segment(lines)
+    contact = sections.get("contact")
+    return {
+        "name": _from_section(extract_name, contact, text),
+        "email": _from_section(extract_email, contact, text),
+        "phone": _from_section(extract_phone, contact, text),
+        "skills": extract_skills(sections.get("skills", text), load_skills(), resume_hash),
+        "education_level": _from_section(extract_education, sections.get("education"), text),
+        "experience": _from_section(extract_experience, sections.get("experience"), text),
+        "sections": sections,
+    }
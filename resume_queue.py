@@ -0,0 +1,190 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import metrics
+from resume_parser import parse_resume
+
+# --- Constants ---
+QUEUE_DB = "parsed_data/resume_queue.db"
+WORKER_COUNT = int(os.environ.get("RESUME_QUEUE_WORKERS", "2"))
+POLL_INTERVAL = 0.5      # seconds an idle worker sleeps before checking the queue again
+STALE_AFTER = 300        # seconds before a "processing" task from a dead worker is retried
+STATS_WINDOW = 200       # number of recent finished tasks used for wait/processing times
+
+_workers = []
+_workers_lock = threading.Lock()
+_wakeup = threading.Event()
+
+# --- Storage ---
+
+def _connect():
+    os.makedirs(os.path.dirname(QUEUE_DB), exist_ok=True)
+    conn = sqlite3.connect(QUEUE_DB, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id TEXT PRIMARY KEY,
+            filepath TEXT NOT NULL,
+            resume_hash TEXT,
+            status TEXT NOT NULL,
+            enqueued_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL,
+            result TEXT,
+            error TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, enqueued_at)")
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(tasks)")}
+    if "resume_hash" not in columns:
+        conn.execute("ALTER TABLE tasks ADD COLUMN resume_hash TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_hash ON tasks (resume_hash)")
+    return conn
+
+def enqueue(filepath, resume_hash=None):
+    conn = _connect()
+    try:
+        # Resumes are content-addressed, so an identical upload can reuse the
+        # task that already parsed (or is parsing) the same blob.
+        if resume_hash:
+            existing = conn.execute(
+                "SELECT task_id FROM tasks WHERE resume_hash = ? AND status != 'failed' "
+                "ORDER BY enqueued_at DESC LIMIT 1",
+                (resume_hash,)
+            ).fetchone()
+            if existing is not None:
+                return existing["task_id"]
+
+        task_id = str(uuid.uuid4())
+        conn.execute(
+            "INSERT INTO tasks (task_id, filepath, resume_hash, status, enqueued_at) VALUES (?, ?, ?, 'queued', ?)",
+            (task_id, filepath, resume_hash, time.time())
+        )
+    finally:
+        conn.close()
+    _wakeup.set()
+    return task_id
+
+def get_task(task_id):
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = dict(row)
+        if task["status"] == "queued":
+            task["position"] = conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status = 'queued' AND enqueued_at <= ?",
+                (task["enqueued_at"],)
+            ).fetchone()[0]
+    finally:
+        conn.close()
+    task["result"] = json.loads(task["result"]) if task["result"] else None
+    return task
+
+def cached_result(resume_hash):
+    # Latest parse result of a stored resume, without parsing it again.
+    if not resume_hash:
+        return None
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT result FROM tasks WHERE resume_hash = ? AND status = 'done' ORDER BY finished_at DESC LIMIT 1",
+            (resume_hash,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return json.loads(row["result"]) if row is not None and row["result"] else None
+
+def queue_stats():
+    conn = _connect()
+    try:
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+        recent = conn.execute(
+            "SELECT enqueued_at, started_at, finished_at FROM tasks "
+            "WHERE status IN ('done', 'failed') ORDER BY finished_at DESC LIMIT ?",
+            (STATS_WINDOW,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    waits = [r["started_at"] - r["enqueued_at"] for r in recent]
+    runs = [r["finished_at"] - r["started_at"] for r in recent]
+    return {
+        "depth": counts.get("queued", 0),
+        "processing": counts.get("processing", 0),
+        "failed": counts.get("failed", 0),
+        "workers": len(_workers),
+        "avg_wait_seconds": round(sum(waits) / len(waits), 3) if waits else 0.0,
+        "max_wait_seconds": round(max(waits), 3) if waits else 0.0,
+        "avg_processing_seconds": round(sum(runs) / len(runs), 3) if runs else 0.0,
+        "max_processing_seconds": round(max(runs), 3) if runs else 0.0,
+    }
+
+def _claim_next(conn):
+    # BEGIN IMMEDIATE takes the write lock up front so two workers (or two
+    # Streamlit processes) can never claim the same task.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            "UPDATE tasks SET status = 'queued', started_at = NULL "
+            "WHERE status = 'processing' AND started_at < ?",
+            (time.time() - STALE_AFTER,)
+        )
+        row = conn.execute(
+            "SELECT task_id, filepath, resume_hash, enqueued_at FROM tasks WHERE status = 'queued' ORDER BY enqueued_at LIMIT 1"
+        ).fetchone()
+        if row is not None:
+            row = dict(row, started_at=time.time())
+            conn.execute(
+                "UPDATE tasks SET status = 'processing', started_at = ? WHERE task_id = ?",
+                (row["started_at"], row["task_id"])
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return row
+
+# --- Workers ---
+
+def _process(conn, task):
+    if metrics.enabled():
+        metrics.observe("queue.wait", task["started_at"] - task["enqueued_at"])
+    try:
+        result = parse_resume(task["filepath"], task["resume_hash"])
+        conn.execute(
+            "UPDATE tasks SET status = 'done', finished_at = ?, result = ? WHERE task_id = ?",
+            (time.time(), json.dumps(result), task["task_id"])
+        )
+    except Exception as e:
+        conn.execute(
+            "UPDATE tasks SET status = 'failed', finished_at = ?, error = ? WHERE task_id = ?",
+            (time.time(), str(e), task["task_id"])
+        )
+
+def _worker_loop():
+    conn = _connect()
+    while True:
+        try:
+            task = _claim_next(conn)
+        except sqlite3.OperationalError:
+            task = None
+        if task is None:
+            _wakeup.wait(POLL_INTERVAL)
+            _wakeup.clear()
+            continue
+        _process(conn, task)
+
+def start_workers(count=WORKER_COUNT):
+    # Idempotent: Streamlit reruns the page script constantly, but the pool
+    # lives for the whole server process.
+    with _workers_lock:
+        while len(_workers) < count:
+            worker = threading.Thread(target=_worker_loop, name=f"resume-worker-{len(_workers)}", daemon=True)
+            worker.start()
+            _workers.append(worker)
@@ -0,0 +1,90 @@
+import re
+
+# --- Constants ---
+SECTIONS = ["contact", "education", "experience", "skills", "other"]
+MAX_HEADING_WORDS = 4
+HEADING_SIZE_RATIO = 1.15      # a heading's font is at least this much larger than body text
+BOLD_FLAG = 16                 # PyMuPDF span flag
+
+# Heading phrases per section; anything else that looks like a heading
+# (projects, certifications, references, ...) starts an "other" section.
+SECTION_HEADINGS = {
+    "education": r"education|academic|qualifications?|education (?:and|&) training|academic background",
+    "experience": r"(?:professional |work |relevant |employment )?experience|employment(?: history)?|work history|career history|internships?",
+    "skills": r"(?:technical |key |core |professional )?skills|competencies|technologies|tech stack|tools",
+    "other": r"projects?|certifications?|awards?|achievements?|summary|profile|objective|about me|interests|hobbies"
+             r"|languages|references|activities|publications|volunteering|courses",
+}
+_HEADING_PATTERNS = {section: re.compile(rf"^(?:{pattern})$") for section, pattern in SECTION_HEADINGS.items()}
+
+# A resume is split into sections once, right after its text is read.
+# Every line carries its font size and whether it is bold. A short line
+# that names a known section is a candidate heading; it stands out when it
+# is larger than the body text, bold, upper case or ends in a colon. If any
+# candidate in the document stands out, the resume styles its headings and
+# only the candidates that stand out count; otherwise (plain layouts, OCR'd
+# pages without font information) a candidate counts when it is nothing but
+# the capitalised heading name, so a wrapped lone word like "project" does
+# not. Everything before the first heading is the contact block.
+
+# --- Lines ---
+
+def page_lines(page):
+    # [(text, font size, bold)] of a PyMuPDF page, in reading order.
+    lines = []
+    for block in page.get_text("dict", sort=True)["blocks"]:
+        for line in block.get("lines", []):
+            spans = [s for s in line["spans"] if s["text"].strip()]
+            if not spans:
+                continue
+            text = " ".join(s["text"].strip() for s in spans)
+            size = max(s["size"] for s in spans)
+            bold = all(s["flags"] & BOLD_FLAG for s in spans)
+            lines.append((text, size, bold))
+    return lines
+
+def text_lines(text):
+    return [(line.strip(), None, False) for line in text.splitlines() if line.strip()]
+
+# --- Segmentation ---
+
+def _normalize(text):
+    return " ".join(re.sub(r"[^a-z&]+", " ", text.lower()).split())
+
+def _body_size(lines):
+    # Most common font size, weighted by text length.
+    weights = {}
+    for text, size, _ in lines:
+        if size is not None:
+            weights[round(size, 1)] = weights.get(round(size, 1), 0) + len(text)
+    return max(weights, key=weights.get) if weights else None
+
+def heading_candidate(text, size=None, bold=False, body_size=None):
+    # (section, stands out) if the line names a section, else None.
+    name = _normalize(text)
+    if not name or len(name.split()) > MAX_HEADING_WORDS:
+        return None
+    section = next((s for s, pattern in _HEADING_PATTERNS.items() if pattern.match(name)), None)
+    if section is None:
+        return None
+    stands_out = (
+        bold
+        or (size is not None and body_size is not None and size >= body_size * HEADING_SIZE_RATIO)
+        or text.strip().rstrip(":").isupper()
+        or text.strip().endswith(":")
+    )
+    return section, stands_out
+
+def segment(lines):
+    # {section: text} for the sections that have any text.
+    body_size = _body_size(lines)
+    candidates = [heading_candidate(text, size, bold, body_size) for text, size, bold in lines]
+    styled = any(c is not None and c[1] for c in candidates)
+    sections = {section: [] for section in SECTIONS}
+    current = "contact"
+    for (text, _, _), candidate in zip(lines, candidates):
+        if candidate is not None and (candidate[1] if styled else re.fullmatch(r"[A-Z][A-Za-z& ]*", text.strip())):
+            current = candidate[0]
+            continue
+        sections[current].append(text)
+    return {section: "\n".join(texts) for section, texts in sections.items() if texts}
@@ -0,0 +1,133 @@
+import os
+import mmap
+import base64
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from metrics import timed
+
+# --- Constants ---
+RESUME_FOLDER = "resumes"
+TMP_FOLDER = os.path.join(RESUME_FOLDER, "tmp")
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+MAX_RESUME_BYTES = int(os.environ.get("MAX_RESUME_MB", "20")) * 1024 * 1024
+
+# --- Content-Addressed Blob Store ---
+
+def blob_path(resume_hash):
+    # Two levels of 256-way sharding keep every directory small:
+    # resumes/ab/cd/abcd....pdf
+    return os.path.join(RESUME_FOLDER, resume_hash[:2], resume_hash[2:4], f"{resume_hash}.pdf")
+
+def _chunks(file_obj):
+    # Streamlit uploads are BytesIO objects that already hold the whole file:
+    # hash and write slices of their buffer instead of copying it chunk by
+    # chunk. Other file objects are read in CHUNK_SIZE pieces.
+    if hasattr(file_obj, "getbuffer"):
+        with file_obj.getbuffer() as buffer:
+            for start in range(0, len(buffer), CHUNK_SIZE):
+                with buffer[start:start + CHUNK_SIZE] as chunk:
+                    yield chunk
+        return
+    while True:
+        chunk = file_obj.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+@timed("upload.store_resume")
+def store_resume(file_obj, max_bytes=MAX_RESUME_BYTES):
+    # Streams the upload to disk while hashing it and returns the SHA-256 hex
+    # digest. Identical uploads are stored once; oversized uploads raise ValueError.
+    if hasattr(file_obj, "seek"):
+        file_obj.seek(0)
+
+    os.makedirs(TMP_FOLDER, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=TMP_FOLDER, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in _chunks(file_obj):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"Resume exceeds the {max_bytes // (1024 * 1024)} MB size limit.")
+                digest.update(chunk)
+                out.write(chunk)
+
+        resume_hash = digest.hexdigest()
+        final_path = blob_path(resume_hash)
+        if os.path.exists(final_path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.replace(tmp_path, final_path)
+        return resume_hash
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def is_resume_hash(value):
+    return isinstance(value, str) and len(value) == 64 and all(c in "0123456789abcdef" for c in value)
+
+def resolve_resume(row):
+    # Applications reference blobs by hash; older rows only have a filename
+    # relative to the flat resumes/ folder.
+    resume_hash = row.get("resume_hash")
+    if is_resume_hash(resume_hash):
+        return blob_path(resume_hash)
+    return os.path.join(RESUME_FOLDER, str(row.get("filename", "")).strip())
+
+# --- Reading Resumes ---
+
+@contextmanager
+def mapped_resume(path):
+    # Read-only memory map of a stored resume as a memoryview: pages are
+    # faulted in by the OS as they are read and nothing is copied onto the
+    # Python heap. The view and the map are released on exit.
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        mapped.close()
+
+@contextmanager
+def open_pdf(source):
+    # PyMuPDF document for a stored resume path or an in-memory upload
+    # (bytes or BytesIO), always closed on exit. Paths are read by MuPDF's
+    # own buffered file stream, which keeps less of the file resident than a
+    # memory map; uploads are opened zero-copy on a view of their buffer.
+    import fitz  # PyMuPDF is only loaded by code paths that actually parse PDFs
+    if isinstance(source, (str, os.PathLike)):
+        view, doc = None, fitz.open(source, filetype="pdf")
+    else:
+        view = memoryview(source.getbuffer() if hasattr(source, "getbuffer") else source)
+        try:
+            doc = fitz.open(stream=view, filetype="pdf")
+        except BaseException:
+            view.release()
+            raise
+    try:
+        yield doc
+    finally:
+        doc.close()
+        if view is not None:
+            view.release()
+
+def pdf_viewer_html(path, width=700, height=800):
+    # Inline <iframe> viewer. The base64 is encoded straight from the memory
+    # map and spliced into the tag as bytes, so at most two copies of the
+    # encoded file exist at once.
+    with mapped_resume(path) as view:
+        encoded = base64.b64encode(view)
+    html = b"".join([
+        b'<iframe src="data:application/pdf;base64,',
+        encoded,
+        f'" width="{width}" height="{height}" type="application/pdf"></iframe>'.encode("ascii"),
+    ])
+    del encoded
+    return html.decode("ascii")
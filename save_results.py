@@ -1,17 +1,149 @@
-import json
-import csv
+import io
 import os
+import csv
+import json
+
+# --- Constants ---
+CHUNK_BYTES = 256 * 1024        # encoded output handed out per chunk
+
+# Writers take rows (dicts) from any iterable and produce the encoded output
+# as a generator of byte chunks, so a result never has to exist in memory as
+# a whole: the save_as_* functions stream the chunks into a file, the export
+# server into an HTTP response. A CSV header or Parquet schema is the union
+# of the keys of all rows, in first-seen order; rows missing a key get an
+# empty value. Without explicit fieldnames the rows are read twice (once
+# for the keys), so they must be a collection rather than a one-shot
+# iterator.
+
+# --- Encoders ---
+
+def union_keys(rows):
+    keys = {}
+    for row in rows:
+        keys.update(dict.fromkeys(row))
+    return list(keys)
+
+def _fieldnames(rows, fieldnames):
+    if fieldnames is not None:
+        return rows, list(fieldnames)
+    if iter(rows) is rows:
+        rows = list(rows)    # a one-shot iterator can't be read twice
+    return rows, union_keys(rows)
+
+def iter_csv(rows, fieldnames=None):
+    rows, fieldnames = _fieldnames(rows, fieldnames)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, restval="", extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+def _chunked(pieces):
+    # Joins text pieces into byte chunks of about CHUNK_BYTES.
+    parts, size = [], 0
+    for piece in pieces:
+        parts.append(piece)
+        size += len(piece)
+        if size >= CHUNK_BYTES:
+            yield "".join(parts).encode("utf-8")
+            parts, size = [], 0
+    yield "".join(parts).encode("utf-8")
+
+def _dumps(row):
+    return json.dumps(row, default=str, ensure_ascii=False)
+
+def iter_jsonl(rows):
+    return _chunked(_dumps(row) + "\n" for row in rows)
+
+def iter_json(rows):
+    # One JSON array, written element by element.
+    def pieces():
+        separator = "[\n"
+        for row in rows:
+            yield separator + _dumps(row)
+            separator = ",\n"
+        yield "\n]\n" if separator == ",\n" else "[]\n"
+    return _chunked(pieces())
+
+class _ChunkSink:
+    # Write-only file object for pyarrow that hands out what was written.
+    def __init__(self):
+        self.chunks, self.position, self.closed = [], 0, False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data, self.chunks = b"".join(self.chunks), []
+        return data
+
+def iter_parquet(batches, fieldnames=None, schema=None):
+    # batches: iterable of lists of rows; each becomes one row group. Columns
+    # are strings unless a pyarrow schema is given.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if schema is None:
+        if fieldnames is None:
+            if iter(batches) is batches:
+                batches = list(batches)
+            fieldnames = union_keys(row for batch in batches for row in batch)
+        schema = pa.schema([(name, pa.string()) for name in fieldnames])
+    sink = _ChunkSink()
+    strings = {field.name for field in schema if pa.types.is_string(field.type)}
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="zstd")
+    try:
+        for batch in batches:
+            if not batch:
+                continue
+            columns = {
+                name: [row.get(name) if name not in strings or row.get(name) is None else str(row[name]) for row in batch]
+                for name in schema.names
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+# --- Files ---
+
+def write_chunks(chunks, output_path):
+    # Streams chunks into output_path; the file only appears once complete.
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 def save_as_json(data, output_path):
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
-
-def save_as_csv(data_list, output_path):
-    if not data_list:
-        return
-    keys = data_list[0].keys()
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        for data in data_list:
-            writer.writerow(data)
\ No newline at end of file
+    write_chunks(iter_json(data), output_path)
+
+def save_as_jsonl(data, output_path):
+    write_chunks(iter_jsonl(data), output_path)
+
+def save_as_csv(data_list, output_path, fieldnames=None):
+    write_chunks(iter_csv(data_list, fieldnames), output_path)
@@ -0,0 +1,75 @@
+import os
+import time
+import sqlite3
+import job_store
+from metrics import timed
+
+# --- Constants ---
+SAVED_JOBS_DB = "parsed_data/saved_jobs.db"
+
+# Saved jobs are (applicant_id, job_id) references, one row per bookmark, so
+# saving is a single indexed insert and edits to a posting show up in every
+# saved list. Job details are joined in from the live job_store index when
+# the list is rendered.
+
+# --- Storage ---
+
+def _connect():
+    os.makedirs(os.path.dirname(SAVED_JOBS_DB), exist_ok=True)
+    conn = sqlite3.connect(SAVED_JOBS_DB, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS saved_jobs (
+            applicant_id TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            saved_at REAL NOT NULL,
+            PRIMARY KEY (applicant_id, job_id)
+        ) WITHOUT ROWID
+    """)
+    return conn
+
+# --- Writes ---
+
+@timed("applicant.save_job")
+def save_job(applicant_id, job_id):
+    # Returns False when the job was already saved.
+    conn = _connect()
+    try:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO saved_jobs (applicant_id, job_id, saved_at) VALUES (?, ?, ?)",
+            (applicant_id, job_id, time.time())
+        )
+    finally:
+        conn.close()
+    return cursor.rowcount > 0
+
+def unsave_job(applicant_id, job_id):
+    conn = _connect()
+    try:
+        conn.execute("DELETE FROM saved_jobs WHERE applicant_id = ? AND job_id = ?", (applicant_id, job_id))
+    finally:
+        conn.close()
+
+# --- Reads ---
+
+def saved_job_ids(applicant_id):
+    conn = _connect()
+    try:
+        rows = conn.execute("SELECT job_id FROM saved_jobs WHERE applicant_id = ?", (applicant_id,)).fetchall()
+    finally:
+        conn.close()
+    return {row["job_id"] for row in rows}
+
+@timed("applicant.load_saved_jobs")
+def load_saved_jobs(applicant_id):
+    # [(job_id, job dict or None)] newest first; None means the posting was
+    # deleted or archived since it was saved.
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            "SELECT job_id FROM saved_jobs WHERE applicant_id = ? ORDER BY saved_at DESC", (applicant_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(row["job_id"], job_store.get_job(row["job_id"])) for row in rows]
@@ -0,0 +1,225 @@
+import re
+import zlib
+import threading
+from collections import OrderedDict
+from metrics import timed
+
+# --- Constants ---
+VECTOR_DIM = 1024                 # hashed character n-gram features per vector
+NGRAM_SIZES = (2, 3, 4)
+SIMILARITY_THRESHOLD = 0.85       # cosine similarity needed for a near-miss spelling to count
+MAX_PHRASE_WORDS = 3              # resume phrases are 1..3 consecutive words
+SEMANTIC_PHRASE_WORDS = 2         # only 1..2 word phrases go through the vector search
+SHORT_SKILL_CHARS = 2             # "R", "Go", "C#": only matched as exact, case-sensitive tokens
+BATCH_SIZE = 256                  # resume phrases scored per matrix product
+RESULT_CACHE_SIZE = 256
+
+# Synonyms and implied skills. A resume mentioning the key also gets every
+# listed skill that exists in the vocabulary.
+SKILL_ALIASES = {
+    "postgres": ["PostgreSQL", "SQL"],
+    "postgresql": ["PostgreSQL", "SQL"],
+    "mysql": ["MySQL", "SQL"],
+    "mssql": ["SQL Server", "SQL"],
+    "sql server": ["SQL Server", "SQL"],
+    "sqlite": ["SQLite", "SQL"],
+    "oracle db": ["Oracle", "SQL"],
+    "golang": ["Go"],
+    "js": ["JavaScript"],
+    "ecmascript": ["JavaScript"],
+    "ts": ["TypeScript"],
+    "nodejs": ["Node.js"],
+    "node js": ["Node.js"],
+    "reactjs": ["React"],
+    "react js": ["React"],
+    "k8s": ["Kubernetes"],
+    "amazon web services": ["AWS"],
+    "gcp": ["Google Cloud"],
+    "ms excel": ["Excel"],
+    "microsoft excel": ["Excel"],
+    "py": ["Python"],
+    "sklearn": ["Scikit-learn", "Machine Learning"],
+    "scikit learn": ["Scikit-learn", "Machine Learning"],
+    "tensorflow": ["TensorFlow", "Machine Learning"],
+    "pytorch": ["PyTorch", "Machine Learning"],
+}
+
+# Skills are matched in three passes against the phrases of a resume:
+#   1. exact phrase lookup (and alias expansion) in a dict,
+#   2. short skills such as "R" or "Go" only as standalone, case-sensitive
+#      tokens, so "go to market" or "R&D" never count,
+#   3. the remaining skills by cosine similarity of TF-IDF weighted character
+#      n-gram vectors, which catches "ReactJS", "Postgre SQL", "Node" etc.
+# Pass 3 is a brute-force nearest-neighbour search over the vocabulary: one
+# float32 matrix product per batch of phrases, CPU only.
+
+_lock = threading.Lock()
+_index = {"key": None}
+_results = OrderedDict()   # (resume_hash, vocabulary key) -> matched skills
+
+# --- Text Normalisation ---
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#.]*")
+_SEGMENT_RE = re.compile(r"[\n,;|•/()\[\]:]+")
+_SENTENCE_RE = re.compile(r"[.!?]+\s+")
+
+def _tokens(text):
+    return [t.rstrip(".") for t in _TOKEN_RE.findall(text) if t.rstrip(".")]
+
+def normalize(skill):
+    return " ".join(_tokens(skill.lower()))
+
+def canonical_skills(items):
+    # Normalised key -> display label for a list of skill strings, with alias
+    # targets added so "Postgres" on a resume meets "PostgreSQL" / "SQL" on a job.
+    keys = {}
+    for item in items:
+        key = normalize(item)
+        if key:
+            keys.setdefault(key, item.strip())
+            for alias in SKILL_ALIASES.get(key, []):
+                keys.setdefault(normalize(alias), alias)
+    return keys
+
+def resume_phrases(text):
+    # Returns (lower-cased phrases, original-case standalone words). A word
+    # only counts as standalone inside a short list item ("Python, R, Go")
+    # or after the first word of a sentence, so "Go to market" and "R&D"
+    # are not read as skills. A period, "!" or "?" followed by whitespace
+    # also ends a segment; the first word of such a sentence never counts
+    # unless it stands alone ("Worked at Acme. R and D").
+    phrases = set()
+    standalone = set()
+    for item in _SEGMENT_RE.split(text):
+        for n, segment in enumerate(_SENTENCE_RE.split(item)):
+            spaced = [w.rstrip(".!?") for w in segment.split()]
+            if len(spaced) == 1 or (n == 0 and len(spaced) <= MAX_PHRASE_WORDS):
+                standalone.update(spaced)
+            else:
+                standalone.update(spaced[1:])
+            lowered = [w.lower() for w in _tokens(segment)]
+            for size in range(1, MAX_PHRASE_WORDS + 1):
+                for i in range(len(lowered) - size + 1):
+                    phrases.add(" ".join(lowered[i:i + size]))
+    return phrases, standalone
+
+# --- Vector Index ---
+
+def _ngram_buckets(phrase):
+    padded = f" {phrase} "
+    return [
+        zlib.crc32(padded[i:i + n].encode("utf-8")) % VECTOR_DIM
+        for n in NGRAM_SIZES
+        for i in range(len(padded) - n + 1)
+    ]
+
+def _vectors(phrases, idf):
+    import numpy as np
+    matrix = np.zeros((len(phrases), VECTOR_DIM), dtype=np.float32)
+    rows, cols = [], []
+    for row, phrase in enumerate(phrases):
+        buckets = _ngram_buckets(phrase)
+        rows.extend([row] * len(buckets))
+        cols.extend(buckets)
+    np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1.0)
+    matrix *= idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+@timed("skills.build_index")
+def build_index(known_skills):
+    import numpy as np
+    keys = [normalize(s) for s in known_skills]
+    by_key = {}
+    for skill, key in zip(known_skills, keys):
+        if key:
+            by_key.setdefault(key, skill)
+    short = {s for s, k in zip(known_skills, keys) if 0 < len(k.replace(" ", "")) <= SHORT_SKILL_CHARS}
+    semantic = [k for k in by_key if by_key[k] not in short]
+
+    # Document frequency of each hashed n-gram across the vocabulary.
+    df = np.zeros(VECTOR_DIM, dtype=np.float32)
+    for key in semantic:
+        df[list(set(_ngram_buckets(key)))] += 1
+    idf = np.log((1 + len(semantic)) / (1 + df)).astype(np.float32) + 1
+
+    return {
+        "by_key": by_key,
+        "short": short,
+        "semantic_keys": semantic,
+        "idf": idf,
+        "matrix": _vectors(semantic, idf) if semantic else np.zeros((0, VECTOR_DIM), dtype=np.float32),
+    }
+
+def _vocabulary_key(known_skills):
+    return (len(known_skills), hash(tuple(known_skills)))
+
+def get_index(known_skills):
+    key = _vocabulary_key(known_skills)
+    with _lock:
+        if _index["key"] == key:
+            return _index
+    index = build_index(known_skills)
+    index["key"] = key
+    with _lock:
+        _index.clear()
+        _index.update(index)
+        _results.clear()
+    return index
+
+# --- Matching ---
+
+def _nearest(index, phrases, matched):
+    import numpy as np
+    candidates = [
+        p for p in phrases
+        if len(p) > SHORT_SKILL_CHARS + 1 and p.count(" ") < SEMANTIC_PHRASE_WORDS
+        and not p.replace(" ", "").isdigit() and p not in index["by_key"]
+    ]
+    if not candidates or not len(index["semantic_keys"]):
+        return
+    matrix = index["matrix"]
+    best = np.zeros(matrix.shape[0], dtype=np.float32)
+    for start in range(0, len(candidates), BATCH_SIZE):
+        queries = _vectors(candidates[start:start + BATCH_SIZE], index["idf"])
+        np.maximum(best, (queries @ matrix.T).max(axis=0), out=best)
+    for i in np.flatnonzero(best >= SIMILARITY_THRESHOLD):
+        matched.add(index["by_key"][index["semantic_keys"][i]])
+
+@timed("resume.extract_skills")
+def match_skills(text, known_skills, resume_hash=None):
+    index = get_index(known_skills)
+    cache_key = (resume_hash, index["key"])
+    if resume_hash:
+        with _lock:
+            if cache_key in _results:
+                _results.move_to_end(cache_key)
+                return list(_results[cache_key])
+
+    phrases, standalone = resume_phrases(text)
+    by_key = index["by_key"]
+    matched = set()
+
+    for phrase in phrases:
+        skill = by_key.get(phrase)
+        if skill is not None and skill not in index["short"]:
+            matched.add(skill)
+        for alias in SKILL_ALIASES.get(phrase, []):
+            skill = by_key.get(normalize(alias))
+            if skill is not None:
+                matched.add(skill)
+
+    for skill in index["short"]:
+        if skill in standalone:
+            matched.add(skill)
+
+    _nearest(index, sorted(phrases), matched)
+
+    found = sorted(matched)
+    if resume_hash:
+        with _lock:
+            _results[cache_key] = found
+            if len(_results) > RESULT_CACHE_SIZE:
+                _results.popitem(last=False)
+    return list(found)
@@ -0,0 +1,49 @@
+import os
+import re
+import uuid
+import streamlit as st
+
+# --- Constants ---
+DEFAULT_COMPANY = "IT Tech SDN BHD"
+
+# The recruiter's company is the tenant key for every recruiter page. It is
+# taken from the session first (set at sign-in), then from config
+# (COMPANY_NAME in secrets.toml or the environment).
+
+def current_company():
+    company = st.session_state.get("company")
+    if company:
+        return company
+    try:
+        company = st.secrets.get("COMPANY_NAME")
+    except Exception:
+        company = None
+    company = company or os.environ.get("COMPANY_NAME") or DEFAULT_COMPANY
+    st.session_state.company = company
+    return company
+
+def current_recruiter():
+    # Interviews are booked per recruiter; the sender mailbox identifies them.
+    recruiter = st.session_state.get("recruiter")
+    if recruiter:
+        return recruiter
+    try:
+        recruiter = st.secrets.get("SENDER_EMAIL_ADDRESS")
+    except Exception:
+        recruiter = None
+    recruiter = recruiter or os.environ.get("RECRUITER_EMAIL") or "recruiter"
+    st.session_state.recruiter = recruiter
+    return recruiter
+
+def current_applicant():
+    # Applicants don't sign in: each browser gets an opaque id, kept in the
+    # URL (?applicant=...) so a bookmark or reload keeps their saved jobs.
+    applicant = st.session_state.get("applicant")
+    if applicant:
+        return applicant
+    applicant = st.query_params.get("applicant", "")
+    if not re.fullmatch(r"[0-9a-f]{32}", applicant):
+        applicant = uuid.uuid4().hex
+    st.query_params["applicant"] = applicant
+    st.session_state.applicant = applicant
+    return applicant
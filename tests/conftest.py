@@ -0,0 +1,17 @@
+import os
+import sys
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Every store works on paths relative to the working directory, so each
+# test runs in its own empty directory. skills.json and the email templates
+# are read from there too.
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.symlink(os.path.join(REPO_ROOT, "skills.json"), tmp_path / "skills.json")
+    os.symlink(os.path.join(REPO_ROOT, "templates"), tmp_path / "templates")
+    return tmp_path
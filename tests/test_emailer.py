@@ -0,0 +1,20 @@
+import emailer
+import interview_scheduler
+
+BOOKING = {
+    "booking_id": "b-1", "start": "2099-03-02 10:00:00", "end": "2099-03-02 10:30:00",
+    "recruiter": "hr@example.com", "name": "Siti Rahman", "email": "siti@example.com", "job_title": "Data Engineer",
+}
+
+
+def _calendar_part(attachment):
+    msg = emailer.build_message("siti@example.com", "Interview", "Hello", "hr@example.com", [attachment])
+    return next(part for part in msg.walk() if part.get_content_type() == "text/calendar")
+
+
+def test_invite_is_sent_as_request():
+    assert _calendar_part(interview_scheduler.ics_attachment(BOOKING)).get_param("method") == "REQUEST"
+
+
+def test_cancellation_is_sent_as_cancel():
+    assert _calendar_part(interview_scheduler.ics_cancellation(BOOKING)).get_param("method") == "CANCEL"
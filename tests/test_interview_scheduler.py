@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+import interview_scheduler
+
+RECRUITER = "hr@example.com"
+MONDAY = datetime(2099, 3, 2)
+
+
+def _application(name):
+    return {"application_id": str(uuid.uuid4()), "name": name, "email": f"{name.lower()}@example.com"}
+
+
+def _active(company):
+    return [(b["name"], b["start"][11:16]) for b in interview_scheduler.list_bookings(company)]
+
+
+def test_revert_reinstates_the_replaced_booking():
+    company = f"Scheduler Co {uuid.uuid4().hex[:8]}"
+    siti = _application("Siti")
+    interview_scheduler.book(company, RECRUITER, siti, MONDAY.replace(hour=10))
+    moved = interview_scheduler.book(company, RECRUITER, siti, MONDAY.replace(hour=11))
+
+    assert interview_scheduler.revert(moved) == []
+    assert _active(company) == [("Siti", "10:00")]
+
+
+def test_revert_keeps_a_slot_booked_since():
+    company = f"Scheduler Co {uuid.uuid4().hex[:8]}"
+    siti = _application("Siti")
+    interview_scheduler.book(company, RECRUITER, siti, MONDAY.replace(hour=10))
+    moved = interview_scheduler.book(company, RECRUITER, siti, MONDAY.replace(hour=11))
+    interview_scheduler.book(company, RECRUITER, _application("Arjun"), MONDAY.replace(hour=10))
+
+    lost = interview_scheduler.revert(moved)
+
+    assert [b["booking_id"] for b in lost] == [b["booking_id"] for b in moved["replaced"]]
+    assert _active(company) == [("Arjun", "10:00")]
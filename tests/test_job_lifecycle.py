@@ -0,0 +1,50 @@
+import uuid
+from streamlit.testing.v1 import AppTest
+import application_store
+import job_lifecycle
+import job_store
+import recommender
+
+
+def _company():
+    return f"Lifecycle Co {uuid.uuid4().hex[:8]}"
+
+
+def _post(company, deadline, requirements="Python; SQL"):
+    return job_store.add_job({"title": "Data Engineer", "company": company, "deadline": deadline,
+                              "requirements": requirements})
+
+
+def _apply(company, job_id, email, saved=False):
+    return application_store.append_application({
+        "name": "Siti Rahman", "email": email, "skills": "Python, SQL", "status": "Applied",
+        "saved": saved, "company": company, "job_id": job_id, "job_title": "Data Engineer",
+    })
+
+
+def test_expired_candidate_is_still_suggested():
+    company = _company()
+    expired = _post(company, "2020-01-31")
+    _apply(company, expired, "siti@example.com")
+    live = _post(company, "2099-12-31")
+    assert [c["email"] for c in recommender.suggest_candidates(company, live)] == ["siti@example.com"]
+
+    assert job_lifecycle.expire_jobs() == 1
+    assert application_store.application_table(company).empty
+
+    assert [c["email"] for c in recommender.suggest_candidates(company, live)] == ["siti@example.com"]
+
+
+def test_saved_applicant_survives_expiry():
+    company = _company()
+    expired = _post(company, "2020-01-31")
+    _apply(company, expired, "saved@example.com", saved=True)
+    _apply(company, expired, "other@example.com")
+
+    assert job_lifecycle.expire_jobs() == 1
+
+    at = AppTest.from_string("import view_saved_applicant\nview_saved_applicant.show_saved_applicants()")
+    at.session_state["company"] = company
+    at.run()
+    assert not at.exception
+    assert [e.label for e in at.expander] == ["Siti Rahman (saved@example.com)"]
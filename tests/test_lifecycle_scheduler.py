@@ -0,0 +1,20 @@
+import os
+import pytest
+import job_lifecycle
+import lifecycle_scheduler
+
+
+def test_failed_run_is_retried(monkeypatch):
+    def fail(today=None):
+        raise OSError("disk full")
+    monkeypatch.setattr(job_lifecycle, "expire_jobs", fail)
+    with pytest.raises(OSError):
+        lifecycle_scheduler.run_if_due(interval=3600)
+    assert not os.path.exists(lifecycle_scheduler.LAST_RUN_FILE)
+
+    monkeypatch.setattr(job_lifecycle, "expire_jobs", lambda today=None: 2)
+    assert lifecycle_scheduler.run_if_due(interval=3600) == 2
+    assert os.path.exists(lifecycle_scheduler.LAST_RUN_FILE)
+
+    monkeypatch.setattr(job_lifecycle, "expire_jobs", fail)
+    assert lifecycle_scheduler.run_if_due(interval=3600) == 0   # not due again yet
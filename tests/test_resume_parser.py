@@ -0,0 +1,27 @@
+import resume_parser
+import resume_sections
+
+RESUME = """Siti Rahman
+siti@example.com
++60 12-345 6789
+EDUCATION
+Sekolah Menengah Kebangsaan Damansara, 2015 - 2019
+EXPERIENCE
+Data Analyst at Acme Sdn Bhd, from May 2021 to Present
+PROJECTS
+Thesis support tool for a Master of Science cohort
+"""
+
+
+def _parse(monkeypatch, text):
+    monkeypatch.setattr(resume_parser, "extract_lines", lambda pdf_path: resume_sections.text_lines(text))
+    return resume_parser.parse_resume("resume.pdf")
+
+
+def test_degree_outside_education_section_is_ignored(monkeypatch):
+    assert _parse(monkeypatch, RESUME)["education_level"] == "Not found"
+
+
+def test_resume_without_education_section_reads_whole_text(monkeypatch):
+    text = RESUME.replace("EDUCATION\nSekolah Menengah Kebangsaan Damansara, 2015 - 2019\n", "")
+    assert _parse(monkeypatch, text)["education_level"] == "Master's"
@@ -0,0 +1,18 @@
+import pytest
+import skill_matcher
+
+SKILLS = ["Python", "SQL", "R", "Go", "C", "Marketing"]
+
+
+@pytest.mark.parametrize("text, skill", [
+    ("Managed the team. Go to market", "Go"),
+    ("Worked at Acme. R and D", "R"),
+    ("Plan A. C level", "C"),
+])
+def test_sentence_start_is_not_a_short_skill(text, skill):
+    assert skill not in skill_matcher.match_skills(text, SKILLS)
+
+
+def test_short_skills_in_a_list_still_match():
+    found = skill_matcher.match_skills("Skills: Python, R, Go. Also C", SKILLS)
+    assert {"Python", "R", "Go", "C"} <= set(found)
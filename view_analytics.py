@@ -0,0 +1,113 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+import application_status
+from application_status import Status
+from metrics import timed
+from tenancy import current_company
+
+# --- Constants ---
+PERIODS = {"Last 30 days": 30, "Last 90 days": 90, "Last 12 months": 365, "All time": None}
+STAGES = list(Status)
+
+# The page only reads the pre-aggregated counter rows of the selected
+# period (jobs x statuses x days at most) and rolls them up with NumPy.
+
+# --- Rollups ---
+
+def rollup(rows, start, days):
+    # Returns per-day and per-job (count, timed count, hours) matrices with
+    # one column per status.
+    column = {status.value: i for i, status in enumerate(STAGES)}
+    status_idx = np.array([column[r["status"]] for r in rows], dtype=np.int64)
+    day_idx = (np.array([r["day"] for r in rows], dtype="datetime64[D]") - np.datetime64(start, "D")).astype(np.int64)
+    job_ids, job_idx = np.unique(np.array([r["job_id"] for r in rows], dtype=object).astype(str), return_inverse=True)
+    n = np.array([r["n"] for r in rows], dtype=np.int64)
+    timed_n = np.array([r["timed"] for r in rows], dtype=np.int64)
+    hours = np.array([r["hours"] for r in rows], dtype=np.float64)
+
+    daily = np.zeros((days, len(STAGES)), dtype=np.int64)
+    np.add.at(daily, (day_idx, status_idx), n)
+    per_job = {name: np.zeros((len(job_ids), len(STAGES)), dtype=dtype)
+               for name, dtype in (("n", np.int64), ("timed", np.int64), ("hours", np.float64))}
+    np.add.at(per_job["n"], (job_idx, status_idx), n)
+    np.add.at(per_job["timed"], (job_idx, status_idx), timed_n)
+    np.add.at(per_job["hours"], (job_idx, status_idx), hours)
+
+    titles = {}
+    for r in rows:
+        titles[r["job_id"]] = r["job_title"] or titles.get(r["job_id"]) or r["job_id"] or "Unknown job"
+    return daily, job_ids, [titles[j] for j in job_ids], per_job
+
+def _rate(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.full(np.shape(numerator), np.nan), where=np.asarray(denominator) > 0)
+
+def _avg_days(hours, counts):
+    return _rate(hours, counts) / 24
+
+# --- Page ---
+
+@timed("page.analytics")
+def show_analytics():
+    st.title("📊 Recruitment Analytics")
+
+    company_name = current_company()
+    period = st.selectbox("Period", list(PERIODS), key="analytics_period")
+    end = date.today()
+    start = end - timedelta(days=(PERIODS[period] or 1) - 1)
+    rows = application_status.load_counters(company_name, start.isoformat() if PERIODS[period] else "", end.isoformat())
+
+    if not rows:
+        st.info("No application activity in this period.")
+        return
+    if PERIODS[period] is None:
+        start = min(date.fromisoformat(r["day"]) for r in rows)
+    days = (end - start).days + 1
+
+    daily, job_ids, titles, per_job = rollup(rows, start, days)
+    totals = {name: matrix.sum(axis=0) for name, matrix in per_job.items()}
+    applied, invited, offered, rejected = (totals["n"][STAGES.index(s)] for s in STAGES)
+    invite_col, offer_col = STAGES.index(Status.INTERVIEW_INVITED), STAGES.index(Status.OFFER_SENT)
+
+    # Funnel
+    cols = st.columns(4)
+    cols[0].metric("Applications", int(applied))
+    cols[1].metric("Interviews", int(invited), f"{float(_rate(invited, applied)):.0%} of applied" if applied else None,
+                   delta_color="off")
+    cols[2].metric("Offers", int(offered), f"{float(_rate(offered, invited)):.0%} of interviewed" if invited else None,
+                   delta_color="off")
+    cols[3].metric("Rejected", int(rejected))
+
+    to_interview = _avg_days(totals["hours"][invite_col], totals["timed"][invite_col])
+    to_offer = _avg_days(totals["hours"][offer_col], totals["timed"][offer_col])
+    cols = st.columns(2)
+    cols[0].metric("Avg. time to interview", "N/A" if np.isnan(to_interview) else f"{to_interview:.1f} days")
+    cols[1].metric("Avg. time to offer", "N/A" if np.isnan(to_offer) else f"{to_offer:.1f} days")
+
+    # Activity over time
+    st.subheader("Daily Activity")
+    st.line_chart(pd.DataFrame(
+        daily, columns=[s.value for s in STAGES],
+        index=pd.date_range(start, periods=days, freq="D")
+    ))
+
+    # Per job
+    st.subheader("By Job")
+    n = per_job["n"]
+    st.dataframe(pd.DataFrame({
+        "Job": titles,
+        "Applied": n[:, 0],
+        "Interviewed": n[:, invite_col],
+        "Offered": n[:, offer_col],
+        "Rejected": n[:, STAGES.index(Status.REJECTED)],
+        "Interview rate": _rate(n[:, invite_col], n[:, 0]),
+        "Offer rate": _rate(n[:, offer_col], n[:, invite_col]),
+        "Avg. days to interview": _avg_days(per_job["hours"][:, invite_col], per_job["timed"][:, invite_col]).round(1),
+    }).sort_values("Applied", ascending=False), hide_index=True, column_config={
+        "Interview rate": st.column_config.NumberColumn(format="percent"),
+        "Offer rate": st.column_config.NumberColumn(format="percent"),
+    })
+
+if __name__ == "__main__":
+    show_analytics()
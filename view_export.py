@@ -0,0 +1,77 @@
+import streamlit as st
+import application_export
+import application_store
+from application_export import FORMATS
+from application_status import Status
+from metrics import timed
+from tenancy import current_company
+
+# Exports are streamed: with EXPORT_PORT set the link points at the export
+# server, which sends the file in chunks as it is encoded. Without it the
+# export is streamed into a file under parsed_data/exports/ and offered
+# through st.download_button, which holds that file in memory while the
+# page shows it.
+
+def _expired():
+    # The link outlived EXPORT_TTL; the filters have to be submitted again.
+    st.session_state.pop("export", None)
+    st.warning("This export has expired. Please prepare it again.")
+
+@timed("page.export")
+def show_export():
+    st.title("📤 Export Applicants")
+
+    company_name = current_company()
+    df = application_store.application_table(company_name)
+    if df.empty:
+        st.info(f"No applicants found for {company_name}.")
+        return
+
+    jobs = df[["job_id", "job_title"]].drop_duplicates().dropna(subset=["job_id"])
+    job_labels = {"": "All jobs"}
+    job_labels.update({row.job_id: f"{row.job_title} ({row.job_id[:8]})" for row in jobs.itertuples()})
+
+    with st.form("export_filters"):
+        statuses = st.multiselect("Status", [s.value for s in Status], key="export_statuses")
+        job_id = st.selectbox("Job", list(job_labels), format_func=job_labels.get, key="export_job")
+        col1, col2 = st.columns(2)
+        since = col1.date_input("Applied from", value=None, key="export_since")
+        until = col2.date_input("Applied until", value=None, key="export_until")
+        search = st.text_input("Name or email contains", key="export_search")
+        fmt = st.radio("Format", list(FORMATS), format_func=lambda f: FORMATS[f][0], horizontal=True, key="export_format")
+        submitted = st.form_submit_button("📦 Prepare Export")
+
+    if submitted:
+        filters = {"statuses": statuses, "job_id": job_id, "since": since, "until": until, "search": search.strip()}
+        count = application_export.count_matches(company_name, filters)
+        if not count:
+            st.session_state.pop("export", None)
+            st.warning("No applicants match these filters.")
+            return
+        token = application_export.create_export(company_name, fmt, filters)
+        st.session_state.export = {"token": token, "format": fmt, "count": count}
+
+    export = st.session_state.get("export")
+    if not export:
+        return
+
+    if application_export.get_export(export["token"]) is None:
+        _expired()
+        return
+
+    label = f"⬇️ Download {export['count']:,} applicants ({FORMATS[export['format']][0]})"
+    if application_export.EXPORT_PORT:
+        application_export.start_server()
+        st.link_button(label, application_export.export_url(export["token"]))
+        st.caption(f"The link is valid for {application_export.EXPORT_TTL // 60} minutes.")
+    else:
+        path = application_export.save_export(export["token"])
+        if path is None:   # expired since the check above
+            _expired()
+            return
+        with open(path, "rb") as f:
+            st.download_button(label, data=f, mime=FORMATS[export["format"]][2],
+                               file_name=application_export.export_filename(company_name, export["format"]))
+
+if __name__ == "__main__":
+    show_export()
@@ -1,54 +1,89 @@
 import streamlit as st
-import pandas as pd
-import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-
-# Email sending function
-def send_email(to_email, subject, body, smtp_server, smtp_port, sender_email, sender_password):
-    msg = MIMEMultipart()
-    msg["From"] = sender_email
-    msg["To"] = to_email
-    msg["Subject"] = subject
-    msg.attach(MIMEText(body, "plain"))
+from datetime import datetime, timedelta
+import application_store
+import application_status
+import interview_scheduler
+import email_templates
+from emailer import send_email
+from application_status import Status
+from metrics import timed
+from tenancy import current_company, current_recruiter
+
+
+def show_upcoming_interviews(company_name):
+    st.subheader("🗓️ Upcoming Interviews")
+    col1, col2 = st.columns(2)
+    first_day = col1.date_input("From", key="calendar_from")
+    days = col2.selectbox("Days", [1, 7, 14, 30], index=1, key="calendar_days")
+    start = datetime.combine(first_day, datetime.min.time())
+    bookings = interview_scheduler.list_bookings(company_name, start=start, end=start + timedelta(days=days))
+    if not bookings:
+        st.info("No interviews booked in this period.")
+        return
 
-    with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
-        server.login(sender_email, sender_password)
-        server.send_message(msg)
+    st.dataframe(
+        [{
+            "Date": b["start"][:10], "Start": b["start"][11:16], "End": b["end"][11:16],
+            "Applicant": b["name"], "Email": b["email"], "Position": b["job_title"], "Interviewer": b["recruiter"],
+        } for b in bookings],
+        hide_index=True
+    )
+    st.download_button(
+        "📥 Download calendar (.ics)",
+        interview_scheduler.ics_calendar(bookings),
+        file_name=f"interviews_{first_day}.ics",
+        mime="text/calendar",
+        key="calendar_download"
+    )
+
+def show_history(application_id):
+    for event in application_status.history(application_id):
+        change = f"{event['from_status']} → {event['to_status']}" if event["from_status"] else event["to_status"]
+        st.caption(f"{event['at']} · {change} · {event['actor']}")
+
+def move_application(company_name, row, to_status, template_name):
+    # Validates the status change and notifies the applicant; the change is
+    # only recorded once the email has gone out, as both targets are final.
+    try:
+        application_status.check_transition(row.get("status"), to_status)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return False
+    subject, body = email_templates.render(
+        template_name, company_name, **email_templates.applicant_context(row)
+    )
+    try:
+        send_email(row["email"], subject, body)
+    except Exception as e:
+        st.error(f"Failed to send email: {e}")
+        return False
+    try:
+        application_status.transition(row["application_id"], to_status, current_recruiter())
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return False
+    application_store.update_application(company_name, row["application_id"], status=to_status.value)
+    return True
 
 # Main Streamlit app
+@timed("page.invited_applicants")
 def show_invited_applicants():
     st.title("📅 Applicants Invited for Interview")
 
-    csv_path = "parsed_data/results.csv"
-
-    if not os.path.exists(csv_path):
-        st.warning("No resume data found.")
-        return
-
-    df = pd.read_csv(csv_path)
-
-    if "status" not in df.columns or "interview_date" not in df.columns or "interview_time" not in df.columns:
-        st.warning("Interview invitation data is incomplete.")
-        return
-
-    invited_df = df[df["status"] == "Interview Invited"]
+    company_name = current_company()
+    show_upcoming_interviews(company_name)
+    invited = application_status.list_by_status(company_name, Status.INTERVIEW_INVITED)
 
-    if invited_df.empty:
+    if not invited:
         st.info("No applicants have been invited for interviews yet.")
         return
 
     st.subheader("Invited Applicants")
 
-    # Load email credentials from secrets
-    smtp_server = "smtp.gmail.com",
-    smtp_port = 465,
-    sender_email = st.secrets["SENDER_EMAIL_ADDRESS"],
-    sender_password = st.secrets["SENDER_EMAIL_PASSWORD"]
-
-    for idx, row in invited_df.iterrows():
+    for row in invited:
+        key = row["application_id"]
         with st.expander(f"{row['name']} ({row['email']})"):
+            st.write(f"**Position:** {row.get('job_title') or 'N/A'}")
             st.write(f"**Interview Date:** {row['interview_date']}")
             st.write(f"**Interview Time:** {row['interview_time']}")
 
@@ -56,44 +91,18 @@ def show_invited_applicants():
 
             # Send Offer
             with col1:
-                if st.button("✅ Send Offer", key=f"offer_{idx}"):
-                    df.at[idx, "status"] = "Offer Sent"
-                    subject = "🎉 Job Offer from Our Company"
-                    body = f"""Dear {row['name']},
-
-We are pleased to offer you a position at our company. Congratulations!
-
-Please reply to this email with your acceptance.
-
-Best regards,
-Recruitment Team"""
-                    try:
-                        send_email(row['email'], subject, body, smtp_server, smtp_port, sender_email, sender_password)
+                if st.button("✅ Send Offer", key=f"offer_{key}"):
+                    if move_application(company_name, row, Status.OFFER_SENT, "offer"):
                         st.success(f"Offer sent to {row['name']} via email.")
-                    except Exception as e:
-                        st.error(f"Failed to send offer email: {e}")
 
             # Reject Applicant
             with col2:
-                if st.button("❌ Reject Applicant", key=f"reject_{idx}"):
-                    df.at[idx, "status"] = "Rejected"
-                    subject = "Regarding Your Interview with Our Company"
-                    body = f"""Dear {row['name']},
-
-Thank you for interviewing with us. After careful consideration, we regret to inform you that you have not been selected for the position.
-
-We appreciate your time and interest in our company.
-
-Best wishes for your job search,
-Recruitment Team"""
-                    try:
-                        send_email(row['email'], subject, body, smtp_server, smtp_port, sender_email, sender_password)
+                if st.button("❌ Reject Applicant", key=f"reject_{key}"):
+                    if move_application(company_name, row, Status.REJECTED, "interview_rejection"):
                         st.error(f"{row['name']} has been rejected and notified via email.")
-                    except Exception as e:
-                        st.error(f"Failed to send rejection email: {e}")
 
-    # Save updates back to CSV
-    df.to_csv(csv_path, index=False)
+            with st.popover("🕓 History"):
+                show_history(key)
 
 # Run the app
 if __name__ == "__main__":
@@ -1,25 +1,25 @@
 import streamlit as st
 import pandas as pd
-import os
+import application_store
+import job_lifecycle
+from metrics import timed
+from tenancy import current_company
 
+@timed("page.saved_applicants")
 def show_saved_applicants():
     st.title("⭐ Saved Applicants")
 
-    csv_path = "parsed_data/results.csv"
+    company_name = current_company()
+    df = application_store.application_table(company_name)
+    archived = job_lifecycle.archived_application_table(company_name)
 
-    if not os.path.exists(csv_path):
+    if df.empty and archived.empty:
         st.warning("Resume data not found.")
         return
 
-    df = pd.read_csv(csv_path)
-
-    if "saved" not in df.columns:
-        st.warning("No 'saved' status found in data.")
-        return
-
-    # Normalize boolean values
-    df["saved"] = df["saved"].astype(str).str.lower() == "true"
-    saved_df = df[df["saved"] == True]
+    # Applicants stay saved after their job has expired and been archived.
+    saved = [frame[frame["saved"]] for frame in (df, archived)]
+    saved_df = pd.concat([frame for frame in saved if not frame.empty] or saved[:1], ignore_index=True)
 
     if saved_df.empty:
         st.info("No applicants have been saved yet.")
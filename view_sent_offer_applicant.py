@@ -1,37 +1,27 @@
 import streamlit as st
-import pandas as pd
-import os
+import application_status
+from application_status import Status
+from metrics import timed
+from tenancy import current_company
 
+@timed("page.offered_applicants")
 def show_offered_applicants():
     st.title("🎉 Applicants Offered a Position")
 
-    csv_path = "parsed_data/results.csv"
+    offered = application_status.list_by_status(current_company(), Status.OFFER_SENT)
 
-    if not os.path.exists(csv_path):
-        st.warning("Resume data not found.")
-        return
-
-    df = pd.read_csv(csv_path)
-
-    # Check for required column
-    if "status" not in df.columns:
-        st.warning("No status column found in data.")
-        return
-
-    # Filter for offered applicants
-    offered_df = df[df["status"].str.lower() == "offer sent"]
-
-    if offered_df.empty:
+    if not offered:
         st.info("No applicants have been offered positions yet.")
         return
 
-    for i, row in offered_df.iterrows():
+    for row in offered:
         with st.expander(f"{row['name']} ({row['email']})"):
             st.write(f"📧 Email: {row.get('email', 'N/A')}")
-            st.write(f"📞 Phone: {row.get('phone', 'N/A')}")
-            st.write(f"📝 Status: {row.get('status', 'Offered')}")
-            st.write(f"📅 Interview Date: {row.get('interview_date', 'N/A')}")
-            st.write(f"⏰ Interview Time: {row.get('interview_time', 'N/A')}")
+            st.write(f"📞 Phone: {row.get('phone') or 'N/A'}")
+            st.write(f"💼 Position: {row.get('job_title') or 'N/A'}")
+            st.write(f"📝 Status: {row['status']} on {row['updated_at']}")
+            st.write(f"📅 Interview Date: {row.get('interview_date') or 'N/A'}")
+            st.write(f"⏰ Interview Time: {row.get('interview_time') or 'N/A'}")
             st.write("✅ This applicant has been offered the position.")
 
 if __name__ == "__main__":
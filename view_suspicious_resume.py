@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
 import os
+import application_store
+from metrics import timed
+from resume_store import resolve_resume
+from tenancy import current_company
 
-RESULTS_CSV = "parsed_data/results.csv"
-RESUME_FOLDER = "resumes"
 
 def generate_suspicion_summary(row):
     reasons = []
@@ -25,24 +26,17 @@ def generate_suspicion_summary(row):
 
     return "; ".join(reasons) if reasons else "N/A"
 
+@timed("page.suspicious_resumes")
 def view_suspicious_resume():
     st.title("🚩 Suspicious Resume Dashboard")
 
-    if not os.path.exists(RESULTS_CSV):
-        st.warning("No applications found.")
-        return
-
-    df = pd.read_csv(RESULTS_CSV)
+    df = application_store.application_table(current_company())
 
     if df.empty:
         st.info("No application data available.")
         return
 
-    if "suspicion_flag" not in df.columns:
-        st.error("No fraud detection data found. Please run detection first.")
-        return
-
-    suspicious_df = df[df["suspicion_flag"] == True].copy()
+    suspicious_df = df[df["suspicion_flag"]].copy()
 
     if suspicious_df.empty:
         st.success("No suspicious resume found!")
@@ -72,10 +66,11 @@ def view_suspicious_resume():
                 st.markdown(f"**Experience:** {row['experience']}")
 
                 # Show resume viewer
-                resume_path = os.path.join(RESUME_FOLDER, row["filename"])
+                resume_path = resolve_resume(row)
                 if os.path.exists(resume_path):
                     with st.expander("📄 View Resume"):
-                        st.download_button("⬇️ Download Resume", data=open(resume_path, "rb").read(), file_name=row["filename"])
+                        with open(resume_path, "rb") as f:
+                            st.download_button("⬇️ Download Resume", data=f, file_name=row["filename"])
                         st.markdown(f"_File: `{row['filename']}`_")
                         try:
                             st.pdf(resume_path)  # Only works in newer Streamlit versions (>=1.32)